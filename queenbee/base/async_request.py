@@ -0,0 +1,222 @@
+"""Non-blocking counterpart of ``queenbee.base.request`` for asyncio applications.
+
+This module requires aiohttp. Install it with ``pip install queenbee[async]``.
+"""
+import asyncio
+import threading
+from email.message import Message
+from functools import partial
+from io import BytesIO
+from urllib.error import HTTPError, URLError
+from urllib.response import addinfourl
+from typing import BinaryIO, Dict
+
+try:
+    import aiohttp
+except ImportError:
+    raise ImportError(
+        'aiohttp module not installed. Try `pip install queenbee[async]` command.'
+    )
+
+from .request import USER_AGENT_STRING, DEFAULT_TIMEOUT, DEFAULT_RETRIES, \
+    DEFAULT_BACKOFF, RETRY_STATUSES, MAX_REDIRECTS, make_request
+
+# maximum number of simultaneous connections in total and to a single host
+DEFAULT_LIMIT = 32
+DEFAULT_LIMIT_PER_HOST = 8
+
+
+async def _close_on_shutdown(session: 'aiohttp.ClientSession'):
+    """Close an aiohttp session once this generator is finalized
+
+    Event loops finalize their asynchronous generators before they end (ie: in
+    ``asyncio.run``) so a session is closed in its own event loop even if
+    ``AsyncHTTPSession.close`` is not called.
+    """
+    try:
+        yield
+    finally:
+        await session.close()
+
+
+class AsyncHTTPSession:
+    """A pool of keep-alive http connections for asyncio applications
+
+    The session has the same behavior as ``queenbee.base.request.HTTPSession``:
+    connections are reused, failed requests are retried with an exponential backoff
+    and responses are transferred gzip encoded. The number of simultaneous
+    connections is limited so many concurrent fetches share a bounded pool instead
+    of opening a connection each.
+
+    An aiohttp session is created on first use in each event loop the session is used
+    in. It is closed when ``close`` is called or when its event loop shuts down its
+    asynchronous generators.
+
+    Args:
+        timeout (float, optional): timeout in seconds for connecting to a host and
+            for each read. Defaults to DEFAULT_TIMEOUT.
+        retries (int, optional): number of times a failed request is retried.
+            Defaults to DEFAULT_RETRIES.
+        backoff (float, optional): delay in seconds before the first retry. The delay
+            doubles for every following retry. Defaults to DEFAULT_BACKOFF.
+        limit (int, optional): maximum number of simultaneous connections. Defaults
+            to DEFAULT_LIMIT.
+        limit_per_host (int, optional): maximum number of simultaneous connections
+            to a single host. Defaults to DEFAULT_LIMIT_PER_HOST.
+    """
+
+    def __init__(self, timeout: float = DEFAULT_TIMEOUT, retries: int = DEFAULT_RETRIES,
+                 backoff: float = DEFAULT_BACKOFF, limit: int = DEFAULT_LIMIT,
+                 limit_per_host: int = DEFAULT_LIMIT_PER_HOST):
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self._sessions: Dict[asyncio.AbstractEventLoop, tuple] = {}
+        self._lock = threading.Lock()
+
+    async def _get_session(self) -> 'aiohttp.ClientSession':
+        """Get the aiohttp session of the running event loop."""
+        loop = asyncio.get_running_loop()
+
+        with self._lock:
+            session, _ = self._sessions.get(loop, (None, None))
+            ended = [
+                self._sessions.pop(other)
+                for other in list(self._sessions) if other.is_closed()
+            ]
+
+        # event loops usually close their session before ending. This closes the
+        # sessions of the loops that ended without finalizing their generators.
+        for _, closer in ended:
+            await closer.aclose()
+
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit, limit_per_host=self.limit_per_host
+            )
+            timeout = aiohttp.ClientTimeout(
+                sock_connect=self.timeout, sock_read=self.timeout
+            )
+            session = aiohttp.ClientSession(
+                connector=connector, timeout=timeout, auto_decompress=True,
+                trust_env=True
+            )
+            closer = _close_on_shutdown(session)
+            await closer.__anext__()
+            with self._lock:
+                self._sessions[loop] = (session, closer)
+
+        return session
+
+    async def close(self):
+        """Close the connections of the session in every event loop
+
+        The sessions of other running event loops are closed in their own loop.
+        """
+        loop = asyncio.get_running_loop()
+
+        with self._lock:
+            sessions, self._sessions = self._sessions, {}
+
+        for session_loop, (_, closer) in sessions.items():
+            if session_loop is not loop and session_loop.is_running():
+                await asyncio.wrap_future(
+                    asyncio.run_coroutine_threadsafe(closer.aclose(), session_loop)
+                )
+            else:
+                await closer.aclose()
+
+    async def open(self, url: str, headers: Dict[str, str],
+                   sink: BinaryIO = None) -> addinfourl:
+        """Send a GET request and read the whole response
+
+        Args:
+            url (str): an http or https url
+            headers (Dict[str, str]): the request headers
+            sink (BinaryIO, optional): a file to write the body of a successful
+                response to as it is received. The body of the returned response is
+                empty in this case. Defaults to None.
+
+        Raises:
+            HTTPError: the server responded with an error or a 304 (Not Modified)
+                status
+            URLError: the server could not be reached
+
+        Returns:
+            addinfourl: the response with the same interface as ``urlopen`` responses
+        """
+        session = await self._get_session()
+        headers = dict(headers)
+        if sink is None:
+            headers.setdefault('Accept-Encoding', 'gzip')
+
+        attempt = 0
+        while True:
+            try:
+                async with session.get(
+                    url, headers=headers, max_redirects=MAX_REDIRECTS
+                ) as res:
+                    status, reason, res_url = res.status, res.reason, str(res.url)
+                    if sink is not None and 200 <= status < 300:
+                        body = b''
+                        sink.seek(0)
+                        sink.truncate()
+                        async for chunk in res.content.iter_chunked(65536):
+                            sink.write(chunk)
+                    else:
+                        body = await res.read()
+                    res_headers = Message()
+                    for key, value in res.headers.items():
+                        if key.lower() != 'content-encoding':
+                            res_headers[key] = value
+            except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+                if attempt >= self.retries:
+                    raise URLError(error)
+            else:
+                if status not in RETRY_STATUSES or attempt >= self.retries:
+                    break
+
+            await asyncio.sleep(self.backoff * 2 ** attempt)
+            attempt += 1
+
+        if status >= 300:
+            raise HTTPError(res_url, status, reason, res_headers, BytesIO(body))
+
+        return addinfourl(BytesIO(body), res_headers, res_url, status)
+
+
+session = AsyncHTTPSession()
+
+
+async def amake_request(url: str, auth_header: Dict[str, str] = {},
+                        headers: Dict[str, str] = None,
+                        sink: BinaryIO = None) -> addinfourl:
+    """Fetch data from a url to a local file or using the http protocol
+
+    Http requests are sent through the shared asynchronous ``session``. Local files
+    are read in the default executor of the event loop.
+
+    Args:
+        url (str): a url string to a local file or an http resource on a server
+        auth_header (str, optional): an authorization header to use when making the request. Defaults to ''.
+        headers (Dict[str, str], optional): extra headers to add to the request (eg: If-None-Match). Defaults to None.
+        sink (BinaryIO, optional): a file to write the body of an http response to as it is received. Defaults to None.
+
+    Returns:
+        addinfourl: the response with the same interface as ``make_request`` responses
+    """
+    if not url.startswith(('http://', 'https://')):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, partial(make_request, url, auth_header=auth_header, headers=headers)
+        )
+
+    headers = dict(headers or {})
+    headers.update(auth_header or {})
+    headers.update({
+        'User-Agent': USER_AGENT_STRING
+    })
+
+    return await session.open(url, headers, sink=sink)
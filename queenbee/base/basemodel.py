@@ -1,11 +1,18 @@
 """Queenbee utility functions."""
 import hashlib
+import itertools
 import json
-from typing import List, Dict
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from enum import Enum
+from typing import Any, Callable, List, Dict
 
 import yaml
 from pydantic import BaseModel as PydanticBaseModel
-from pydantic import validator, Field, constr, Extra
+from pydantic import validator, Field, constr, Extra, PrivateAttr
+from pydantic.datetime_parse import parse_datetime
+from pydantic.fields import ModelField, SHAPE_LIST, SHAPE_SINGLETON
 
 from .parser import parse_file
 from .variable import get_ref_variable
@@ -23,6 +30,163 @@ def _keep_name_order_in_yaml():
 _keep_name_order_in_yaml()
 
 
+_JSON_TYPES = (str, int, float, bool, type(None))
+
+
+def _jsonable_key(key: Any) -> str:
+    if type(key) is str:
+        return key
+    if isinstance(key, Enum):
+        key = key.value
+    if isinstance(key, str):
+        return str.__str__(key)
+    return json.dumps(key)
+
+
+def _jsonable(value: Any, encoder: Callable[[Any], Any]) -> Any:
+    """Convert the output of a model ``dict()`` to JSON compatible python objects
+
+    The result is the same as dumping the value to JSON with the model encoder and
+    loading it back without building the intermediate JSON string.
+
+    Arguments:
+        value {Any} -- A value from a model dictionary
+        encoder {Callable[[Any], Any]} -- The model json encoder used for values
+            that are not JSON types (ie: datetime)
+
+    Returns:
+        Any -- A JSON compatible value
+    """
+    value_type = type(value)
+
+    if value_type in _JSON_TYPES:
+        return value
+
+    if value_type is dict:
+        return {
+            _jsonable_key(key):
+                item if type(item) in _JSON_TYPES else _jsonable(item, encoder)
+            for key, item in value.items()
+        }
+
+    if value_type is list:
+        return [
+            item if type(item) in _JSON_TYPES else _jsonable(item, encoder)
+            for item in value
+        ]
+
+    if isinstance(value, Enum):
+        return _jsonable(value.value, encoder)
+
+    if isinstance(value, str):
+        return str.__str__(value)
+
+    # bool is checked before int as it is a subclass of int
+    for json_type in (bool, int, float):
+        if isinstance(value, json_type):
+            return json_type(value)
+
+    if isinstance(value, (dict, list, tuple, set, frozenset)):
+        if isinstance(value, dict):
+            return _jsonable(dict(value), encoder)
+        return _jsonable(list(value), encoder)
+
+    return _jsonable(encoder(value), encoder)
+
+
+def _trusted_value(field: ModelField, value: Any) -> Any:
+    """Convert a JSON value of a trusted model dictionary to the type of its field
+
+    Nested models are created with ``construct`` and the members of a union of models
+    are picked using their ``type`` field. Other values are kept as is except for
+    enums and datetimes.
+
+    Arguments:
+        field {ModelField} -- The model field of the value
+        value {Any} -- A JSON value
+
+    Raises:
+        ValueError: The value does not match any member of a union of models
+
+    Returns:
+        Any -- The value of the field
+    """
+    if value is None:
+        return value
+
+    if field.shape == SHAPE_LIST:
+        item_field = field.sub_fields[0]
+        return [_trusted_value(item_field, item) for item in value]
+
+    if field.shape != SHAPE_SINGLETON:
+        if field.key_field is None or not isinstance(value, dict):
+            return value
+        item_field = field.sub_fields[0]
+        return {key: _trusted_value(item_field, item) for key, item in value.items()}
+
+    if field.sub_fields:
+        models = [
+            sub_field for sub_field in field.sub_fields
+            if isinstance(sub_field.type_, type)
+            and issubclass(sub_field.type_, PydanticBaseModel)
+        ]
+        if not models or not isinstance(value, dict):
+            return value
+        for sub_field in models:
+            type_field = sub_field.type_.__fields__.get('type')
+            if type_field is not None and type_field.default == value.get('type'):
+                return _trusted_value(sub_field, value)
+        raise ValueError(f'Unknown type for {field.name}: {value.get("type")}')
+
+    type_ = field.type_
+
+    if not isinstance(type_, type):
+        return value
+
+    if issubclass(type_, BaseModelNoType) and isinstance(value, dict):
+        return type_.from_trusted(value)
+
+    if issubclass(type_, Enum):
+        return type_(value)
+
+    if issubclass(type_, datetime):
+        return parse_datetime(value)
+
+    return value
+
+
+# digests are only cached while a digest scope is open. The scope id changes every
+# time the outermost scope is entered so digests cached in a previous scope are
+# never reused.
+_scope_lock = threading.Lock()
+_scope_ids = itertools.count(1)
+_scope_id = None
+_scope_depth = 0
+
+
+@contextmanager
+def digest_scope():
+    """Cache the digest of the models hashed until the scope is closed
+
+    Scopes can be nested and are shared by all threads. Models hashed in the scope
+    must not be modified until the outermost scope is closed.
+    """
+    global _scope_id, _scope_depth
+
+    with _scope_lock:
+        if _scope_depth == 0:
+            _scope_id = next(_scope_ids)
+        _scope_depth += 1
+
+    try:
+        yield
+    finally:
+        with _scope_lock:
+            _scope_depth -= 1
+            if _scope_depth == 0:
+                _scope_id = None
+
+
 class BaseModelNoType(PydanticBaseModel):
     """BaseModel with functionality to return the object as a yaml string.
 
@@ -30,6 +194,74 @@ class BaseModelNoType(PydanticBaseModel):
     extensions.
     """
 
+    _digest: tuple = PrivateAttr(None)
+
+    @classmethod
+    def construct(cls, _fields_set=None, **values):
+        """Create a model from trusted or pre-validated data without validating it
+
+        Unlike ``pydantic.BaseModel.construct`` in the pinned pydantic version, the
+        fields are set in their declaration order whether they are given or use their
+        default value so the model serializes and hashes like a validated one.
+
+        Keyword Arguments:
+            _fields_set {Set[str]} -- The names of the fields to mark as set. Defaults
+                to the names of the given values (default: {None})
+
+        Returns:
+            cls -- An instance of the pydantic class
+        """
+        if _fields_set is None:
+            _fields_set = set(values.keys())
+
+        fields_values = {}
+        for name, field in cls.__fields__.items():
+            if name in values:
+                fields_values[name] = values.pop(name)
+            elif field.alias in values:
+                fields_values[name] = values.pop(field.alias)
+            elif not field.required:
+                fields_values[name] = field.get_default()
+        fields_values.update(values)
+
+        model = cls.__new__(cls)
+        object.__setattr__(model, '__dict__', fields_values)
+        object.__setattr__(model, '__fields_set__', _fields_set)
+        model._init_private_attributes()
+        return model
+
+    @classmethod
+    def from_trusted(cls, data: Dict) -> 'BaseModelNoType':
+        """Create a model from trusted data without validating it
+
+        This is much faster than ``parse_obj`` and should only be used for data that
+        was generated by Queenbee from a validated model (ie: a cache entry). Nested
+        models are created the same way.
+
+        Arguments:
+            data {Dict} -- A model dictionary as returned by ``to_dict``
+
+        Raises:
+            ValueError: A nested model does not match any type of its field
+
+        Returns:
+            cls -- An instance of the pydantic class
+        """
+        values = {}
+
+        for name, field in cls.__fields__.items():
+            if field.alias in data:
+                values[name] = _trusted_value(field, data[field.alias])
+            elif name in data:
+                values[name] = _trusted_value(field, data[name])
+
+        return cls.construct(**values)
+
+    def copy(self, **kwargs):
+        copied = super(BaseModelNoType, self).copy(**kwargs)
+        object.__setattr__(copied, '_digest', None)
+        return copied
+
     def yaml(self, exclude_unset=False, **kwargs):
         """Get a YAML string from the model
 
@@ -41,8 +273,7 @@ class BaseModelNoType(PydanticBaseModel):
             str -- A yaml string representing the model
         """
         return yaml.dump(
-            json.loads(self.json(by_alias=True,
-                                 exclude_unset=exclude_unset, **kwargs)),
+            self.to_dict(exclude_unset=exclude_unset, **kwargs),
             default_flow_style=False
         )
 
@@ -58,7 +289,10 @@ class BaseModelNoType(PydanticBaseModel):
         Returns:
             dict -- A python dictionary representing the model
         """
-        return json.loads(self.json(by_alias=by_alias, exclude_unset=exclude_unset, **kwargs))
+        return _jsonable(
+            self.dict(by_alias=by_alias, exclude_unset=exclude_unset, **kwargs),
+            self.__json_encoder__
+        )
 
     def to_json(self, filepath, indent=None, **kwargs):
         """Write a JSON file of the model
@@ -104,17 +338,44 @@ class BaseModelNoType(PydanticBaseModel):
     def __repr__(self):
         return self.yaml()
 
-    @property
-    def __hash__(self):
+    def hash_digest(self, cached: bool = True) -> str:
         """Return a model hash
 
+        The digest is computed from the current content of the model unless it was
+        already computed in the open ``digest_scope``.
+
+        Keyword Arguments:
+            cached {bool} -- Reuse the digest computed in the open ``digest_scope``
+                (default: {True})
+
         Returns:
             str -- A hash/digest of the model
         """
-        return hashlib.sha256(
+        scope_id = _scope_id
+        previous = getattr(self, '_digest', None)
+
+        if cached and scope_id is not None and previous is not None \
+                and previous[0] == scope_id:
+            return previous[1]
+
+        digest = hashlib.sha256(
             self.json(by_alias=True, exclude_unset=False).encode('utf-8')
         ).hexdigest()
 
+        if scope_id is not None:
+            object.__setattr__(self, '_digest', (scope_id, digest))
+
+        return digest
+
+    @property
+    def __hash__(self):
+        """Return a model hash
+
+        Returns:
+            str -- A hash/digest of the model
+        """
+        return self.hash_digest()
+
     def _referenced_values(self, var_names: List[str]) -> Dict[str, List[str]]:
         """Get all referenced values specified by var name
 
@@ -0,0 +1,171 @@
+"""Queenbee local file cache.
+
+Cached files live under ``~/.queenbee/cache`` by default. Use the
+``QUEENBEE_CACHE_FOLDER`` environment variable to change this location.
+
+Each cache is a folder of files named after their key (usually a sha256 digest). The
+modification time of every entry is refreshed when it is read so the least recently
+used entries can be evicted once the folder grows over its maximum size.
+"""
+import os
+import tempfile
+from pathlib import Path
+from typing import BinaryIO, List, Tuple
+
+DEFAULT_CACHE_FOLDER = os.environ.get(
+    'QUEENBEE_CACHE_FOLDER', os.path.join(Path.home(), '.queenbee', 'cache')
+)
+
+# 512 MB
+DEFAULT_MAX_SIZE = 512 * 1024 ** 2
+
+
+class FileCache:
+    """A folder of content addressed files with size based LRU eviction.
+
+    Arguments:
+        folder {str} -- Path to the cache folder
+
+    Keyword Arguments:
+        extension {str} -- File extension used for the cache entries (default: {''})
+        max_size {int} -- Maximum size of the cache folder in bytes. The least
+            recently used entries are removed when this size is exceeded
+            (default: {DEFAULT_MAX_SIZE})
+    """
+
+    def __init__(self, folder: str, extension: str = '',
+                 max_size: int = DEFAULT_MAX_SIZE):
+        self.folder = folder
+        self.extension = extension
+        self.max_size = max_size
+
+    def path(self, key: str) -> str:
+        """Get the path to the file of a cache entry
+
+        Arguments:
+            key {str} -- The cache entry key
+
+        Returns:
+            str -- Path to the cache entry file
+        """
+        return os.path.join(self.folder, f'{key}{self.extension}')
+
+    def get(self, key: str) -> bytes:
+        """Read a cache entry and mark it as recently used
+
+        Arguments:
+            key {str} -- The cache entry key
+
+        Returns:
+            bytes -- The content of the entry (or None if it is not cached)
+        """
+        path = self.path(key)
+
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path)
+        except OSError:
+            return None
+
+        return data
+
+    def set(self, key: str, data: bytes):
+        """Write a cache entry
+
+        The file is written to a temporary file first and then moved in place so
+        concurrent readers never see a partially written entry.
+
+        Arguments:
+            key {str} -- The cache entry key
+            data {bytes} -- The content of the entry
+        """
+        f, temp_path = self.temp_file()
+        try:
+            with f:
+                f.write(data)
+            self.add_file(key, temp_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def temp_file(self) -> Tuple[BinaryIO, str]:
+        """Create a temporary file in the cache folder
+
+        Use this to write large entries chunk by chunk and add them to the cache with
+        ``add_file`` once they are complete. Temporary files are not cache entries.
+
+        Returns:
+            BinaryIO -- The temporary file open for writing
+            str -- The path to the temporary file
+        """
+        os.makedirs(self.folder, exist_ok=True)
+
+        fd, temp_path = tempfile.mkstemp(dir=self.folder, suffix='.tmp')
+
+        return os.fdopen(fd, 'wb'), temp_path
+
+    def add_file(self, key: str, file_path: str):
+        """Move a complete file in place as a cache entry
+
+        Arguments:
+            key {str} -- The cache entry key
+            file_path {str} -- Path to a file created with ``temp_file``
+        """
+        os.replace(file_path, self.path(key))
+
+        self.prune()
+
+    def remove(self, key: str):
+        """Remove a cache entry if it exists
+
+        Arguments:
+            key {str} -- The cache entry key
+        """
+        try:
+            os.remove(self.path(key))
+        except OSError:
+            pass
+
+    def entries(self) -> List[os.DirEntry]:
+        """List the cache entries from the least to the most recently used
+
+        Returns:
+            List[os.DirEntry] -- A list of cache entry files
+        """
+        if not os.path.isdir(self.folder):
+            return []
+
+        entries = [
+            entry for entry in os.scandir(self.folder)
+            if entry.is_file() and entry.name.endswith(self.extension)
+            and not entry.name.endswith('.tmp')
+        ]
+
+        entries.sort(key=lambda x: x.stat().st_mtime)
+
+        return entries
+
+    def prune(self):
+        """Evict the least recently used entries until the cache fits in max_size"""
+        entries = self.entries()
+
+        total_size = sum(entry.stat().st_size for entry in entries)
+
+        for entry in entries:
+            if total_size <= self.max_size:
+                break
+            total_size -= entry.stat().st_size
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+
+    def clear(self):
+        """Remove all the entries from the cache"""
+        for entry in self.entries():
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
@@ -3,6 +3,8 @@ import json
 import yaml
 import os
 import re
+from functools import lru_cache
+from typing import Dict, NamedTuple, Tuple, Union
 
 
 def _check_list(lst: list, folder: str):
@@ -82,6 +84,49 @@ def parse_file(input_file: str) -> dict:
         return _import_dict_data(data, folder)
 
 
+class TemplateVariable(NamedTuple):
+    """A variable segment of a template string (eg: ``{{ inputs.name }}``)"""
+    name: str
+    raw: str
+
+
+DOUBLE_QUOTES_VARS_PATTERN = re.compile(
+    r"{{\s*([_a-zA-Z0-9.\-\$#\?]*)\s*}}", flags=re.MULTILINE
+)
+
+DOUBLE_QUOTE_WORKFLOW_VARS_PATTERN = re.compile(
+    r"{{\s*(workflow\.[_a-zA-Z0-9.\-\$#\?]*)\s*}}", flags=re.MULTILINE
+)
+
+
+@lru_cache(maxsize=4096)
+def tokenize_double_quote_vars(text: str) -> Tuple[Union[str, TemplateVariable], ...]:
+    """Split a string into literal and variable segments
+
+    Results are memoized as the same strings are parsed by several validators.
+
+    Arguments:
+        text {str} -- A string with double quoted vars (eg: ``run {{inputs.name}}``)
+
+    Returns:
+        Tuple[Union[str, TemplateVariable], ...] -- The literal strings and template
+            variables of the string in order. Empty literals are omitted.
+    """
+    tokens = []
+    position = 0
+
+    for match in DOUBLE_QUOTES_VARS_PATTERN.finditer(text):
+        if match.start() > position:
+            tokens.append(text[position:match.start()])
+        tokens.append(TemplateVariable(name=match.group(1), raw=match.group(0)))
+        position = match.end()
+
+    if position < len(text):
+        tokens.append(text[position:])
+
+    return tuple(tokens)
+
+
 def parse_double_quotes_vars(input: str) -> list:
     """Parse values between {{ }}
 
@@ -91,9 +136,10 @@ def parse_double_quotes_vars(input: str) -> list:
     Returns:
         list -- A list of matched substrings (empty list if None)
     """
-    pattern = r"{{\s*([_a-zA-Z0-9.\-\$#\?]*)\s*}}"
-    match = re.findall(pattern, input, flags=re.MULTILINE)
-    return match
+    return [
+        token.name for token in tokenize_double_quote_vars(input)
+        if isinstance(token, TemplateVariable)
+    ]
 
 
 def parse_double_quote_workflow_vars(input: str) -> list:
@@ -105,9 +151,25 @@ def parse_double_quote_workflow_vars(input: str) -> list:
     Returns:
         list -- A list of matched substrings (empty list if None)
     """
-    pattern = r"{{\s*(workflow\.[_a-zA-Z0-9.\-\$#\?]*)\s*}}"
-    match = re.findall(pattern, input, flags=re.MULTILINE)
-    return match
+    return DOUBLE_QUOTE_WORKFLOW_VARS_PATTERN.findall(input)
+
+
+def render_double_quote_vars(text: str, values: Dict[str, str]) -> str:
+    """Replace several template keys of a string in a single pass
+
+    Arguments:
+        text {str} -- The string to replace values from
+        values {Dict[str, str]} -- The values to replace each key with. Variables
+            that are not in this dictionary are left as is.
+
+    Returns:
+        str -- A string with replaced substrings
+    """
+    return ''.join(
+        values.get(token.name, token.raw) if isinstance(token, TemplateVariable)
+        else token
+        for token in tokenize_double_quote_vars(text)
+    )
 
 
 def replace_double_quote_vars(text: str, key: str, replace: str) -> str:
@@ -121,5 +183,4 @@ def replace_double_quote_vars(text: str, key: str, replace: str) -> str:
     Returns:
         str -- A string with replaced substrings
     """
-    pattern = r"{{\s*" + key + r"\s*}}"
-    return re.sub(pattern, replace, text)
+    return render_double_quote_vars(text, {key: replace})
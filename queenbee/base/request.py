@@ -1,11 +1,30 @@
 import pathlib
 import os
-from urllib import request
-from typing import Union
+import base64
+import gzip
+import time
+import threading
+from http import client
+from io import BytesIO
+from functools import partial
+from urllib import request, parse
+from urllib.error import HTTPError, URLError
+from urllib.response import addinfourl
+from typing import Union, Dict, List, Tuple, BinaryIO, Callable
 from .basemodel import BaseModel
 
 USER_AGENT_STRING = 'Queenbee'
 
+# use the QUEENBEE_HTTP_TIMEOUT and QUEENBEE_HTTP_RETRIES environment variables to
+# change the timeout (in seconds) and number of retries of http requests
+DEFAULT_TIMEOUT = float(os.environ.get('QUEENBEE_HTTP_TIMEOUT', 30))
+DEFAULT_RETRIES = int(os.environ.get('QUEENBEE_HTTP_RETRIES', 3))
+DEFAULT_BACKOFF = 0.5
+
+RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+REDIRECT_STATUSES = frozenset([301, 302, 303, 307, 308])
+MAX_REDIRECTS = 5
+
 
 def get_uri(url):
     """Resolve uri for urls and local files."""
@@ -36,19 +55,278 @@ def urljoin(*args):
     return url
 
 
-def make_request(url: str, auth_header: Dict[str, str] = {}) -> str:
+class HTTPSession:
+    """A pool of keep-alive http connections
+
+    Connections are kept open after a request and reused for the following requests
+    to the same host so downloading many packages from a repository only pays for
+    the TCP and TLS handshakes once. Failed connections and 429 or 5xx responses are
+    retried with an exponential backoff and responses are transferred gzip encoded
+    when the server supports it.
+
+    The session is thread safe. Each thread borrows its own connection from the pool.
+
+    Requests go through the proxies set in the ``http_proxy``, ``https_proxy`` and
+    ``no_proxy`` environment variables (or the system settings) like ``urlopen``
+    requests. Https requests are tunneled through the proxy.
+
+    Args:
+        timeout (float, optional): timeout in seconds for connecting to a host and
+            for each read. Defaults to DEFAULT_TIMEOUT.
+        retries (int, optional): number of times a failed request is retried.
+            Defaults to DEFAULT_RETRIES.
+        backoff (float, optional): delay in seconds before the first retry. The delay
+            doubles for every following retry. Defaults to DEFAULT_BACKOFF.
+        max_idle (int, optional): maximum number of idle connections kept open per
+            host. Defaults to 4.
+    """
+
+    def __init__(self, timeout: float = DEFAULT_TIMEOUT, retries: int = DEFAULT_RETRIES,
+                 backoff: float = DEFAULT_BACKOFF, max_idle: int = 4):
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_idle = max_idle
+        self._idle: Dict[Tuple[str, str, str], List[client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _proxy(scheme: str, netloc: str) -> Tuple[str, Dict[str, str]]:
+        """Get the proxy of a host and the headers to send to the proxy.
+
+        The proxy is None if the host is not reached through a proxy.
+        """
+        proxy = request.getproxies().get(scheme)
+        if not proxy or request.proxy_bypass(netloc):
+            return None, {}
+
+        if '://' not in proxy:
+            proxy = f'http://{proxy}'
+        parts = parse.urlsplit(proxy)
+
+        headers = {}
+        if parts.username is not None:
+            credentials = f'{parse.unquote(parts.username)}:' \
+                f'{parse.unquote(parts.password or "")}'
+            headers['Proxy-Authorization'] = \
+                f'Basic {base64.b64encode(credentials.encode()).decode("ascii")}'
+
+        return parts.netloc.rpartition('@')[2], headers
+
+    def _connect(self, key: Tuple[str, str, str], proxy_headers: Dict[str, str]) \
+            -> Tuple[client.HTTPConnection, bool]:
+        """Borrow an idle connection to a host or open a new one."""
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop(), True
+
+        scheme, netloc, proxy = key
+        if scheme == 'https':
+            connection = client.HTTPSConnection(proxy or netloc, timeout=self.timeout)
+            if proxy:
+                connection.set_tunnel(netloc, headers=proxy_headers)
+            return connection, False
+        return client.HTTPConnection(proxy or netloc, timeout=self.timeout), False
+
+    def _release(self, key: Tuple[str, str, str], connection: client.HTTPConnection):
+        """Return a connection to the pool."""
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle:
+                idle.append(connection)
+                return
+        connection.close()
+
+    def close(self):
+        """Close all the idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for connection in connections:
+                connection.close()
+
+    def _finish(self, key: Tuple[str, str, str], connection: client.HTTPConnection,
+                res: client.HTTPResponse):
+        """Return the connection of a read response to the pool or close it."""
+        if res.will_close:
+            connection.close()
+        else:
+            self._release(key, connection)
+
+    def _send(self, method: str, url: str, headers: Dict[str, str],
+              stream: bool = False) -> Tuple[int, str, client.HTTPMessage, BinaryIO]:
+        """Send a request and read the response, retrying on failure.
+
+        The body of successful responses is not read if ``stream`` is True.
+        """
+        parts = parse.urlsplit(url)
+        path = parts.path or '/'
+        if parts.query:
+            path = f'{path}?{parts.query}'
+
+        proxy, proxy_headers = self._proxy(parts.scheme, parts.netloc)
+        if proxy is not None and parts.scheme == 'http':
+            # plain http requests are sent to the proxy with their absolute url
+            path = parse.urlunsplit(parts._replace(path=parts.path or '/', fragment=''))
+            headers = dict(headers, **proxy_headers)
+        key = (parts.scheme, parts.netloc, proxy)
+
+        attempt = 0
+        while True:
+            connection, reused = self._connect(key, proxy_headers)
+            try:
+                connection.request(method, path, headers=headers)
+                res = connection.getresponse()
+                if stream and 200 <= res.status < 300:
+                    release = partial(self._finish, key, connection, res)
+                    body = _StreamedBody(res, connection, release)
+                    if res.headers.get('Content-Encoding', '').lower() == 'gzip':
+                        body = _GzipStreamedBody(fileobj=body)
+                        del res.headers['Content-Encoding']
+                    return res.status, res.reason, res.headers, body
+                body = res.read()
+            except (OSError, client.HTTPException) as error:
+                connection.close()
+                if reused:
+                    # the server closed an idle connection. Retry right away with a
+                    # new connection.
+                    continue
+                if attempt >= self.retries:
+                    raise URLError(error)
+            else:
+                self._finish(key, connection, res)
+
+                if res.status not in RETRY_STATUSES or attempt >= self.retries:
+                    if res.headers.get('Content-Encoding', '').lower() == 'gzip':
+                        body = gzip.decompress(body)
+                        del res.headers['Content-Encoding']
+                    return res.status, res.reason, res.headers, BytesIO(body)
+
+            time.sleep(self.backoff * 2 ** attempt)
+            attempt += 1
+
+    def open(self, req: request.Request, stream: bool = False) -> addinfourl:
+        """Open an http or https request
+
+        Redirections are followed and the response body is read before the
+        connection is returned to the pool.
+
+        Args:
+            req (request.Request): an http or https request
+            stream (bool, optional): do not read the body of a successful response.
+                The body is read from the server as the response is read and the
+                connection is returned to the pool once the whole body is read. Use
+                this to download large files. Defaults to False.
+
+        Raises:
+            HTTPError: the server responded with an error or a 304 (Not Modified)
+                status
+            URLError: the server could not be reached
+
+        Returns:
+            addinfourl: the response with the same interface as ``urlopen`` responses
+        """
+        url = req.full_url
+        method = req.get_method()
+        headers = dict(req.header_items())
+        if not stream:
+            headers.setdefault('Accept-Encoding', 'gzip')
+
+        for _ in range(MAX_REDIRECTS + 1):
+            status, reason, res_headers, body = self._send(method, url, headers, stream)
+            location = res_headers.get('Location')
+            if status not in REDIRECT_STATUSES or location is None:
+                break
+            url = parse.urljoin(url, location)
+            if status == 303:
+                method = 'GET'
+        else:
+            reason = 'Too many redirects'
+
+        if status >= 300:
+            raise HTTPError(url, status, reason, res_headers, body)
+
+        return addinfourl(body, res_headers, url, status)
+
+
+class _StreamedBody:
+    """The body of a streamed response
+
+    The connection is returned to the pool once the whole body is read and closed if
+    the response is closed before that.
+    """
+
+    def __init__(self, res: client.HTTPResponse, connection: client.HTTPConnection,
+                 release: Callable[[], None]):
+        self._res = res
+        self._connection = connection
+        self._release = release
+        self.closed = False
+
+    def read(self, amt: int = None) -> bytes:
+        data = self._res.read(amt)
+        if self._release is not None and self._res.isclosed():
+            self._release()
+            self._release = None
+        return data
+
+    def readable(self) -> bool:
+        return True
+
+    def close(self):
+        self.closed = True
+        if self._release is not None:
+            self._release = None
+            self._res.close()
+            self._connection.close()
+
+
+class _GzipStreamedBody(gzip.GzipFile):
+    """A gzip encoded streamed body
+
+    ``GzipFile`` does not close the file it decompresses so the streamed body is
+    closed with it. Otherwise the connection of a response closed before it is fully
+    read would never be released.
+    """
+
+    def close(self):
+        body = self.fileobj
+        try:
+            super(_GzipStreamedBody, self).close()
+        finally:
+            if body is not None:
+                body.close()
+
+
+session = HTTPSession()
+
+
+def make_request(url: str, auth_header: Dict[str, str] = {},
+                 headers: Dict[str, str] = None, stream: bool = False) -> str:
     """Fetch data from a url to a local file or using the http protocol
 
+    Http requests are sent through the shared ``session`` so connections to the same
+    host are reused.
+
     Args:
         url (str): a url string to a local file or an http resource on a server
         auth_header (str, optional): an authorization header to use when making the request. Defaults to ''.
+        headers (Dict[str, str], optional): extra headers to add to the request (eg: If-None-Match). Defaults to None.
+        stream (bool, optional): read the body of an http response from the server as it is read instead of downloading it first. Defaults to False.
 
     Returns:
         str: [description]
     """
-    auth_header.update({
+    headers = dict(headers or {})
+    headers.update(auth_header or {})
+    headers.update({
         'User-Agent': USER_AGENT_STRING
     })
 
     req = request.Request(url=url, headers=headers)
+
+    if req.type in ('http', 'https'):
+        return session.open(req, stream=stream)
+
     return request.urlopen(req)
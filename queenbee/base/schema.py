@@ -0,0 +1,85 @@
+"""Compiled JSON Schema validators for input specifications.
+
+Validating a value with ``jsonschema.validate`` checks the specification against its
+meta-schema and builds a new validator on every call. The validators in this module
+are compiled once per specification and reused for every value validated against it.
+"""
+import json
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List
+
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
+
+
+@lru_cache(maxsize=1024)
+def _compile_validator(spec: str):
+    """Compile a JSON Schema validator from a serialized specification."""
+    schema = json.loads(spec)
+    cls = validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+
+def spec_validator(spec: Dict):
+    """Get the compiled JSON Schema validator of a specification
+
+    The specification is checked against its meta-schema the first time it is
+    compiled. Compiled validators are cached and shared by all the specifications with
+    the same content.
+
+    Arguments:
+        spec {Dict} -- A JSON Schema specification
+
+    Raises:
+        SchemaError -- The specification is not a valid JSON Schema
+
+    Returns:
+        jsonschema.protocols.Validator -- The compiled validator of the specification
+    """
+    return _compile_validator(json.dumps(spec, sort_keys=True, default=str))
+
+
+def validate_value(value: Any, spec: Dict) -> Any:
+    """Validate a value against a JSON Schema specification
+
+    This is a drop-in replacement for ``jsonschema.validate`` which reuses the
+    compiled validator of the specification.
+
+    Arguments:
+        value {Any} -- The value to validate
+        spec {Dict} -- A JSON Schema specification
+
+    Raises:
+        ValidationError -- The value is not valid against the specification
+
+    Returns:
+        Any -- The validated value
+    """
+    return validate_values([value], spec)[0]
+
+
+def validate_values(values: Iterable[Any], spec: Dict) -> List[Any]:
+    """Validate several values against the same JSON Schema specification
+
+    The specification is only compiled once for all the values.
+
+    Arguments:
+        values {Iterable[Any]} -- The values to validate
+        spec {Dict} -- A JSON Schema specification
+
+    Raises:
+        ValidationError -- One of the values is not valid against the specification
+
+    Returns:
+        List[Any] -- The validated values
+    """
+    validator = spec_validator(spec)
+    values = list(values)
+
+    for value in values:
+        error = best_match(validator.iter_errors(value))
+        if error is not None:
+            raise error
+
+    return values
@@ -1,5 +1,4 @@
 import os
-import shutil
 
 from pydantic import ValidationError
 
@@ -34,9 +33,6 @@ def install(path):
         raise error
     os.chdir(path)
 
-    if os.path.exists('.dependencies'):
-        shutil.rmtree('.dependencies')
-
     recipe.lock_dependencies(config=ctx.obj.config)
 
     recipe.write_dependency_file('.')
@@ -17,11 +17,14 @@ except ImportError:
 @click.option('-n', '--new', help='Delete previous index and generate a new one from scratch', default=False, type=bool, is_flag=True)
 @click.option('-f', '--force', help='Overwrite existing package entries is digest hash does not match', default=False, type=bool, is_flag=True)
 @click.option('-s', '--skip', help='Skip any packages that would otherwise be overwritten', default=False, type=bool, is_flag=True)
-def index(path, index_path, new, force, skip):
+@click.option('-j', '--jobs', help='Number of processes used to read the packages', default=1, type=click.IntRange(min=1), show_default=True)
+def index(path, index_path, new, force, skip, jobs):
     """index the repository folder
 
     Use this command to crawl a repository folder and update/regenerate an
-    ``index.json`` file.
+    ``index.json`` file. A ``.index-manifest.json`` file is kept next to the index
+    so packages that did not change since the last run are not unpacked again and a
+    ``search-index.json`` file is written next to it to speed up package searches.
     """
 
     if index_path is None:
@@ -31,11 +34,14 @@ def index(path, index_path, new, force, skip):
 
     try:
         if new:
-            repo_index = RepositoryIndex.from_folder(path)
+            repo_index = RepositoryIndex.from_folder(
+                path, use_index_manifest=True, jobs=jobs)
         else:
             repo_index = RepositoryIndex.parse_file(index_path)
-            repo_index.merge_folder(path, force, skip)
+            repo_index.merge_folder(
+                path, force, skip, use_index_manifest=True, jobs=jobs)
     except ValueError as error:
         raise click.ClickException(error)
 
     repo_index.to_json(index_path, indent=2)
+    repo_index.search_index().to_folder(os.path.dirname(index_path))
@@ -25,6 +25,6 @@ def init(path):
 
     index = RepositoryIndex.from_folder(path)
 
-    index.to_json(os.path.join(path, 'index.json'), indent=2)
+    index.to_folder(path, indent=2)
 
     click.echo(f'Created new repository at {path}')
@@ -1,5 +1,4 @@
 import os
-import json
 
 try:
     import click
@@ -9,8 +8,10 @@ except ImportError:
         'click modules not installed. Try `pip install queenbee[cli]` command.'
     )
 
+from ...base.request import DEFAULT_TIMEOUT
 from ...config.repositories import RepositoryReference
 from ...repository.index import RepositoryIndex, RepositoryMetadata
+from .stream import fetch_indexes, echo_json_list
 
 
 @click.command('add')
@@ -36,16 +37,15 @@ def add(name, path, force):
 
 
 @click.command('list')
-def list_repos():
-    """list the repositories saved in your local index"""
-    ctx = click.get_current_context()
-
-    repos = [
-        r.fetch(auth_header=ctx.obj.config.get_auth_header(repository_url=r.path))
-        for r in ctx.obj.config.repositories
-    ]
+@click.option('--timeout', help='Number of seconds to wait for each repository',
+              default=DEFAULT_TIMEOUT, type=click.FloatRange(min=0), show_default=True)
+def list_repos(timeout):
+    """list the repositories saved in your local index
 
-    print(json.dumps([r.metadata.dict() for r in repos], indent=2))
+    Repositories are fetched in parallel and printed as soon as each one is fetched.
+    Repositories which cannot be fetched within the timeout are skipped with a warning.
+    """
+    echo_json_list(r.metadata.to_dict() for r in fetch_indexes(timeout=timeout))
 
 
 @click.command('remove')
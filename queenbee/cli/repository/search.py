@@ -1,5 +1,4 @@
 import os
-import json
 from urllib.parse import urlparse
 
 try:
@@ -10,41 +9,33 @@ except ImportError:
         'click modules not installed. Try `pip install queenbee[cli]` command.'
     )
 
+from ...base.request import DEFAULT_TIMEOUT
 from ...config.repositories import RepositoryReference
+from .stream import fetch_indexes, echo_json_list
 
 
 @click.command('search')
 @click.option('-r', '--repository', help='Only search within the named repository')
 @click.option('-t', '--type', 'kind', help='Only search for a certain type of package')
-@click.option('-s', '--search', help='A search query')
-def search(repository, kind, search):
+@click.option('-s', '--search', help='A search query matched on whole words and word '
+              'prefixes')
+@click.option('--timeout', help='Number of seconds to wait for each repository',
+              default=DEFAULT_TIMEOUT, type=click.FloatRange(min=0), show_default=True)
+def search(repository, kind, search, timeout):
     """search for packages inside a repository
 
     Use this command to search for packages inside of one of the
     repositories indexed on the user's machine.
-    """
-    ctx = click.get_current_context()
 
-    packages = []
-
-    if repository is not None:
-        repos = [
-            r.fetch(auth_header=ctx.obj.config.get_auth_header(
-                repository_url=r.path))
-            for r in ctx.obj.config.repositories if r.name == repository
-        ]
-    else:
-        repos = [
-            r.fetch(auth_header=ctx.obj.config.get_auth_header(
-                repository_url=r.path))
-            for r in ctx.obj.config.repositories
-        ]
-
-    for r in repos:
-        packages.extend(r.search(
-            kind=kind,
-            search_string=search,
-        ))
+    Packages are matched on whole words and word prefixes and ranked with name
+    matches first. Searching for a part of a word such as "ance" does not match
+    "honeybee-radiance", search for "radiance" or "rad" instead.
+
+    Repositories are fetched in parallel and their packages are printed as soon as
+    each repository is fetched. Repositories which cannot be fetched within the
+    timeout are skipped with a warning.
+    """
+    names = [repository] if repository is not None else None
 
     exclude_keys = {
         'readme',
@@ -52,11 +43,12 @@ def search(repository, kind, search):
         'manifest'
     }
 
-    if packages == []:
-        return print(json.dumps([]))
+    def packages():
+        for r in fetch_indexes(names=names, validate=False, timeout=timeout):
+            for p in r.search(kind=kind, search_string=search):
+                yield p.to_dict(exclude=exclude_keys)
 
-    print(json.dumps([p.dict(exclude=exclude_keys)
-                      for p in packages], indent=2, default=packages[0].__json_encoder__))
+    echo_json_list(packages())
 
 
 @click.command('get')
@@ -84,7 +76,7 @@ def get_by_tag(type, repo, name, tag):
         raise click.ClickException(f'No repository with name "{repo}" found')
 
     auth_header = ctx.obj.config.get_auth_header(repository_url=repo_ref.path)
-    repo_index = repo_ref.fetch(auth_header=auth_header)
+    repo_index = repo_ref.fetch(auth_header=auth_header, validate=False)
 
     try:
         package = repo_index.package_by_tag(
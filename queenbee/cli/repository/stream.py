@@ -0,0 +1,47 @@
+import json
+
+try:
+    import click
+except ImportError:
+    raise ImportError(
+        'click modules not installed. Try `pip install queenbee[cli]` command.'
+    )
+
+
+def fetch_indexes(names=None, validate=True, timeout=None):
+    """fetch the repository indexes of the config in parallel
+
+    Indexes are yielded as soon as they are fetched. Repositories which fail or time out
+    are reported on stderr and skipped. An error is raised if every repository failed.
+    """
+    ctx = click.get_current_context()
+
+    fetched = failed = 0
+
+    for repo, index, error in ctx.obj.config.fetch_repositories(
+        names=names, validate=validate, timeout=timeout
+    ):
+        if error is not None:
+            failed += 1
+            click.echo(f'Failed to fetch repository {repo.name}: {error}', err=True)
+            continue
+        fetched += 1
+        yield index
+
+    if failed and not fetched:
+        raise click.ClickException('Failed to fetch any repository')
+
+
+def echo_json_list(items, default=None):
+    """print items as a JSON list as they arrive
+
+    The printed output is a valid indented JSON list once every item is printed.
+    """
+    started = False
+
+    for item in items:
+        data = json.dumps(item, indent=2, default=default).replace('\n', '\n  ')
+        click.echo(f',\n  {data}' if started else f'[\n  {data}', nl=False)
+        started = True
+
+    click.echo('\n]' if started else '[]')
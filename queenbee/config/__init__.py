@@ -1,16 +1,19 @@
-from typing import List, Union
+import time
+import queue
+import threading
+from typing import List, Union, Dict, Iterator, Tuple
 from urllib.parse import urlparse
 from pydantic import Field, SecretStr, constr
 
 from ..base.basemodel import BaseModel
-from .auth import JWTAuth, PollinationAuth, HeaderAuth
+from .auth import JWTAuth, HeaderAuth
 from .repositories import RepositoryReference
 
 
 class Config(BaseModel):
     type: constr(regex='^Config$') = 'Config'
 
-    auth: List[Union[PollinationAuth, JWTAuth, HeaderAuth]] = Field(
+    auth: List[Union[JWTAuth, HeaderAuth]] = Field(
         [],
         description='A list of authentication configurations for different repository domains'
     )
@@ -45,11 +48,11 @@ class Config(BaseModel):
         """
         [auth.refresh_token() for auth in self.auth]
 
-    def add_auth(self, auth: Union[PollinationAuth, JWTAuth, HeaderAuth]):
+    def add_auth(self, auth: Union[JWTAuth, HeaderAuth]):
         """add an authentication method for a specific repository domain
 
         Args:
-            auth (Union[PollinationAuth, JWTAuth, HeaderAuth]): An authentication config object
+            auth (Union[JWTAuth, HeaderAuth]): An authentication config object
         """
         found = False
 
@@ -98,6 +101,63 @@ class Config(BaseModel):
             if repo.name == name:
                 return repo
 
+    def fetch_repositories(
+        self, names: List[str] = None, validate: bool = True, timeout: float = None
+    ) -> Iterator[Tuple[RepositoryReference, 'RepositoryIndex', Exception]]:
+        """fetch the indexes of several repositories in parallel
+
+        Indexes are yielded as soon as they are fetched so the fastest repositories can
+        be used while the others are still being fetched. Repositories which fail or
+        are not fetched within the timeout are yielded with the error instead of an
+        index.
+
+        Args:
+            names (List[str], optional): the names of the repositories to fetch. Defaults to None which fetches all the repositories.
+            validate (bool, optional): validate the indexes. Use False to load trusted indexes faster. Defaults to True.
+            timeout (float, optional): the number of seconds to wait for each repository. Defaults to None which waits until all the repositories are fetched.
+
+        Yields:
+            Tuple[RepositoryReference, RepositoryIndex, Exception]: a repository reference with either its index or the error raised when fetching it
+        """
+        repos = [
+            repo for repo in self.repositories if names is None or repo.name in names
+        ]
+
+        results = queue.Queue()
+
+        def fetch(repo: RepositoryReference):
+            try:
+                index = repo.fetch(
+                    auth_header=self.get_auth_header(repository_url=repo.path),
+                    validate=validate
+                )
+            except Exception as error:
+                results.put((repo, None, error))
+            else:
+                results.put((repo, index, None))
+
+        # use daemon threads rather than an executor so repositories which time out
+        # do not keep the process alive
+        for repo in repos:
+            threading.Thread(target=fetch, args=(repo,), daemon=True).start()
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        pending = {repo.name: repo for repo in repos}
+
+        while pending:
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+            try:
+                repo, index, error = results.get(timeout=remaining)
+            except queue.Empty:
+                for repo in pending.values():
+                    yield repo, None, TimeoutError(
+                        f'Repository {repo.name} was not fetched within {timeout} '
+                        'seconds'
+                    )
+                return
+            del pending[repo.name]
+            yield repo, index, error
+
     def remove_repository(self, name: str):
         """remove a repository reference from the config
 
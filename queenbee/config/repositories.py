@@ -1,8 +1,10 @@
 import os
+import asyncio
+from typing import Dict
 from urllib.parse import urlparse
-from pydantic import Field, validator
+from pydantic import Field, PrivateAttr, validator
 from ..base.basemodel import BaseModel
-from ..base.request import make_request, urljoin, get_uri
+from ..base.request import urljoin, get_uri
 
 
 class RepositoryReference(BaseModel):
@@ -17,41 +19,71 @@ class RepositoryReference(BaseModel):
         description='The path to the repository'
     )
 
+    # the last index fetched from the index cache and its labelled copy
+    _labelled: tuple = PrivateAttr(None)
+
     @validator('path')
     def remote_or_local(cls, v):
         """Determine whether the path is local or remote (ie: http)"""
         return get_uri(v)
 
-    def fetch(self, auth_header: Dict[str, str] = {}) -> 'RepositoryIndex':
+    def fetch(self, auth_header: Dict[str, str] = {},
+              validate: bool = True) -> 'RepositoryIndex':
         """Fetch the referenced repository index
 
+        Args:
+            auth_header (Dict[str, str], optional): an authorization header to use when fetching the index. Defaults to {}.
+            validate (bool, optional): validate the index. Use False to load trusted indexes faster. Defaults to True.
+
         Returns:
-            RepositoryIndex: return the index from the repository reference
+            RepositoryIndex: return the index from the repository reference. It is shared with the other callers and must not be modified
         """
-        from ..repository import RepositoryIndex
+        from ..repository.cache import index_cache
 
-        if self.path.startswith('file:'):
-            url = os.path.join(self.path, 'index.json')
-        else:
-            url = urljoin(self.path, 'index.json')
+        repo = index_cache.fetch(
+            url=self._index_url(), auth_header=auth_header, validate=validate)
+
+        return self._add_source(repo)
+
+    async def afetch(self, auth_header: Dict[str, str] = {},
+                     validate: bool = True) -> 'RepositoryIndex':
+        """Fetch the referenced repository index without blocking the event loop
+
+        This is the asynchronous counterpart of ``fetch``. It requires aiohttp.
 
-        res = make_request(url=url, auth_header=auth_header)
+        Args:
+            auth_header (Dict[str, str], optional): an authorization header to use when fetching the index. Defaults to {}.
+            validate (bool, optional): validate the index. Use False to load trusted indexes faster. Defaults to True.
 
-        raw_bytes = res.read()
+        Returns:
+            RepositoryIndex: return the index from the repository reference. It is shared with the other callers and must not be modified
+        """
+        from ..repository.cache import index_cache
+
+        repo = await index_cache.afetch(
+            url=self._index_url(), auth_header=auth_header, validate=validate)
 
-        repo = RepositoryIndex.parse_raw(raw_bytes)
+        # labelling copies the package versions of the index
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._add_source, repo)
 
-        repo.metadata.name = self.name
-        repo.metadata.source = self.path
+    def _index_url(self) -> str:
+        """Get the url of the referenced repository index."""
+        if self.path.startswith('file:'):
+            return os.path.join(self.path, 'index.json')
+        return urljoin(self.path, 'index.json')
+
+    def _add_source(self, repo: 'RepositoryIndex') -> 'RepositoryIndex':
+        """Label a fetched index and its packages with this repository reference
 
-        repo.add_slugs(
-            root=f'{self.name}',
-            packages=repo.plugin
-        )
+        Fetched indexes are shared by the index cache so the labels are added to a
+        copy. The copy is reused until the index cache returns a new index.
+        """
+        labelled = self._labelled
+        if labelled is not None and labelled[0] is repo:
+            return labelled[1]
 
-        repo.add_slugs(
-            root=f'{self.name}',
-            packages=repo.recipe
-        )
+        index = repo.copy_with_source(name=self.name, source=self.path)
+        self._labelled = (repo, index)
 
-        return repo
+        return index
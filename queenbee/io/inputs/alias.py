@@ -10,7 +10,7 @@ import os
 from typing import Dict, Union, List
 
 from pydantic import constr, Field, validator
-from jsonschema import validate as json_schema_validator
+from ...base.schema import validate_value, validate_values
 
 from ..common import ItemType, GenericInput, find_dup_items, IOAliasHandler
 from ..artifact_source import HTTP, S3, ProjectFolder
@@ -55,16 +55,44 @@ class DAGGenericInputAlias(GenericInput):
         'You can use validate_spec method to validate a value against the spec.'
     )
 
+    def _check_value(self, value):
+        """Check an input value before it is validated against the specification."""
+
+    def _value_spec(self) -> Dict:
+        """Get the JSON Schema specification to validate the input values against."""
+        return dict(self.spec) if self.spec else None
+
     def validate_spec(self, value):
         """Validate an input value against specification.
 
         Use this for validating workflow inputs against a recipe.
         """
-        if self.spec:
-            spec = dict(self.spec)
-            json_schema_validator(value, spec)
+        self._check_value(value)
+        spec = self._value_spec()
+        if spec:
+            validate_value(value, spec)
         return value
 
+    def validate_many(self, values: List) -> List:
+        """Validate a list of input values against specification.
+
+        The JSON Schema specification is only resolved and compiled once and reused
+        for all the values. Use this for validating loop items or the arguments of
+        several jobs.
+        """
+        if type(self).validate_spec is not DAGGenericInputAlias.validate_spec:
+            # subclasses that override validate_spec are validated value by value
+            return [self.validate_spec(value) for value in values]
+
+        values = list(values)
+        for value in values:
+            self._check_value(value)
+
+        spec = self._value_spec()
+        if spec:
+            validate_values(values, spec)
+        return values
+
     @validator('default')
     def validate_default_refs(cls, v, values):
         """Validate referenced variables in the command"""
@@ -124,7 +152,7 @@ class DAGGenericInputAlias(GenericInput):
             return v
 
         if v is not None and default is not None:
-            json_schema_validator(default, v)
+            validate_value(default, v)
         return v
 
     @validator('platform', always=True)
@@ -179,16 +207,9 @@ class DAGStringInputAlias(DAGGenericInputAlias):
         description='Default value to use for an input if a value was not supplied.'
     )
 
-    def validate_spec(self, value):
-        """Validate an input value against specification.
-
-        Use this for validating workflow inputs against a recipe.
-        """
-        if self.spec:
-            spec = dict(self.spec)
-            spec['type'] = 'string'
-            json_schema_validator(value, spec)
-        return value
+    def _value_spec(self) -> Dict:
+        """Get the JSON Schema specification to validate the input values against."""
+        return dict(self.spec, type='string') if self.spec else None
 
 
 class DAGIntegerInputAlias(DAGGenericInputAlias):
@@ -207,16 +228,9 @@ class DAGIntegerInputAlias(DAGGenericInputAlias):
         description='Default value to use for an input if a value was not supplied.'
     )
 
-    def validate_spec(self, value):
-        """Validate an input value against specification.
-
-        Use this for validating workflow inputs against a recipe.
-        """
-        if self.spec:
-            spec = dict(self.spec)
-            spec['type'] = 'integer'
-            json_schema_validator(value, spec)
-        return value
+    def _value_spec(self) -> Dict:
+        """Get the JSON Schema specification to validate the input values against."""
+        return dict(self.spec, type='integer') if self.spec else None
 
 
 class DAGNumberInputAlias(DAGGenericInputAlias):
@@ -234,16 +248,9 @@ class DAGNumberInputAlias(DAGGenericInputAlias):
         description='Default value to use for an input if a value was not supplied.'
     )
 
-    def validate_spec(self, value):
-        """Validate an input value against specification.
-
-        Use this for validating workflow inputs against a recipe.
-        """
-        if self.spec:
-            spec = dict(self.spec)
-            spec['type'] = 'number'
-            json_schema_validator(value, spec)
-        return value
+    def _value_spec(self) -> Dict:
+        """Get the JSON Schema specification to validate the input values against."""
+        return dict(self.spec, type='number') if self.spec else None
 
 
 class DAGBooleanInputAlias(DAGGenericInputAlias):
@@ -263,16 +270,9 @@ class DAGBooleanInputAlias(DAGGenericInputAlias):
         description='Default value to use for an input if a value was not supplied.'
     )
 
-    def validate_spec(self, value):
-        """Validate an input value against specification.
-
-        Use this for validating workflow inputs against a recipe.
-        """
-        if self.spec:
-            spec = dict(self.spec)
-            spec['type'] = 'boolean'
-            json_schema_validator(value, spec)
-        return value
+    def _value_spec(self) -> Dict:
+        """Get the JSON Schema specification to validate the input values against."""
+        return dict(self.spec, type='boolean') if self.spec else None
 
 
 class DAGFolderInputAlias(DAGGenericInputAlias):
@@ -300,18 +300,13 @@ class DAGFolderInputAlias(DAGGenericInputAlias):
         description='The default source for file if the value is not provided.'
     )
 
-    def validate_spec(self, value):
-        """Validate an input value against specification.
-
-        Use this for validating workflow inputs against a recipe.
-        """
+    def _check_value(self, value):
+        """Check an input value before it is validated against the specification."""
         assert os.path.isdir(value), f'There is no folder at {value}'
-        if self.spec:
-            spec = dict(self.spec)
-            spec['type'] = 'string'
-            json_schema_validator(value, spec)
 
-        return value
+    def _value_spec(self) -> Dict:
+        """Get the JSON Schema specification to validate the input values against."""
+        return dict(self.spec, type='string') if self.spec else None
 
     @property
     def is_artifact(self):
@@ -348,21 +343,12 @@ class DAGFileInputAlias(DAGFolderInputAlias):
         'case-insensitive.'
     )
 
-    def validate_spec(self, value):
-        """Validate an input value against specification.
-
-        Use this for validating workflow inputs against a recipe.
-        """
+    def _check_value(self, value):
+        """Check an input value before it is validated against the specification."""
         assert os.path.isfile(value), f'There is no file at {value}'
         if self.extensions:
             assert value.lower().endswith(self.extension.lower()), \
                 f'Input file extension for {value} must be {self.extensions}'
-        if self.spec:
-            spec = dict(self.spec)
-            spec['type'] = 'string'
-            json_schema_validator(value, spec)
-
-        return value
 
 
 class DAGPathInputAlias(DAGFolderInputAlias):
@@ -398,11 +384,8 @@ class DAGPathInputAlias(DAGFolderInputAlias):
         'case-insensitive. The extension will only be validated for file inputs.'
     )
 
-    def validate_spec(self, value):
-        """Validate an input value against specification.
-
-        Use this for validating workflow inputs against a recipe.
-        """
+    def _check_value(self, value):
+        """Check an input value before it is validated against the specification."""
         if os.path.isfile(value):
             if self.extensions:
                 assert value.lower().endswith(self.extension.lower()), \
@@ -410,11 +393,6 @@ class DAGPathInputAlias(DAGFolderInputAlias):
         elif not os.path.isdir(value):
             raise ValueError(f'{value} is not a valid file or folder.')
 
-        if self.spec:
-            spec = dict(self.spec)
-            spec['type'] = 'string'
-            json_schema_validator(value, spec)
-
 
 class DAGArrayInputAlias(DAGGenericInputAlias):
     """An array input.
@@ -441,16 +419,11 @@ class DAGArrayInputAlias(DAGGenericInputAlias):
     def replace_none_value(cls, v):
         return [] if not v else v
 
-    def validate_spec(self, value):
-        """Validate an input value against specification.
-
-        Use this for validating workflow inputs against a recipe.
-        """
-        if self.spec:
-            spec = dict(self.spec)
-            spec['type'] = 'array'
-            spec['items'] = self.items_type.lower()
-            json_schema_validator(value, spec)
+    def _value_spec(self) -> Dict:
+        """Get the JSON Schema specification to validate the input values against."""
+        if not self.spec:
+            return None
+        return dict(self.spec, type='array', items=self.items_type.lower())
 
 
 class DAGJSONObjectInputAlias(DAGGenericInputAlias):
@@ -474,15 +447,9 @@ class DAGJSONObjectInputAlias(DAGGenericInputAlias):
     def replace_none_value(cls, v):
         return {} if not v else v
 
-    def validate_spec(self, value):
-        """Validate an input value against specification.
-
-        Use this for validating workflow inputs against a recipe.
-        """
-        if self.spec:
-            spec = dict(self.spec)
-            spec['type'] = 'object'
-            json_schema_validator(value, spec)
+    def _value_spec(self) -> Dict:
+        """Get the JSON Schema specification to validate the input values against."""
+        return dict(self.spec, type='object') if self.spec else None
 
 
 DAGAliasInputs = Union[
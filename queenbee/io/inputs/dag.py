@@ -4,7 +4,7 @@ import os
 from typing import Dict, Union, List
 
 from pydantic import constr, Field, validator
-from jsonschema import validate as json_schema_validator
+from ...base.schema import validate_value, validate_values
 
 from ..common import ItemType, GenericInput
 from ..artifact_source import HTTP, S3, ProjectFolder
@@ -43,16 +43,44 @@ class DAGGenericInput(GenericInput):
         'You can use validate_spec method to validate a value against the spec.'
     )
 
+    def _check_value(self, value):
+        """Check an input value before it is validated against the specification."""
+
+    def _value_spec(self) -> Dict:
+        """Get the JSON Schema specification to validate the input values against."""
+        return dict(self.spec) if self.spec else None
+
     def validate_spec(self, value):
         """Validate an input value against specification.
 
         Use this for validating workflow inputs against a recipe.
         """
-        if self.spec:
-            spec = dict(self.spec)
-            json_schema_validator(value, spec)
+        self._check_value(value)
+        spec = self._value_spec()
+        if spec:
+            validate_value(value, spec)
         return value
 
+    def validate_many(self, values: List) -> List:
+        """Validate a list of input values against specification.
+
+        The JSON Schema specification is only resolved and compiled once and reused
+        for all the values. Use this for validating loop items or the arguments of
+        several jobs.
+        """
+        if type(self).validate_spec is not DAGGenericInput.validate_spec:
+            # subclasses that override validate_spec are validated value by value
+            return [self.validate_spec(value) for value in values]
+
+        values = list(values)
+        for value in values:
+            self._check_value(value)
+
+        spec = self._value_spec()
+        if spec:
+            validate_values(values, spec)
+        return values
+
     @validator('required', always=True)
     def check_required(cls, v, values):
         """Ensure required is set to True when default value is not provided."""
@@ -89,7 +117,7 @@ class DAGGenericInput(GenericInput):
             return v
 
         if v is not None and default is not None:
-            json_schema_validator(default, v)
+            validate_value(default, v)
         return v
 
     @validator('default')
@@ -145,16 +173,9 @@ class DAGStringInput(DAGGenericInput):
         description='Default value to use for an input if a value was not supplied.'
     )
 
-    def validate_spec(self, value):
-        """Validate an input value against specification.
-
-        Use this for validating workflow inputs against a recipe.
-        """
-        if self.spec:
-            spec = dict(self.spec)
-            spec['type'] = 'string'
-            json_schema_validator(value, spec)
-        return value
+    def _value_spec(self) -> Dict:
+        """Get the JSON Schema specification to validate the input values against."""
+        return dict(self.spec, type='string') if self.spec else None
 
 
 class DAGIntegerInput(DAGGenericInput):
@@ -173,16 +194,9 @@ class DAGIntegerInput(DAGGenericInput):
         description='Default value to use for an input if a value was not supplied.'
     )
 
-    def validate_spec(self, value):
-        """Validate an input value against specification.
-
-        Use this for validating workflow inputs against a recipe.
-        """
-        if self.spec:
-            spec = dict(self.spec)
-            spec['type'] = 'integer'
-            json_schema_validator(value, spec)
-        return value
+    def _value_spec(self) -> Dict:
+        """Get the JSON Schema specification to validate the input values against."""
+        return dict(self.spec, type='integer') if self.spec else None
 
 
 class DAGNumberInput(DAGGenericInput):
@@ -200,16 +214,9 @@ class DAGNumberInput(DAGGenericInput):
         description='Default value to use for an input if a value was not supplied.'
     )
 
-    def validate_spec(self, value):
-        """Validate an input value against specification.
-
-        Use this for validating workflow inputs against a recipe.
-        """
-        if self.spec:
-            spec = dict(self.spec)
-            spec['type'] = 'number'
-            json_schema_validator(value, spec)
-        return value
+    def _value_spec(self) -> Dict:
+        """Get the JSON Schema specification to validate the input values against."""
+        return dict(self.spec, type='number') if self.spec else None
 
 
 class DAGBooleanInput(DAGGenericInput):
@@ -229,16 +236,9 @@ class DAGBooleanInput(DAGGenericInput):
         description='Default value to use for an input if a value was not supplied.'
     )
 
-    def validate_spec(self, value):
-        """Validate an input value against specification.
-
-        Use this for validating workflow inputs against a recipe.
-        """
-        if self.spec:
-            spec = dict(self.spec)
-            spec['type'] = 'boolean'
-            json_schema_validator(value, spec)
-        return value
+    def _value_spec(self) -> Dict:
+        """Get the JSON Schema specification to validate the input values against."""
+        return dict(self.spec, type='boolean') if self.spec else None
 
 
 class DAGFolderInput(DAGGenericInput):
@@ -266,18 +266,13 @@ class DAGFolderInput(DAGGenericInput):
         description='The default source for file if the value is not provided.'
     )
 
-    def validate_spec(self, value):
-        """Validate an input value against specification.
-
-        Use this for validating workflow inputs against a recipe.
-        """
+    def _check_value(self, value):
+        """Check an input value before it is validated against the specification."""
         assert os.path.isdir(value), f'There is no folder at {value}'
-        if self.spec:
-            spec = dict(self.spec)
-            spec['type'] = 'string'
-            json_schema_validator(value, spec)
 
-        return value
+    def _value_spec(self) -> Dict:
+        """Get the JSON Schema specification to validate the input values against."""
+        return dict(self.spec, type='string') if self.spec else None
 
     @property
     def is_artifact(self):
@@ -314,21 +309,12 @@ class DAGFileInput(DAGFolderInput):
         'case-insensitive.'
     )
 
-    def validate_spec(self, value):
-        """Validate an input value against specification.
-
-        Use this for validating workflow inputs against a recipe.
-        """
+    def _check_value(self, value):
+        """Check an input value before it is validated against the specification."""
         assert os.path.isfile(value), f'There is no file at {value}'
         if self.extensions:
             assert value.lower().endswith(self.extension.lower()), \
                 f'Input file extension for {value} must be {self.extensions}'
-        if self.spec:
-            spec = dict(self.spec)
-            spec['type'] = 'string'
-            json_schema_validator(value, spec)
-
-        return value
 
 
 class DAGPathInput(DAGFolderInput):
@@ -364,11 +350,8 @@ class DAGPathInput(DAGFolderInput):
         'case-insensitive. The extension will only be validated for file inputs.'
     )
 
-    def validate_spec(self, value):
-        """Validate an input value against specification.
-
-        Use this for validating workflow inputs against a recipe.
-        """
+    def _check_value(self, value):
+        """Check an input value before it is validated against the specification."""
         if os.path.isfile(value):
             if self.extensions:
                 assert value.lower().endswith(self.extension.lower()), \
@@ -376,11 +359,6 @@ class DAGPathInput(DAGFolderInput):
         elif not os.path.isdir(value):
             raise ValueError(f'{value} is not a valid file or folder.')
 
-        if self.spec:
-            spec = dict(self.spec)
-            spec['type'] = 'string'
-            json_schema_validator(value, spec)
-
 
 class DAGArrayInput(DAGGenericInput):
     """An array input.
@@ -407,16 +385,11 @@ class DAGArrayInput(DAGGenericInput):
     def replace_none_value(cls, v):
         return [] if not v else v
 
-    def validate_spec(self, value):
-        """Validate an input value against specification.
-
-        Use this for validating workflow inputs against a recipe.
-        """
-        if self.spec:
-            spec = dict(self.spec)
-            spec['type'] = 'array'
-            spec['items'] = self.items_type.lower()
-            json_schema_validator(value, spec)
+    def _value_spec(self) -> Dict:
+        """Get the JSON Schema specification to validate the input values against."""
+        if not self.spec:
+            return None
+        return dict(self.spec, type='array', items=self.items_type.lower())
 
 
 class DAGJSONObjectInput(DAGGenericInput):
@@ -440,15 +413,9 @@ class DAGJSONObjectInput(DAGGenericInput):
     def replace_none_value(cls, v):
         return {} if not v else v
 
-    def validate_spec(self, value):
-        """Validate an input value against specification.
-
-        Use this for validating workflow inputs against a recipe.
-        """
-        if self.spec:
-            spec = dict(self.spec)
-            spec['type'] = 'object'
-            json_schema_validator(value, spec)
+    def _value_spec(self) -> Dict:
+        """Get the JSON Schema specification to validate the input values against."""
+        return dict(self.spec, type='object') if self.spec else None
 
 
 DAGInputs = Union[
@@ -1,11 +1,14 @@
 """Input objects for Queenbee jobs."""
-from typing import Dict, List, Union
+import json
+from typing import Any, Callable, Dict, List, Tuple, Union
 
 from pydantic import Field, constr
 
 from ..artifact_source import HTTP, S3, ProjectFolder
+from .dag import DAGInputs
 from ...base.basemodel import BaseModel
 from ...base.parser import parse_file
+from ...base.schema import spec_validator
 
 
 class JobArgument(BaseModel):
@@ -102,3 +105,170 @@ def load_job_arguments_from_dict(data: List[Dict]) -> List[JobArguments]:
         args.append(arg)
 
     return args
+
+
+def _to_integer(value: Any) -> int:
+    if isinstance(value, bool):
+        raise ValueError(f'{value!r} is not an integer')
+    if isinstance(value, int):
+        return value
+    # int() truncates floats so only whole numbers are accepted
+    if isinstance(value, float) and not value.is_integer():
+        raise ValueError(f'{value!r} is not an integer')
+    return int(value)
+
+
+def _to_number(value: Any) -> float:
+    if isinstance(value, bool):
+        raise ValueError(f'{value!r} is not a number')
+    if isinstance(value, (int, float)):
+        return value
+    return float(value)
+
+
+def _to_boolean(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str) and value.lower() in ('true', 'false'):
+        return value.lower() == 'true'
+    raise ValueError(f'{value!r} is not a boolean')
+
+
+def _to_json(type_: type) -> Callable[[Any], Any]:
+    def convert(value: Any) -> Any:
+        if isinstance(value, (str, bytes)):
+            value = json.loads(value)
+        if not isinstance(value, type_):
+            raise ValueError(f'{value!r} is not a {type_.__name__}')
+        return value
+    return convert
+
+
+# input type -> (JSON Schema type, converter from a job argument value)
+_PARAMETER_TYPES = {
+    'DAGGenericInput': (None, None),
+    'DAGStringInput': ('string', str),
+    'DAGIntegerInput': ('integer', _to_integer),
+    'DAGNumberInput': ('number', _to_number),
+    'DAGBooleanInput': ('boolean', _to_boolean),
+    'DAGArrayInput': ('array', _to_json(list)),
+    'DAGJSONObjectInput': ('object', _to_json(dict)),
+}
+
+
+class JobArgumentsValidator:
+    """Validate many sets of job arguments against the inputs of a recipe
+
+    The lookup tables for the recipe inputs and the JSON Schema validators of their
+    specifications are built once when the validator is created and reused for every
+    set of arguments. Use this to check the arguments of a parametric study before
+    submitting thousands of jobs.
+
+    Argument values are converted to the type of their input before being validated
+    against the input specification. Path arguments are only checked to target an
+    artifact input since their source is not available locally.
+
+    Arguments:
+        inputs {List[DAGInputs]} -- The inputs of a recipe
+    """
+
+    def __init__(self, inputs: List[DAGInputs]):
+        self.required = tuple(inp.name for inp in inputs if inp.required)
+        self.artifacts = frozenset(inp.name for inp in inputs if inp.is_artifact)
+        self.parameters = {}
+
+        for inp in inputs:
+            if inp.is_artifact:
+                continue
+            json_type, convert = _PARAMETER_TYPES.get(inp.type, (None, None))
+            validator = None
+            if inp.spec:
+                spec = dict(inp.spec)
+                if json_type is not None:
+                    spec['type'] = json_type
+                validator = spec_validator(spec)
+            self.parameters[inp.name] = (convert, validator)
+
+    @staticmethod
+    def _read_argument(argument: Union[JobArguments, Dict]) -> Tuple[str, str, Any]:
+        if isinstance(argument, dict):
+            return argument.get('type'), argument.get('name'), argument.get('value')
+        return argument.type, argument.name, getattr(argument, 'value', None)
+
+    def validate(self, arguments: List[Union[JobArguments, Dict]]) -> List[str]:
+        """Validate a set of job arguments
+
+        Arguments:
+            arguments {List[Union[JobArguments, Dict]]} -- Job arguments either as
+                JobArgument and JobPathArgument objects or as dictionaries
+
+        Returns:
+            List[str] -- The error messages for this set of arguments. The list is
+                empty if the arguments are valid.
+        """
+        errors = []
+        names = set()
+
+        for argument in arguments:
+            arg_type, name, value = self._read_argument(argument)
+
+            if name in names:
+                errors.append(f'Duplicate argument: {name}')
+                continue
+            names.add(name)
+
+            if arg_type == 'JobPathArgument':
+                if name not in self.artifacts:
+                    errors.append(f'{name} is not a file, folder or path input.')
+                continue
+
+            if arg_type != 'JobArgument':
+                errors.append(
+                    f'Invalid type for Job argument {name}: {arg_type}. '
+                    'Valid types are: JobArgument and JobPathArgument.'
+                )
+                continue
+
+            try:
+                convert, validator = self.parameters[name]
+            except KeyError:
+                if name in self.artifacts:
+                    errors.append(
+                        f'{name} is a file, folder or path input and must be set '
+                        'using a JobPathArgument.'
+                    )
+                else:
+                    errors.append(f'{name} is not an input of this recipe.')
+                continue
+
+            try:
+                if convert is not None:
+                    value = convert(value)
+                if validator is not None:
+                    error = next(validator.iter_errors(value), None)
+                    if error is not None:
+                        raise ValueError(error.message)
+            except (TypeError, ValueError) as error:
+                errors.append(f'Invalid value for {name}: {error}')
+
+        for name in self.required:
+            if name not in names:
+                errors.append(f'Missing required argument: {name}')
+
+        return errors
+
+    def validate_many(
+        self, jobs: List[List[Union[JobArguments, Dict]]]
+    ) -> List[List[str]]:
+        """Validate several sets of job arguments
+
+        Arguments:
+            jobs {List[List[Union[JobArguments, Dict]]]} -- A set of job arguments
+                for each job
+
+        Returns:
+            List[List[str]] -- The error messages for each set of arguments in the
+                same order as the input jobs.
+        """
+        validate = self.validate
+        return [validate(arguments) for arguments in jobs]
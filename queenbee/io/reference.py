@@ -1,10 +1,10 @@
 """Objects to reference parameters, files and folders from inputs, tasks and items."""
 
-import re
 from typing import List, Union, Dict, Any
 from pydantic import Field, constr, validator
 
 from ..base.basemodel import BaseModel
+from ..base.parser import parse_double_quotes_vars
 
 
 def template_string(keys: List[str]) -> str:
@@ -279,8 +279,7 @@ def references_from_string(string: str) -> List[
     Returns:
         List[Union[InputReference, TaskReference, ItemReference]] -- A list of reference objects
     """
-    pattern = r"{{\s*([_a-zA-Z0-9.\-\$#\?]*)\s*}}"
-    match = re.findall(pattern, string, flags=re.MULTILINE)
+    match = parse_double_quotes_vars(string)
 
     refs = []
 
@@ -1,11 +1,74 @@
 """Queenbee Function class."""
-from typing import List
+from typing import Any, Dict, List
 from pydantic import Field, validator, constr
 
 from ..io.common import IOBase
 from ..io.inputs.function import FunctionInputs
 from ..io.outputs.function import FunctionOutputs
 from ..base.variable import validate_inputs_outputs_var_format, get_ref_variable
+from ..base.parser import tokenize_double_quote_vars, TemplateVariable
+
+
+class CompiledCommand:
+    """A function command pre-split into literal and variable segments
+
+    Compile a command once and render it for each set of input values (ie: each
+    item of a loop) in a single pass.
+
+    Arguments:
+        command {str} -- A command with double quoted vars
+            (eg: ``echo {{inputs.message}}``)
+    """
+
+    __slots__ = ('command', 'variables', '_template')
+
+    def __init__(self, command: str):
+        self.command = command
+
+        template = []
+        variables = []
+
+        for token in tokenize_double_quote_vars(command):
+            if isinstance(token, TemplateVariable):
+                template.append(f'{{{len(variables)}}}')
+                variables.append(token.name)
+            else:
+                template.append(token.replace('{', '{{').replace('}', '}}'))
+
+        self.variables = tuple(variables)
+        self._template = ''.join(template)
+
+    @classmethod
+    def from_function(cls, function: 'Function') -> 'CompiledCommand':
+        """Compile the command of a function
+
+        Arguments:
+            function {Function} -- A plugin function
+
+        Returns:
+            CompiledCommand -- The compiled command
+        """
+        return cls(function.command)
+
+    def render(self, values: Dict[str, Any]) -> str:
+        """Render the command
+
+        Arguments:
+            values {Dict[str, Any]} -- The values of the command variables keyed by
+                variable name (eg: ``{'inputs.message': 'hello'}``)
+
+        Raises:
+            ValueError: A variable of the command has no value
+
+        Returns:
+            str -- The rendered command
+        """
+        try:
+            return self._template.format(*[values[name] for name in self.variables])
+        except KeyError as error:
+            raise ValueError(
+                f'Missing value for variable {error.args[0]} in command: {self.command}'
+            )
 
 
 class Function(IOBase):
@@ -96,3 +159,11 @@ class Function(IOBase):
         )
 
         return v
+
+    def compile_command(self) -> CompiledCommand:
+        """Compile the function command to render it for many sets of values
+
+        Returns:
+            CompiledCommand -- The compiled command
+        """
+        return CompiledCommand.from_function(self)
@@ -0,0 +1,120 @@
+"""Local cache for baked recipes."""
+import os
+import json
+import hashlib
+from typing import List
+
+import pydantic
+
+from ..base.cache import FileCache, DEFAULT_CACHE_FOLDER, DEFAULT_MAX_SIZE
+from .dependency import Dependency
+
+
+def _queenbee_version() -> str:
+    """Get the installed queenbee version (or None if it is not installed)"""
+    global _QUEENBEE_VERSION
+
+    if _QUEENBEE_VERSION is False:
+        from pkg_resources import get_distribution, DistributionNotFound
+        try:
+            _QUEENBEE_VERSION = get_distribution('queenbee').version
+        except DistributionNotFound:
+            _QUEENBEE_VERSION = None
+
+    return _QUEENBEE_VERSION
+
+
+_QUEENBEE_VERSION = False
+
+
+class BakeCache(FileCache):
+    """A cache of baked recipes keyed by recipe and dependency digests
+
+    A baked recipe only depends on its recipe and on the content of its dependencies
+    so a recipe whose dependencies are all locked to a digest is only baked once. The
+    queenbee and pydantic versions are part of the key so entries written by other
+    versions are never loaded.
+
+    Keyword Arguments:
+        folder {str} -- Path to the cache folder (default: {None})
+        max_size {int} -- Maximum size of the cache folder in bytes
+            (default: {DEFAULT_MAX_SIZE})
+    """
+
+    def __init__(self, folder: str = None, max_size: int = DEFAULT_MAX_SIZE):
+        if folder is None:
+            folder = os.path.join(DEFAULT_CACHE_FOLDER, 'baked')
+        super(BakeCache, self).__init__(
+            folder=folder, extension='.json', max_size=max_size
+        )
+
+    @staticmethod
+    def key(source: str, digest: str, dependencies: List[Dependency]) -> str:
+        """Generate the cache key of a recipe
+
+        Arguments:
+            source {str} -- How the recipe is baked (ie: ``recipe`` or ``folder``)
+            digest {str} -- The digest of the recipe. Compute it with
+                ``hash_digest(cached=False)`` so it matches the current recipe
+            dependencies {List[Dependency]} -- The recipe dependencies
+
+        Returns:
+            str -- The cache key (or None if a dependency is not locked)
+        """
+        dependencies = dependencies or []
+
+        if not all(dependency.is_locked for dependency in dependencies):
+            return None
+
+        key_data = [source, digest, _queenbee_version(), pydantic.VERSION] + sorted(
+            [dependency.kind.value, dependency.ref_name, dependency.digest]
+            for dependency in dependencies
+        )
+
+        return hashlib.sha256(json.dumps(key_data).encode('utf-8')).hexdigest()
+
+    def get_recipe(self, key: str, digest: str) -> 'BakedRecipe':
+        """Retrieve a baked recipe
+
+        Cache entries are written from validated baked recipes so they are loaded
+        with ``BakedRecipe.from_trusted`` without validating them again. Entries that
+        cannot be loaded or that were baked from another recipe are removed.
+
+        Arguments:
+            key {str} -- The cache key of the recipe
+            digest {str} -- The digest of the recipe
+
+        Returns:
+            BakedRecipe -- The baked recipe (or None if it is not cached or its
+                cached file is invalid)
+        """
+        from .recipe import BakedRecipe
+
+        data = self.get(key)
+
+        if data is None:
+            return None
+
+        try:
+            data = json.loads(data)
+            if not isinstance(data, dict) or data.get('digest') != digest:
+                raise ValueError(f'Cache entry {key} is not a bake of {digest}')
+            return BakedRecipe.from_trusted(data)
+        except (ValueError, TypeError, KeyError):
+            self.remove(key)
+            return None
+
+    def add_recipe(self, key: str, baked_recipe: 'BakedRecipe'):
+        """Add a baked recipe to the cache
+
+        Arguments:
+            key {str} -- The cache key of the recipe
+            baked_recipe {BakedRecipe} -- The baked recipe
+        """
+        self.set(
+            key,
+            baked_recipe.json(by_alias=True, exclude_unset=False).encode('utf-8')
+        )
+
+
+bake_cache = BakeCache()
@@ -1,10 +1,12 @@
 """Queenbee dependency class."""
 import os
+import asyncio
 from enum import Enum
+from typing import Dict
 from pydantic import Field, constr
 
 from ..base.basemodel import BaseModel
-from ..base.request import make_request, urljoin
+from ..base.request import urljoin
 
 
 class DependencyKind(str, Enum):
@@ -85,34 +87,73 @@ class Dependency(BaseModel):
             return self.alias
         return self.name
 
+    def _index_url(self) -> str:
+        """Get the url of the source repository index."""
+        if self.source.startswith('file:'):
+            rel_path = self.source.split('file:')[1]
+
+            abs_path = os.path.join(os.getcwd(), rel_path, 'index.json')
+
+            return f'file:{abs_path}'
+
+        return urljoin(self.source, 'index.json')
+
     def _fetch_index(self, auth_header: Dict[str, str] = {}):
         """Fetch the source repository index object.
 
         Returns:
             RepositoryIndex -- A repository index
         """
-        from ..repository.index import RepositoryIndex
+        from ..repository.cache import index_cache
 
-        if self.source.startswith('file:'):
-            rel_path = self.source.split('file:')[1]
+        return index_cache.fetch(url=self._index_url(), auth_header=auth_header)
 
-            abs_path = os.path.join(os.getcwd(), rel_path, 'index.json')
+    async def _afetch_index(self, auth_header: Dict[str, str] = {}):
+        """Fetch the source repository index object without blocking the event loop.
 
-            url = f'file:{abs_path}'
-        else:
-            url = urljoin(self.source, 'index.json')
+        Returns:
+            RepositoryIndex -- A repository index
+        """
+        from ..repository.cache import index_cache
+
+        return await index_cache.afetch(url=self._index_url(), auth_header=auth_header)
 
-        res = make_request(url=url, auth_header=auth_header)
+    def lock(self, auth_header: Dict[str, str] = {}) -> str:
+        """Lock the dependency to the digest of its tag in the source repository
 
-        raw_bytes = res.read()
-        return RepositoryIndex.parse_raw(raw_bytes)
+        The package itself is not downloaded. Locked dependencies are left unchanged.
+
+        Keyword Arguments:
+            auth_header {Dict[str, str]} -- An authorization header to use when
+                fetching the source repository index
 
-    def fetch(self, verify_digest: bool = True, auth_header: Dict[str, str] = {}) -> 'PackageVersion':
+        Returns:
+            str -- The digest of the dependency
+        """
+        if self.digest is None:
+            index = self._fetch_index(auth_header=auth_header)
+
+            self.digest = index.package_by_tag(
+                kind=self.dependency_kind,
+                package_name=self.name,
+                package_tag=self.tag
+            ).digest
+
+        return self.digest
+
+    def fetch(self, verify_digest: bool = True, auth_header: Dict[str, str] = {},
+              use_cache: bool = True) -> 'PackageVersion':
         """Fetch the dependency from its source
 
+        Locked dependencies found in the local package cache are returned without
+        fetching the source repository index. Packages downloaded with an
+        authorization header are only returned from the cache to callers sending the
+        same header.
+
         Keyword Arguments:
             verify_digest {bool} -- If the dependency is locked, ensure the found
                 manifest matches the saved digest (default: {True})
+            use_cache {bool} -- Use the local package cache (default: {True})
 
         Raises:
             ValueError: The dependency could not be found or was invalid
@@ -123,9 +164,78 @@ class Dependency(BaseModel):
             str -- The readme of the package
             str -- The license of the package
         """
+        from ..repository.cache import package_cache
+
+        if use_cache and self.is_locked:
+            package_version = package_cache.get_package(
+                self.digest, auth_header=self._cache_auth_header(auth_header)
+            )
+            if package_version is not None:
+                return package_version
 
         index = self._fetch_index(auth_header=auth_header)
+        package_meta = self._package_meta(index)
+
+        return package_meta.fetch_package(
+            source_url=self.source,
+            verify_digest=verify_digest,
+            auth_header=auth_header,
+            use_cache=use_cache,
+        )
+
+    async def afetch(self, verify_digest: bool = True, auth_header: Dict[str, str] = {},
+                     use_cache: bool = True) -> 'PackageVersion':
+        """Fetch the dependency from its source without blocking the event loop
+
+        This is the asynchronous counterpart of ``fetch``. It requires aiohttp.
+
+        Keyword Arguments:
+            verify_digest {bool} -- If the dependency is locked, ensure the found
+                manifest matches the saved digest (default: {True})
+            use_cache {bool} -- Use the local package cache (default: {True})
+
+        Raises:
+            ValueError: The dependency could not be found or was invalid
+
+        Returns:
+            PackageVersion -- The package version of the dependency
+        """
+        from ..repository.cache import package_cache
+
+        if use_cache and self.is_locked:
+            loop = asyncio.get_running_loop()
+            package_version = await loop.run_in_executor(
+                None, package_cache.get_package, self.digest,
+                self._cache_auth_header(auth_header)
+            )
+            if package_version is not None:
+                return package_version
+
+        index = await self._afetch_index(auth_header=auth_header)
+        package_meta = self._package_meta(index)
 
+        return await package_meta.afetch_package(
+            source_url=self.source,
+            verify_digest=verify_digest,
+            auth_header=auth_header,
+            use_cache=use_cache,
+        )
+
+    def _cache_auth_header(self, auth_header: Dict[str, str]) -> Dict[str, str]:
+        """Get the authorization header the cached package is downloaded with
+
+        Packages from local repositories are not downloaded with credentials.
+        """
+        if self.source.startswith('file:'):
+            return None
+        return auth_header
+
+    def _package_meta(self, index: 'RepositoryIndex') -> 'PackageVersion':
+        """Find the package version of the dependency in its source index
+
+        The dependency is locked to the digest of the package version if it is not
+        locked yet.
+        """
         if self.digest is None:
             package_meta = index.package_by_tag(
                 kind=self.dependency_kind,
@@ -157,8 +267,4 @@ class Dependency(BaseModel):
                 else:
                     raise error
 
-        return package_meta.fetch_package(
-            source_url=self.source,
-            verify_digest=verify_digest,
-            auth_header=auth_header,
-        )
+        return package_meta
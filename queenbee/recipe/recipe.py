@@ -6,21 +6,37 @@ end steps for the recipe.
 import os
 import shutil
 import json
-from typing import List, Union, Dict
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Union, Dict, Tuple
 
 import yaml
-from pydantic import Field, validator, root_validator, constr
+from pydantic import Field, PrivateAttr, ValidationError, validator, \
+    root_validator, constr
+from pydantic.error_wrappers import ErrorWrapper
+from pydantic.utils import ROOT_KEY
 
-from ..base.basemodel import BaseModel
+from ..base.basemodel import BaseModel, digest_scope
 from ..base.metadata import MetaData
 
 from ..config import Config
+from ..io.inputs.job import JobArguments, JobArgumentsValidator
 from ..plugin import Plugin
 from ..plugin.function import Function
 from ..plugin.plugin import PluginConfig
 
 from .dag import DAG, DAGInputs, DAGOutputs
 from .dependency import Dependency, DependencyKind
+from .cache import bake_cache
+from .resolver import DependencyResolver
+
+
+def _remove_path(path: str):
+    """Remove a file, a link or a folder if it exists"""
+    if os.path.islink(path) or os.path.isfile(path):
+        os.remove(path)
+    elif os.path.isdir(path):
+        shutil.rmtree(path)
 
 
 class TemplateFunction(Function):
@@ -40,16 +56,20 @@ class TemplateFunction(Function):
             plugin {Plugin} -- A plugin
 
         Returns:
-            list -- A list of template functions
+            list -- A list of template functions. The templates share their inputs,
+                outputs and config objects with the plugin.
         """
         functions = []
+        digest = plugin.hash_digest()
 
+        # the plugin functions are already validated so their fields are reused
+        # as is instead of being serialized and parsed again
         for function in plugin.functions:
-            input_dict = function.to_dict()
-            input_dict['type'] = 'TemplateFunction'
-            input_dict['name'] = f'{plugin.__hash__}/{function.name}'
-            input_dict['config'] = plugin.config.to_dict()
-            functions.append(cls.parse_obj(input_dict))
+            values = {field: getattr(function, field) for field in function.__fields__}
+            values['type'] = 'TemplateFunction'
+            values['name'] = f'{digest}/{function.name}'
+            values['config'] = plugin.config
+            functions.append(cls.construct(**values))
 
         return functions
 
@@ -263,7 +283,9 @@ class Recipe(BaseModel):
             folder_path {str} -- The path to the recipe folder
         """
 
-        self_dict = json.loads(self.json(by_alias=True, exclude_unset=True))
+        self_dict = self.to_dict(
+            by_alias=True, exclude_unset=True, include={'dependencies'}
+        )
 
         with open(os.path.join(folder_path, 'dependencies.yaml'), 'w') as f:
             f.write(
@@ -335,44 +357,106 @@ class Recipe(BaseModel):
     def write_dependencies(self, folder_path: str, config: Config = Config()):
         """Fetch dependencies manifests and write them to the `.dependencies` folder
 
+        The folder is synced incrementally. The digest of every dependency written to
+        the folder is saved in a ``.dependencies/.lock.json`` file so dependencies that
+        did not change are not fetched or written again. Changed dependencies are
+        written to a temporary folder first and then moved in place. Dependencies that
+        are no longer used by the recipe are removed.
+
         Arguments:
             folder_path {str} -- Path to the recipe folder
         Keyword Arguments:
             config {Config} -- A queenbee config object (default: {Config()})
         """
         dependencies_folder = os.path.join(folder_path, '.dependencies')
-        plugin_folder = os.path.join(dependencies_folder, 'plugin')
-        recipes_folder = os.path.join(dependencies_folder, 'recipe')
+        lock_path = os.path.join(dependencies_folder, '.lock.json')
 
-        if not os.path.isdir(dependencies_folder):
-            os.makedirs(dependencies_folder, exist_ok=True)
+        for kind in DependencyKind:
+            os.makedirs(os.path.join(dependencies_folder, kind.value), exist_ok=True)
 
-        if not os.path.isdir(plugin_folder):
-            os.makedirs(plugin_folder, exist_ok=True)
+        try:
+            with open(lock_path, 'r') as f:
+                lock = json.load(f)
+        except (OSError, ValueError):
+            lock = {}
 
-        if not os.path.isdir(recipes_folder):
-            os.makedirs(recipes_folder, exist_ok=True)
+        synced = {}
 
         for dependency in self.dependencies:
+            lock_key = f'{dependency.dependency_kind}/{dependency.ref_name}'
+            dependency_path = os.path.join(dependencies_folder, lock_key)
+
+            def is_synced(digest):
+                return lock.get(lock_key) == digest and \
+                    os.path.isdir(dependency_path) and \
+                    not os.path.islink(dependency_path)
+
+            if dependency.is_locked and is_synced(dependency.digest):
+                synced[lock_key] = dependency.digest
+                continue
+
             auth_header = config.get_auth_header(
                 repository_url=dependency.source)
             package_version = dependency.fetch(auth_header=auth_header)
-            dep = package_version.manifest
 
-            if dependency.kind == DependencyKind.recipe:
-                dep.write_dependencies(
-                    folder_path=os.path.join(
-                        recipes_folder, dependency.ref_name),
+            if not is_synced(package_version.digest):
+                self._write_dependency(
+                    folder_path=dependency_path,
+                    package_version=package_version,
                     config=config,
                 )
 
+            synced[lock_key] = package_version.digest
+
+        for kind in DependencyKind:
+            kind_folder = os.path.join(dependencies_folder, kind.value)
+            for name in os.listdir(kind_folder):
+                if f'{kind.value}/{name}' not in synced:
+                    _remove_path(os.path.join(kind_folder, name))
+
+        temp_lock_path = f'{lock_path}.tmp'
+        with open(temp_lock_path, 'w') as f:
+            json.dump(synced, f)
+        os.replace(temp_lock_path, lock_path)
+
+    @staticmethod
+    def _write_dependency(folder_path: str, package_version: 'PackageVersion',
+                          config: Config = Config()):
+        """Write a dependency folder and replace the existing folder if any
+
+        Arguments:
+            folder_path {str} -- Path to the dependency folder
+            package_version {PackageVersion} -- The fetched dependency package
+
+        Keyword Arguments:
+            config {Config} -- A queenbee config object (default: {Config()})
+        """
+        parent_folder, name = os.path.split(folder_path)
+        temp_path = tempfile.mkdtemp(dir=parent_folder, prefix=f'.{name}-')
+
+        try:
+            dep = package_version.manifest
+
+            if isinstance(dep, Recipe):
+                dep.write_dependencies(folder_path=temp_path, config=config)
+
             dep.to_folder(
-                folder_path=os.path.join(
-                    folder_path, '.dependencies',
-                    dependency.dependency_kind, dependency.ref_name),
+                folder_path=temp_path,
                 readme_string=package_version.readme
             )
 
+            if os.path.isdir(folder_path) and not os.path.islink(folder_path):
+                old_path = f'{temp_path}-old'
+                os.replace(folder_path, old_path)
+                os.replace(temp_path, folder_path)
+                shutil.rmtree(old_path)
+            else:
+                _remove_path(folder_path)
+                os.replace(temp_path, folder_path)
+        except BaseException:
+            _remove_path(temp_path)
+            raise
+
 
 class BakedRecipe(Recipe):
     """Baked Recipe.
@@ -390,15 +474,34 @@ class BakedRecipe(Recipe):
         description='A list of templates. Templates can be Function or a DAG.'
     )
 
+    _template_lookup: Dict[str, Union[TemplateFunction, DAG]] = PrivateAttr(None)
+
     @classmethod
-    def from_recipe(cls, recipe: Recipe, config: Config = Config()):
+    @digest_scope()
+    def from_recipe(cls, recipe: Recipe, config: Config = Config(),
+                    max_workers: int = None, use_cache: bool = True,
+                    resolver: DependencyResolver = None):
         """Bake a recipe
 
+        The dependencies of the recipe, and the dependencies of its sub-recipes, are
+        fetched concurrently. The templates are added to the baked recipe in the same
+        order as the dependencies regardless of which one is fetched first. A
+        dependency used by several sub-recipes is only fetched and baked once.
+
+        Recipes with locked dependencies are baked once and then read from the local
+        bake cache. This applies to sub-recipes as well.
+
         Arguments:
             recipe {Recipe} -- A Queenbee recipe
 
         Keyword Arguments:
             config {Config} -- A queenbee config object (default: {Config()})
+            max_workers {int} -- Maximum number of dependencies fetched at the same
+                time for each recipe. Use the ThreadPoolExecutor default if None
+                (default: {None})
+            use_cache {bool} -- Use the local bake cache (default: {True})
+            resolver {DependencyResolver} -- The resolver shared by the recipe and its
+                sub-recipes. A new one is created if None (default: {None})
 
         Raises:
             ValueError: The dependencies or templates do not match the flow
@@ -406,10 +509,21 @@ class BakedRecipe(Recipe):
         Returns:
             BakedRecipe -- A baked recipe
         """
+        # the recipe may have been changed since it was last hashed in this scope
+        digest = recipe.hash_digest(cached=False)
 
-        recipe = recipe.copy(deep=True)
+        cache_key = bake_cache.key('recipe', digest, recipe.dependencies) \
+            if use_cache else None
+
+        if cache_key is not None:
+            baked_recipe = bake_cache.get_recipe(cache_key, digest)
+            if baked_recipe is not None:
+                return baked_recipe
 
-        digest = recipe.__hash__
+        if resolver is None:
+            resolver = DependencyResolver()
+
+        recipe = recipe.copy(deep=True)
 
         digest_dict = {
             '__self__': digest
@@ -417,26 +531,28 @@ class BakedRecipe(Recipe):
 
         templates = []
 
-        for dependency in recipe.dependencies:
-            auth_header = config.get_auth_header(
-                repository_url=dependency.source)
-            package_version = dependency.fetch(auth_header=auth_header)
-            dep = package_version.manifest
-
-            if dependency.kind == DependencyKind.recipe:
-                sub_recipe = cls.from_recipe(recipe=dep, config=config)
-
-                templates.extend(sub_recipe.templates)
-                templates.extend(sub_recipe.flow)
-                digest_dict[dependency.ref_name] = sub_recipe.digest
+        def bake_dependency(dependency):
+            # dependencies are shared by digest so unlocked ones are locked first
+            dependency.lock(
+                auth_header=config.get_auth_header(repository_url=dependency.source)
+            )
+            return resolver.resolve(
+                dependency,
+                lambda: cls._bake_dependency(
+                    dependency=dependency, config=config, max_workers=max_workers,
+                    use_cache=use_cache, resolver=resolver,
+                )
+            )
 
-            elif dependency.kind == DependencyKind.plugin:
-                templates.extend(TemplateFunction.from_plugin(dep))
-                digest_dict[dependency.ref_name] = dep.__hash__
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            baked_dependencies = list(executor.map(
+                bake_dependency, recipe.dependencies
+            ))
 
-            else:
-                raise ValueError(
-                    f'Dependency of type {dependency.kind} not recognized')
+        for dependency, (dep_templates, dep_digest) in \
+                zip(recipe.dependencies, baked_dependencies):
+            templates.extend(dep_templates)
+            digest_dict[dependency.ref_name] = dep_digest
 
         flow = cls.replace_template_refs(
             dependencies=recipe.dependencies,
@@ -444,17 +560,106 @@ class BakedRecipe(Recipe):
             digest_dict=digest_dict,
         )
 
-        input_dict = recipe.to_dict()
-        input_dict['type'] = 'BakedRecipe'
-        input_dict['digest'] = digest
-        input_dict['flow'] = [dag.to_dict() for dag in flow]
-        input_dict['templates'] = [template.to_dict()
-                                   for template in templates]
+        baked_recipe = cls._from_parts(
+            recipe=recipe, digest=digest, flow=flow, templates=templates
+        )
+
+        if cache_key is not None:
+            bake_cache.add_recipe(cache_key, baked_recipe)
+
+        return baked_recipe
+
+    @classmethod
+    def _from_parts(
+        cls,
+        recipe: Recipe,
+        digest: str,
+        flow: List[DAG],
+        templates: List[Union[TemplateFunction, DAG]],
+    ) -> 'BakedRecipe':
+        """Assemble a baked recipe from validated objects
+
+        The recipe, DAGs and templates are already validated so they are reused as
+        is and only the validators that check them against each other are run.
+
+        Arguments:
+            recipe {Recipe} -- The recipe being baked
+            digest {str} -- The digest of the recipe
+            flow {List[DAG]} -- The recipe DAGs with their template refs replaced
+            templates {List[Union[TemplateFunction, DAG]]} -- The templates of the
+                recipe dependencies
+
+        Raises:
+            ValidationError: The templates do not match the flow
+
+        Returns:
+            BakedRecipe -- A baked recipe
+        """
+        values = {field: getattr(recipe, field) for field in recipe.__fields__}
+        values['type'] = 'BakedRecipe'
+        values['digest'] = digest
+
+        try:
+            values['templates'] = cls.remove_duplicates(templates)
+            flow = cls.check_entrypoint(flow)
+            flow = cls.check_dag_names(flow, values)
+            values['flow'] = cls.sort_list(flow)
+            values = cls.check_inputs(values)
+        except (ValueError, TypeError, AssertionError) as error:
+            raise ValidationError([ErrorWrapper(error, loc=ROOT_KEY)], cls)
 
-        return cls.parse_obj(input_dict)
+        return cls.construct(**values)
 
     @classmethod
-    def from_folder(cls, folder_path: str, refresh_deps: bool = True, config: Config = Config()):
+    def _bake_dependency(
+        cls,
+        dependency: Dependency,
+        config: Config,
+        max_workers: int = None,
+        use_cache: bool = True,
+        resolver: DependencyResolver = None,
+    ) -> Tuple[List[Union[TemplateFunction, DAG]], str]:
+        """Fetch a dependency and generate its templates
+
+        Arguments:
+            dependency {Dependency} -- A recipe dependency
+            config {Config} -- A queenbee config object
+
+        Keyword Arguments:
+            max_workers {int} -- Maximum number of dependencies fetched at the same
+                time when baking a sub-recipe (default: {None})
+            use_cache {bool} -- Use the local bake cache for sub-recipes
+                (default: {True})
+            resolver {DependencyResolver} -- The resolver used for the dependencies
+                of sub-recipes (default: {None})
+
+        Raises:
+            ValueError: The dependency kind is not recognized
+
+        Returns:
+            List[Union[TemplateFunction, DAG]] -- The templates of the dependency
+            str -- The digest of the dependency
+        """
+        auth_header = config.get_auth_header(repository_url=dependency.source)
+        package_version = dependency.fetch(auth_header=auth_header)
+        dep = package_version.manifest
+
+        if dependency.kind == DependencyKind.recipe:
+            sub_recipe = cls.from_recipe(
+                recipe=dep, config=config, max_workers=max_workers,
+                use_cache=use_cache, resolver=resolver,
+            )
+            return sub_recipe.templates + sub_recipe.flow, sub_recipe.digest
+
+        elif dependency.kind == DependencyKind.plugin:
+            return TemplateFunction.from_plugin(dep), dep.hash_digest()
+
+        raise ValueError(f'Dependency of type {dependency.kind} not recognized')
+
+    @classmethod
+    @digest_scope()
+    def from_folder(cls, folder_path: str, refresh_deps: bool = True,
+                    config: Config = Config(), use_cache: bool = True):
         """Generate a baked recipe from a recipe folder
 
         Note:
@@ -481,6 +686,9 @@ class BakedRecipe(Recipe):
             refresh_deps {bool} -- Fetch the dependencies from their source instead of
                 the ``.dependencies`` folder (default: {True})
             config {Config} -- A queenbee config object (default: {Config()})
+            use_cache {bool} -- Read and store the baked recipe in the local bake
+                cache. The cache is only used if all the dependencies are locked and
+                none of them is linked (default: {True})
 
         Returns:
             BakedRecipe -- A baked recipe
@@ -489,21 +697,28 @@ class BakedRecipe(Recipe):
 
         recipe = Recipe.from_folder(folder_path)
 
-        digest = recipe.__hash__
+        digest = recipe.hash_digest(cached=False)
 
         digest_dict = {
             '__self__': digest
         }
 
         if refresh_deps:
-            if os.path.exists(dependencies_folder) and \
-                    os.path.isdir(dependencies_folder):
-                shutil.rmtree(dependencies_folder)
             recipe.write_dependencies(
                 folder_path=folder_path,
                 config=config,
             )
 
+        # linked dependencies are edited locally so their content is not locked
+        cache_key = None
+        if use_cache and not cls._has_linked_dependencies(dependencies_folder):
+            cache_key = bake_cache.key('folder', digest, recipe.dependencies)
+
+        if cache_key is not None:
+            baked_recipe = bake_cache.get_recipe(cache_key, digest)
+            if baked_recipe is not None:
+                return baked_recipe
+
         templates = []
 
         plugins_folder = os.path.join(dependencies_folder, 'plugin')
@@ -515,7 +730,7 @@ class BakedRecipe(Recipe):
                     )
                 )
                 templates.extend(TemplateFunction.from_plugin(plugin))
-                digest_dict[plugin_dep_name] = plugin.__hash__
+                digest_dict[plugin_dep_name] = plugin.hash_digest()
 
         recipes_folder = os.path.join(dependencies_folder, 'recipe')
         if os.path.isdir(recipes_folder):
@@ -526,6 +741,7 @@ class BakedRecipe(Recipe):
                     ),
                     refresh_deps=refresh_deps,
                     config=config,
+                    use_cache=use_cache,
                 )
 
                 templates.extend(sub_baked_recipe.templates)
@@ -538,14 +754,32 @@ class BakedRecipe(Recipe):
             digest_dict=digest_dict,
         )
 
-        input_dict = recipe.to_dict()
-        input_dict['type'] = 'BakedRecipe'
-        input_dict['digest'] = digest
-        input_dict['flow'] = [dag.to_dict() for dag in flow]
-        input_dict['templates'] = [template.to_dict()
-                                   for template in templates]
+        baked_recipe = cls._from_parts(
+            recipe=recipe, digest=digest, flow=flow, templates=templates
+        )
+
+        if cache_key is not None:
+            bake_cache.add_recipe(cache_key, baked_recipe)
+
+        return baked_recipe
+
+    @staticmethod
+    def _has_linked_dependencies(dependencies_folder: str) -> bool:
+        """Check whether a dependencies folder contains symbolic links
 
-        return cls.parse_obj(input_dict)
+        Arguments:
+            dependencies_folder {str} -- Path to the ``.dependencies`` folder of a
+                recipe
+
+        Returns:
+            bool -- True if a dependency (or a nested dependency) is a link
+        """
+        for root, dirs, files in os.walk(dependencies_folder):
+            for name in dirs + files:
+                if os.path.islink(os.path.join(root, name)):
+                    return True
+
+        return False
 
     @classmethod
     def replace_template_refs(
@@ -630,11 +864,11 @@ class BakedRecipe(Recipe):
     @validator('templates')
     def remove_duplicates(cls, v):
         """Remove duplicated templates by name"""
-        temp_names = []
+        temp_names = set()
         templates = []
         for template in v:
             if template.name not in temp_names:
-                temp_names.append(template.name)
+                temp_names.add(template.name)
                 templates.append(template)
 
         return templates
@@ -645,26 +879,54 @@ class BakedRecipe(Recipe):
         flow = values.get('flow')
         templates = values.get('templates')
 
-        all_templates = templates + flow
+        lookup = cls.template_lookup(templates + flow)
 
         for dag in flow:
             for task in dag.tasks:
-                template = cls.template_by_name(all_templates, task.template)
+                template = cls.template_by_name(lookup, task.template)
                 task.check_template(template)
 
         return values
 
+    def __setattr__(self, name, value):
+        if name in ('templates', 'flow'):
+            self._template_lookup = None
+        super(BakedRecipe, self).__setattr__(name, value)
+
     @property
     def root_dag(self) -> DAG:
         return self.dag_by_name(flow=self.flow, name=f'{self.digest}/main')
 
     @staticmethod
-    def template_by_name(templates: List[Union[DAG, TemplateFunction]], name: str) -> Union[DAG, TemplateFunction]:
-        """Retrieve a template from a list by name
+    def template_lookup(
+        templates: List[Union[DAG, TemplateFunction]]
+    ) -> Dict[str, Union[DAG, TemplateFunction]]:
+        """Generate a lookup table of templates by name
+
+        The first template is kept if several templates share the same name.
 
         Arguments:
             templates {List[Union[DAG, TemplateFunction]]} -- A list of templates
-            name {str} -- The name to retrieve a template byt
+
+        Returns:
+            Dict[str, Union[DAG, TemplateFunction]] -- A dictionary of templates
+                keyed by name
+        """
+        lookup = {}
+
+        for template in templates:
+            lookup.setdefault(template.name, template)
+
+        return lookup
+
+    def get_template(self, name: str) -> Union[DAG, TemplateFunction]:
+        """Retrieve a template or a DAG of the baked recipe by name
+
+        The lookup table is built the first time a template is retrieved and is
+        rebuilt if the templates or the flow of the recipe are replaced.
+
+        Arguments:
+            name {str} -- The name of the template (ie: ``{digest}/{name}``)
 
         Raises:
             ValueError: Template not found
@@ -672,8 +934,34 @@ class BakedRecipe(Recipe):
         Returns:
             Union[DAG, TemplateFunction] -- A template
         """
+        if self._template_lookup is None:
+            self._template_lookup = self.template_lookup(self.templates + self.flow)
 
-        res = next(filter(lambda x: x.name == name, templates), None)
+        return self.template_by_name(self._template_lookup, name)
+
+    @staticmethod
+    def template_by_name(
+        templates: Union[List[Union[DAG, TemplateFunction]],
+                         Dict[str, Union[DAG, TemplateFunction]]],
+        name: str
+    ) -> Union[DAG, TemplateFunction]:
+        """Retrieve a template from a list or a lookup table by name
+
+        Arguments:
+            templates {Union[List, Dict]} -- A list of templates or a lookup table
+                generated with ``template_lookup``
+            name {str} -- The name to retrieve a template byt
+
+        Raises:
+            ValueError: Template not found
+
+        Returns:
+            Union[DAG, TemplateFunction] -- A template
+        """
+        if isinstance(templates, dict):
+            res = templates.get(name)
+        else:
+            res = next(filter(lambda x: x.name == name, templates), None)
 
         if res is None:
             raise ValueError(f'No dependency with reference name {name} found')
@@ -724,3 +1012,19 @@ class RecipeInterface(BaseModel):
             inputs=recipe.inputs,
             outputs=recipe.outputs
         )
+
+    def validate_job_arguments(
+        self, jobs: List[List[Union[JobArguments, Dict]]]
+    ) -> List[List[str]]:
+        """Validate the arguments of many jobs against the recipe inputs
+
+        Arguments:
+            jobs {List[List[Union[JobArguments, Dict]]]} -- A set of job arguments
+                for each job. Arguments can be JobArgument and JobPathArgument objects
+                or dictionaries
+
+        Returns:
+            List[List[str]] -- The error messages for each job in the same order as
+                the input jobs. A job with valid arguments has an empty list.
+        """
+        return JobArgumentsValidator(self.inputs).validate_many(jobs)
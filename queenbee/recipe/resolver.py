@@ -0,0 +1,65 @@
+"""Shared resolution of recipe dependencies."""
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable
+
+from .dependency import Dependency
+
+
+class DependencyResolver:
+    """Resolve each dependency of a recipe hierarchy exactly once
+
+    Dependencies are keyed by their source, kind, name and digest (or tag if the
+    dependency is not locked). The first caller resolving a key does the work and any
+    other caller, including callers in other threads, waits for and reuses its
+    result. Dependencies shared by several sub-recipes are therefore only fetched and
+    baked once.
+    """
+
+    def __init__(self):
+        self._results: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(dependency: Dependency) -> Hashable:
+        """Get the key of a dependency
+
+        Arguments:
+            dependency {Dependency} -- A recipe dependency
+
+        Returns:
+            Hashable -- The key identifying the dependency package
+        """
+        version = dependency.digest if dependency.is_locked else dependency.tag
+        return (
+            dependency.source.rstrip('/'), dependency.kind.value, dependency.name,
+            version
+        )
+
+    def resolve(self, dependency: Dependency, resolve: Callable[[], Any]) -> Any:
+        """Resolve a dependency once
+
+        Arguments:
+            dependency {Dependency} -- A recipe dependency
+            resolve {Callable[[], Any]} -- The function resolving the dependency. It
+                is only called for the first dependency with a given key
+
+        Returns:
+            Any -- The value returned by the resolve function
+        """
+        key = self.key(dependency)
+
+        with self._lock:
+            future = self._results.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._results[key] = future
+
+        if is_owner:
+            try:
+                future.set_result(resolve())
+            except BaseException as error:
+                future.set_exception(error)
+
+        return future.result()
@@ -0,0 +1,361 @@
+"""Local cache for packages fetched from Queenbee repositories."""
+import os
+import time
+import asyncio
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Dict
+from urllib.error import HTTPError
+from urllib.parse import urlparse, urljoin
+from urllib.request import url2pathname
+
+from ..base.cache import FileCache, DEFAULT_CACHE_FOLDER, DEFAULT_MAX_SIZE
+from ..base.request import make_request
+from .search import SearchIndex
+
+
+def _auth_key(auth_header: Dict[str, str]) -> str:
+    """Fingerprint an authorization header so it is not kept in memory as is."""
+    if not auth_header:
+        return None
+    return hashlib.sha256(
+        json.dumps(sorted(auth_header.items())).encode('utf-8')
+    ).hexdigest()
+
+
+class PackageCache(FileCache):
+    """A content addressed cache of packaged Plugins and Recipes
+
+    Package tarballs are stored as ``<digest>.tgz`` files and the parsed package
+    versions are kept in memory so the same package is only untarred and validated
+    once per process. The digest of a package is re-computed from its
+    ``resource.json`` file every time it is read from disk and entries that do not
+    match their digest are evicted.
+
+    Packages downloaded with an authorization header are stored as
+    ``<digest>-<fingerprint>.tgz`` where the fingerprint is a hash of the header. They
+    are only returned to callers sending the same header so a private package is
+    never served to a caller that was not allowed to download it. Packages
+    downloaded without credentials are shared by all callers.
+
+    Keyword Arguments:
+        folder {str} -- Path to the cache folder (default: {None})
+        max_size {int} -- Maximum size of the cache folder in bytes
+            (default: {DEFAULT_MAX_SIZE})
+        max_parsed {int} -- Maximum number of parsed package versions to keep in
+            memory (default: {128})
+    """
+
+    def __init__(self, folder: str = None, max_size: int = DEFAULT_MAX_SIZE,
+                 max_parsed: int = 128):
+        if folder is None:
+            folder = os.path.join(DEFAULT_CACHE_FOLDER, 'packages')
+        super(PackageCache, self).__init__(
+            folder=folder, extension='.tgz', max_size=max_size
+        )
+        self.max_parsed = max_parsed
+        self._parsed = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(digest: str, auth_header: Dict[str, str] = None) -> str:
+        """Get the cache key of a package downloaded with an authorization header
+
+        Arguments:
+            digest {str} -- The digest of the package resource
+
+        Keyword Arguments:
+            auth_header {Dict[str, str]} -- The authorization header used to
+                download the package (default: {None})
+
+        Returns:
+            str -- The cache key of the package
+        """
+        auth_key = _auth_key(auth_header)
+        if auth_key is None:
+            return digest
+        return f'{digest}-{auth_key}'
+
+    def get_package(self, digest: str,
+                    auth_header: Dict[str, str] = None) -> 'PackageVersion':
+        """Retrieve a package version by its digest
+
+        Arguments:
+            digest {str} -- The digest of the package resource
+
+        Keyword Arguments:
+            auth_header {Dict[str, str]} -- The authorization header of the caller.
+                Packages downloaded with a different header are not returned
+                (default: {None})
+
+        Returns:
+            PackageVersion -- A copy of the cached package version (or None if the
+                package is not cached or its cached file is corrupted)
+        """
+        from .package import PackageVersion
+
+        key = self.key(digest, auth_header)
+
+        with self._lock:
+            version = self._parsed.get(key)
+            if version is not None:
+                self._parsed.move_to_end(key)
+
+        if version is None:
+            path = self.path(key)
+
+            try:
+                f = open(path, 'rb')
+                os.utime(path)
+            except OSError:
+                return None
+
+            try:
+                with f:
+                    version = PackageVersion.unpack_tar(tar_file=f, digest=digest)
+            except Exception:
+                self.remove(key)
+                return None
+
+            self._remember(key, version)
+
+        return version.copy(deep=True)
+
+    def add_package(self, data: bytes, version: 'PackageVersion',
+                    auth_header: Dict[str, str] = None):
+        """Add a package to the cache
+
+        Arguments:
+            data {bytes} -- The gzipped tar file of the package
+            version {PackageVersion} -- The package version read from the tar file
+
+        Keyword Arguments:
+            auth_header {Dict[str, str]} -- The authorization header used to
+                download the package (default: {None})
+        """
+        key = self.key(version.digest, auth_header)
+        self.set(key, data)
+        self._remember(key, version.copy(deep=True))
+
+    def add_package_file(self, file_path: str, version: 'PackageVersion',
+                         auth_header: Dict[str, str] = None):
+        """Move a downloaded package file into the cache
+
+        Arguments:
+            file_path {str} -- Path to the gzipped tar file of the package. The file
+                must be created with ``temp_file``
+            version {PackageVersion} -- The package version read from the tar file
+
+        Keyword Arguments:
+            auth_header {Dict[str, str]} -- The authorization header used to
+                download the package (default: {None})
+        """
+        key = self.key(version.digest, auth_header)
+        self.add_file(key, file_path)
+        self._remember(key, version.copy(deep=True))
+
+    def remove(self, key: str):
+        with self._lock:
+            self._parsed.pop(key, None)
+        super(PackageCache, self).remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._parsed.clear()
+        super(PackageCache, self).clear()
+
+    def _remember(self, key: str, version: 'PackageVersion'):
+        with self._lock:
+            self._parsed[key] = version
+            self._parsed.move_to_end(key)
+            while len(self._parsed) > self.max_parsed:
+                self._parsed.popitem(last=False)
+
+
+class _IndexEntry:
+
+    __slots__ = ('index', 'fetched', 'etag', 'last_modified', 'mtime')
+
+    def __init__(self, index, fetched, etag=None, last_modified=None, mtime=None):
+        self.index = index
+        self.fetched = fetched
+        self.etag = etag
+        self.last_modified = last_modified
+        self.mtime = mtime
+
+
+class IndexCache:
+    """A per process cache of repository indexes keyed by url and credentials
+
+    Parsed indexes are reused for ``ttl`` seconds. Once expired, remote indexes are
+    revalidated with a conditional request (``If-None-Match`` and
+    ``If-Modified-Since``) and only downloaded and parsed again if they changed.
+    Local indexes (``file:`` urls) are only parsed again when the modification time
+    of the file changes. The search index saved next to an index is used to search
+    it. Remote search indexes are only downloaded the first time an index is searched.
+
+    Indexes fetched with an authorization header are only returned to callers
+    sending the same header. The returned indexes are shared by all the callers and
+    must not be modified. Use ``copy(deep=True)`` to get an index that can be.
+
+    Keyword Arguments:
+        ttl {float} -- Number of seconds a remote index is used without being
+            revalidated (default: {60})
+    """
+
+    def __init__(self, ttl: float = 60):
+        self.ttl = ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def _lookup(self, key: tuple, url: str):
+        """Get the cached entry of an index and the request headers to refresh it
+
+        Returns:
+            _IndexEntry -- The cached entry (or None if the index is not cached)
+            bool -- True if the cached entry can be used without a request
+            Dict[str, str] -- Conditional request headers to revalidate the entry
+            int -- The modification time of a local index file (or None)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+        headers = {}
+
+        if url.startswith('file:'):
+            mtime = os.stat(url2pathname(urlparse(url).path)).st_mtime_ns
+            return entry, entry is not None and entry.mtime == mtime, headers, mtime
+
+        if entry is None:
+            return entry, False, headers, None
+
+        if time.time() - entry.fetched < self.ttl:
+            return entry, True, headers, None
+
+        if entry.etag is not None:
+            headers['If-None-Match'] = entry.etag
+        if entry.last_modified is not None:
+            headers['If-Modified-Since'] = entry.last_modified
+
+        return entry, False, headers, None
+
+    def _store(self, key: tuple, url: str, validate: bool, res, mtime: int = None,
+               auth_header: Dict[str, str] = {}) -> 'RepositoryIndex':
+        """Parse a fetched index and add it to the cache"""
+        from .index import RepositoryIndex
+
+        parse = RepositoryIndex.parse_raw if validate else RepositoryIndex.from_trusted
+
+        index = parse(res.read())
+
+        # build the package lookup tables now so threads sharing the index only
+        # ever read them
+        for kind in ('plugin', 'recipe'):
+            for name in getattr(index, kind):
+                index._package_lookup(kind, name)
+
+        if mtime is not None:
+            # reuse the search index saved next to a local index file
+            index.load_search_index(os.path.dirname(url2pathname(urlparse(url).path)))
+            entry = _IndexEntry(index=index, fetched=time.time(), mtime=mtime)
+        else:
+            # download the search index saved next to a remote index when searched
+            index.set_search_index_url(urljoin(url, SearchIndex.file_name), auth_header)
+            entry = _IndexEntry(
+                index=index,
+                fetched=time.time(),
+                etag=res.headers.get('ETag'),
+                last_modified=res.headers.get('Last-Modified'),
+            )
+
+        with self._lock:
+            self._entries[key] = entry
+
+        return index
+
+    def fetch(self, url: str, auth_header: Dict[str, str] = {},
+              validate: bool = True) -> 'RepositoryIndex':
+        """Fetch a repository index
+
+        Arguments:
+            url {str} -- The url of the ``index.json`` file
+
+        Keyword Arguments:
+            auth_header {Dict[str, str]} -- An authorization header to use when
+                fetching the index
+            validate {bool} -- Validate the index. Use False to load trusted indexes
+                faster with ``RepositoryIndex.from_trusted`` (default: {True})
+
+        Returns:
+            RepositoryIndex -- The repository index. It is shared with the other
+                callers and must not be modified
+        """
+        key = (url, validate, _auth_key(auth_header))
+        entry, fresh, headers, mtime = self._lookup(key, url)
+
+        if fresh:
+            return entry.index
+
+        try:
+            res = make_request(url=url, auth_header=auth_header, headers=headers)
+        except HTTPError as error:
+            if error.code != 304 or entry is None:
+                raise error
+            entry.fetched = time.time()
+            return entry.index
+
+        return self._store(key, url, validate, res, mtime, auth_header)
+
+    async def afetch(self, url: str, auth_header: Dict[str, str] = {},
+                     validate: bool = True) -> 'RepositoryIndex':
+        """Fetch a repository index without blocking the event loop
+
+        This is the asynchronous counterpart of ``fetch`` and shares the same cached
+        indexes. Indexes are parsed in the default executor of the event loop. It
+        requires aiohttp.
+
+        Arguments:
+            url {str} -- The url of the ``index.json`` file
+
+        Keyword Arguments:
+            auth_header {Dict[str, str]} -- An authorization header to use when
+                fetching the index
+            validate {bool} -- Validate the index. Use False to load trusted indexes
+                faster with ``RepositoryIndex.from_trusted`` (default: {True})
+
+        Returns:
+            RepositoryIndex -- The repository index. It is shared with the other
+                callers and must not be modified
+        """
+        from ..base.async_request import amake_request
+
+        loop = asyncio.get_running_loop()
+        key = (url, validate, _auth_key(auth_header))
+        entry, fresh, headers, mtime = self._lookup(key, url)
+
+        if fresh:
+            return entry.index
+
+        try:
+            res = await amake_request(url=url, auth_header=auth_header, headers=headers)
+        except HTTPError as error:
+            if error.code != 304 or entry is None:
+                raise error
+            entry.fetched = time.time()
+            return entry.index
+
+        return await loop.run_in_executor(
+            None, self._store, key, url, validate, res, mtime, auth_header
+        )
+
+    def clear(self):
+        """Remove all the indexes from the cache"""
+        with self._lock:
+            self._entries.clear()
+
+
+package_cache = PackageCache()
+
+index_cache = IndexCache()
@@ -1,7 +1,11 @@
 import os
-from typing import List, Union, Dict
+import json
+from typing import List, Union, Dict, Iterator, Tuple
 from datetime import datetime
-from pydantic import Field, root_validator, validator, constr
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor
+from pydantic import Field, PrivateAttr, root_validator, validator, constr
+from pydantic.datetime_parse import parse_datetime
 
 from ..base.basemodel import BaseModel
 
@@ -9,6 +13,8 @@ from ..plugin import Plugin
 from ..recipe import Recipe
 
 from .package import PackageVersion
+from .manifest import IndexManifest
+from .search import SearchIndex
 
 
 class RepositoryMetadata(BaseModel):
@@ -41,6 +47,101 @@ class RepositoryMetadata(BaseModel):
     )
 
 
+class PackageLookup:
+    """Hash indexes of the package versions of one kind (plugin or recipe)
+
+    Package versions are indexed by ``(name, tag)`` and ``(name, digest)`` and the
+    latest version of each package is kept so retrieving a package version does not
+    require scanning or sorting its version list. Packages are indexed the first
+    time they are looked up.
+    """
+
+    __slots__ = ('_tags', '_digests', '_latest')
+
+    def __init__(self):
+        self._tags = {}
+        self._digests = {}
+        self._latest = {}
+
+    def __deepcopy__(self, memo):
+        # a copied index holds copies of the package versions so the lookup
+        # tables are rebuilt for it instead of pointing at the original versions
+        return PackageLookup()
+
+    def __reduce__(self):
+        return (PackageLookup, ())
+
+    def is_indexed(self, name: str) -> bool:
+        """Check whether the versions of a package are indexed
+
+        Arguments:
+            name {str} -- The name of the package
+
+        Returns:
+            bool -- True if the package versions are indexed
+        """
+        return name in self._latest
+
+    def index(self, name: str, package_versions: List['PackageVersion']):
+        """Index all the versions of a package
+
+        Arguments:
+            name {str} -- The name of the package
+            package_versions {List[PackageVersion]} -- The versions of the package
+        """
+        self.discard(name)
+
+        for package_version in package_versions:
+            self._tags.setdefault((name, package_version.tag), package_version)
+            self._digests.setdefault((name, package_version.digest), package_version)
+
+        self._latest[name] = RepositoryIndex.get_latest(package_versions)
+
+    def add(self, package_version: 'PackageVersion',
+            package_versions: List['PackageVersion']):
+        """Add a package version to the indexes
+
+        Arguments:
+            package_version {PackageVersion} -- The new package version
+            package_versions {List[PackageVersion]} -- All the versions of the
+                package including the new one
+        """
+        name = package_version.name
+
+        if not self.is_indexed(name) or (name, package_version.tag) in self._tags:
+            self.index(name, package_versions)
+            return
+
+        self._tags[(name, package_version.tag)] = package_version
+        self._digests.setdefault((name, package_version.digest), package_version)
+
+        latest = self._latest[name]
+        if latest is None or package_version.created >= latest.created:
+            self._latest[name] = package_version
+
+    def discard(self, name: str):
+        """Remove a package from the indexes
+
+        Arguments:
+            name {str} -- The name of the package
+        """
+        if name not in self._latest:
+            return
+
+        del self._latest[name]
+        self._tags = {k: v for k, v in self._tags.items() if k[0] != name}
+        self._digests = {k: v for k, v in self._digests.items() if k[0] != name}
+
+    def by_tag(self, name: str, tag: str) -> 'PackageVersion':
+        return self._tags.get((name, tag))
+
+    def by_digest(self, name: str, digest: str) -> 'PackageVersion':
+        return self._digests.get((name, digest))
+
+    def latest(self, name: str) -> 'PackageVersion':
+        return self._latest.get(name)
+
+
 class RepositoryIndex(BaseModel):
     """A searchable index for a Queenbee Plugin and Recipe repository"""
     api_version: constr(regex='^v1beta1$') = Field('v1beta1', readOnly=True)
@@ -69,6 +170,15 @@ class RepositoryIndex(BaseModel):
         ' list of recipesversions'
     )
 
+    _lookup: Dict[str, PackageLookup] = PrivateAttr(
+        default_factory=lambda: {'plugin': PackageLookup(), 'recipe': PackageLookup()}
+    )
+
+    _search: SearchIndex = PrivateAttr(None)
+
+    # the url and authorization header of a search index to download when needed
+    _search_source: tuple = PrivateAttr(None)
+
     @validator('plugin')
     def set_plugin_type(cls, v):
         for _, package in v.items():
@@ -112,7 +222,8 @@ class RepositoryIndex(BaseModel):
         return values
 
     @classmethod
-    def from_folder(cls, folder_path):
+    def from_folder(cls, folder_path, use_index_manifest: bool = False,
+                    jobs: int = 1):
         """Generate a Repository Index from a folder
 
         This will scrape the folder for plugin and recipe packages and
@@ -121,6 +232,13 @@ class RepositoryIndex(BaseModel):
         Arguments:
             folder_path {str} -- Path to a repository folder
 
+        Keyword Arguments:
+            use_index_manifest {bool} -- Read and update the sidecar manifest of the
+                folder so packages that did not change since the folder was last
+                indexed are not unpacked again (default: {False})
+            jobs {int} -- Number of processes used to read the packages
+                (default: {1})
+
         Returns:
             RepositoryIndex -- An index generated from packages in the folder
         """
@@ -130,25 +248,19 @@ class RepositoryIndex(BaseModel):
 
         index.metadata.name = tail
 
-        plugins_folder = os.path.join(folder_path, 'plugins')
-        recipes_folder = os.path.join(folder_path, 'recipes')
+        manifest = IndexManifest.from_folder(folder_path) \
+            if use_index_manifest else None
 
-        if os.path.exists(plugins_folder):
-            for package in os.listdir(plugins_folder):
-                package_path = os.path.join(folder_path, 'plugins', package)
-                resource_version = PackageVersion.from_package(package_path)
-                resource_version.url = \
-                    os.path.join('plugins', package).replace('\\', '/')
+        for kind, resource_version, _ in cls._read_folder(
+                folder_path, manifest, jobs):
+            if kind == 'plugin':
                 index.index_plugin_version(resource_version)
-
-        if os.path.exists(recipes_folder):
-            for package in os.listdir(recipes_folder):
-                package_path = os.path.join(folder_path, 'recipes', package)
-                resource_version = PackageVersion.from_package(package_path)
-                resource_version.url = \
-                    os.path.join('recipes', package).replace('\\', '/')
+            else:
                 index.index_recipe_version(resource_version)
 
+        if manifest is not None:
+            manifest.to_folder(folder_path)
+
         index.generated = datetime.utcnow()
 
         cls.add_slugs(
@@ -166,6 +278,128 @@ class RepositoryIndex(BaseModel):
 
         return index
 
+    @staticmethod
+    def _read_folder(
+        folder_path: str,
+        manifest: IndexManifest = None,
+        jobs: int = 1,
+    ) -> Iterator[Tuple[str, PackageVersion, bool]]:
+        """Read the package versions of a repository folder
+
+        Packages are returned sorted by kind and file name whatever the number of
+        processes used to read them.
+
+        Arguments:
+            folder_path {str} -- Path to a repository folder
+
+        Keyword Arguments:
+            manifest {IndexManifest} -- The sidecar manifest of the folder. Packages
+                that did not change are read from the manifest and new or changed
+                packages are added to it (default: {None})
+            jobs {int} -- Number of processes used to read the packages
+                (default: {1})
+
+        Returns:
+            Iterator[Tuple[str, PackageVersion, bool]] -- The kind of each package,
+                its version and whether it was unchanged since the manifest was saved
+        """
+        packages = []
+
+        for kind, type_path in (('plugin', 'plugins'), ('recipe', 'recipes')):
+            type_folder = os.path.join(folder_path, type_path)
+
+            if not os.path.exists(type_folder):
+                continue
+
+            for package in sorted(os.listdir(type_folder)):
+                package_path = os.path.join(type_folder, package)
+                stat = None
+                resource_version = None
+
+                if manifest is not None:
+                    stat = os.stat(package_path)
+                    resource_version = manifest.get(f'{type_path}/{package}', stat)
+
+                packages.append(
+                    (kind, f'{type_path}/{package}', package_path, stat,
+                     resource_version)
+                )
+
+        to_read = [package[2] for package in packages if package[4] is None]
+
+        # the index only needs the package metadata
+        read_package = partial(PackageVersion.from_package, metadata_only=True)
+
+        if jobs > 1 and len(to_read) > 1:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                read_versions = iter(list(executor.map(
+                    read_package, to_read,
+                    chunksize=max(1, len(to_read) // (jobs * 4))
+                )))
+        else:
+            read_versions = map(read_package, to_read)
+
+        for kind, url, package_path, stat, resource_version in packages:
+            if resource_version is not None:
+                yield kind, resource_version, True
+                continue
+
+            resource_version = next(read_versions)
+            resource_version.url = url
+            resource_version.kind = kind
+
+            if manifest is not None:
+                manifest.set(url, stat, resource_version)
+
+            yield kind, resource_version, False
+
+    @classmethod
+    def from_trusted(cls, data: Union[str, bytes, Dict]) -> 'RepositoryIndex':
+        """Load a repository index from trusted data without validating it
+
+        The package versions of the index are built with ``PackageVersion.from_trusted``
+        which skips validation. Use this to quickly load large indexes generated by
+        Queenbee (ie: to search a repository).
+
+        Arguments:
+            data {Union[str, bytes, Dict]} -- The content of an ``index.json`` file
+                or its parsed dictionary
+
+        Returns:
+            RepositoryIndex -- A repository index
+        """
+        if not isinstance(data, dict):
+            data = json.loads(data)
+
+        metadata = RepositoryMetadata.parse_obj(data.get('metadata') or {})
+
+        packages = {}
+
+        for kind in ('plugin', 'recipe'):
+            packages[kind] = {}
+            for name, package_list in (data.get(kind) or {}).items():
+                package_versions = []
+                for package in package_list:
+                    package = dict(package, kind=kind)
+                    if metadata.name is not None:
+                        package['slug'] = f'{metadata.name}/{package["name"]}'
+                    package_versions.append(PackageVersion.from_trusted(package))
+                packages[kind][name] = package_versions
+
+        metadata.plugin_count = len(packages['plugin'])
+        metadata.recipe_count = len(packages['recipe'])
+
+        values = dict(data)
+        values['annotations'] = data.get('annotations') or {}
+        values['metadata'] = metadata
+        values['plugin'] = packages['plugin']
+        values['recipe'] = packages['recipe']
+
+        if data.get('generated') is not None:
+            values['generated'] = parse_datetime(data['generated'])
+
+        return cls.construct(**values)
+
     @classmethod
     def index_resource(
         cls,
@@ -195,8 +429,6 @@ class RepositoryIndex(BaseModel):
         """
         index_folder = os.path.abspath(index_folder)
 
-        index_path = os.path.join(index_folder, 'index.json')
-
         index = cls.from_file(os.path.join(index_folder, 'index.json'))
 
         if isinstance(resource, Plugin):
@@ -224,7 +456,7 @@ class RepositoryIndex(BaseModel):
             file_object.seek(0)
             f.write(file_object.read())
 
-        index.to_json(index_path)
+        index.to_folder(index_folder)
 
     @staticmethod
     def add_slugs(root: str, packages: Dict[str, List[PackageVersion]]):
@@ -238,6 +470,41 @@ class RepositoryIndex(BaseModel):
             for p in package_list:
                 p.slug = f'{root}/{p.name}'
 
+    def copy_with_source(self, name: str, source: str) -> 'RepositoryIndex':
+        """Copy the index with the metadata and slugs of a repository reference
+
+        Only the metadata and the package versions are copied. The fields of the
+        package versions are shared with this index so the copy is cheap to make from
+        a cached index which must not be modified.
+
+        Args:
+            name (str): The name of the repository
+            source (str): The path or url of the repository
+
+        Returns:
+            RepositoryIndex: A labelled copy of the index
+        """
+        def add_slugs(packages: Dict[str, List[PackageVersion]]):
+            return {
+                package_name: [
+                    p.copy(update={'slug': f'{name}/{p.name}'}) for p in versions
+                ]
+                for package_name, versions in packages.items()
+            }
+
+        index = self.copy(update={
+            'metadata': self.metadata.copy(update={'name': name, 'source': source}),
+            'plugin': add_slugs(self.plugin),
+            'recipe': add_slugs(self.recipe),
+        })
+        # the copied package versions are indexed again but the search index only
+        # refers to packages by name so it is shared
+        index._lookup = {'plugin': PackageLookup(), 'recipe': PackageLookup()}
+        index._search = self._search
+        index._search_source = self._search_source
+
+        return index
+
     @staticmethod
     def get_latest(package_versions: List[PackageVersion]) -> PackageVersion:
         """Get the most recent package from the given list
@@ -248,11 +515,100 @@ class RepositoryIndex(BaseModel):
         Returns:
             PackageVersion: The most recent Queenbee package in the list
         """
-        if package_versions == []:
+        if not package_versions:
             return None
 
-        package_versions.sort(key=lambda x: x.created)
-        return package_versions[-1]
+        # reversed so the last version wins if several were created at the same time
+        return max(reversed(package_versions), key=lambda x: x.created)
+
+    def __setattr__(self, name, value):
+        if name in ('plugin', 'recipe'):
+            if value is not getattr(self, name, None):
+                self._lookup[name] = PackageLookup()
+            self._search = None
+            self._search_source = None
+        super(RepositoryIndex, self).__setattr__(name, value)
+
+    def search_index(self) -> SearchIndex:
+        """Get the full text search index of the packages
+
+        The search index is built the first time it is needed and rebuilt once
+        packages are added to the index. Use ``load_search_index`` or
+        ``set_search_index_url`` to reuse the search index saved in a repository
+        instead.
+
+        Returns:
+            SearchIndex -- The search index of the latest version of each package
+        """
+        if self._search is None and self._search_source is not None:
+            url, auth_header = self._search_source
+            self._search = SearchIndex.from_url(url, index=self, auth_header=auth_header)
+            self._search_source = None
+        if self._search is None:
+            self._search = SearchIndex.from_index(self)
+        return self._search
+
+    def load_search_index(self, folder_path: str) -> bool:
+        """Use the search index saved in a repository folder
+
+        Arguments:
+            folder_path {str} -- Path to the repository folder of this index
+
+        Returns:
+            bool -- True if the folder has a search index built from this index
+        """
+        search_index = SearchIndex.from_folder(folder_path, index=self)
+
+        if search_index is None:
+            return False
+
+        self._search = search_index
+        return True
+
+    def set_search_index_url(self, url: str, auth_header: Dict[str, str] = {}):
+        """Download the search index saved in a remote repository when it is needed
+
+        The search index is built from this index instead if the remote search
+        index is missing or was built from another version of this index.
+
+        Arguments:
+            url {str} -- The url of the ``search-index.json`` file of the repository
+
+        Keyword Arguments:
+            auth_header {Dict[str, str]} -- An authorization header to use when
+                downloading the search index (default: {{}})
+        """
+        if self._search is None:
+            self._search_source = (url, auth_header)
+
+    def to_folder(self, folder_path: str, indent: int = None):
+        """Write the index and its search index to a repository folder
+
+        Arguments:
+            folder_path {str} -- Path to the repository folder
+
+        Keyword Arguments:
+            indent {int} -- Indentation of the ``index.json`` file (default: {None})
+        """
+        self.to_json(os.path.join(folder_path, 'index.json'), indent=indent)
+        self.search_index().to_folder(folder_path)
+
+    def _package_lookup(self, kind: str, package_name: str) -> PackageLookup:
+        """Get the package lookup tables of a kind with the package indexed
+
+        Arguments:
+            kind {str} -- The type of package (plugin or recipe)
+            package_name {str} -- The name of the package
+
+        Returns:
+            PackageLookup -- The package lookup tables
+        """
+        lookup = self._lookup[kind]
+
+        if not lookup.is_indexed(package_name):
+            lookup.index(package_name, getattr(self, kind).get(package_name, []))
+
+        return lookup
 
     @staticmethod
     def _index_resource_version(
@@ -260,6 +616,7 @@ class RepositoryIndex(BaseModel):
         resource_version: PackageVersion,
         repository_name: str = None,
         overwrite: bool = False,
+        lookup: PackageLookup = None,
     ) -> Dict[str, List[PackageVersion]]:
         """Add a resource version to an index of resource versions
 
@@ -274,6 +631,8 @@ class RepositoryIndex(BaseModel):
                 (default: {None})
             overwrite {bool} -- Overwrite a resource version if it already exists
                 (default: {False})
+            lookup {PackageLookup} -- The lookup tables of the resource versions to
+                keep up to date (default: {None})
 
         Raises:
             ValueError: Resource version already exists
@@ -285,14 +644,18 @@ class RepositoryIndex(BaseModel):
         if repository_name:
             resource_version.slug = f'{repository_name.lower()}/{resource_version.name.lower()}'
 
-        resource_list = resource_dict.get(resource_version.name, [])
+        name = resource_version.name
+
+        resource_list = resource_dict.get(name, [])
+
+        if lookup is None:
+            lookup = PackageLookup()
+
+        if not lookup.is_indexed(name):
+            lookup.index(name, resource_list)
 
         if not overwrite:
-            match = next(
-                filter(
-                    lambda x: x.tag == resource_version.tag, resource_list
-                ), None
-            )
+            match = lookup.by_tag(name, resource_version.tag)
             if match is not None:
                 if match.digest != resource_version.digest:
                     raise ValueError(
@@ -306,7 +669,9 @@ class RepositoryIndex(BaseModel):
         )
 
         resource_list.append(resource_version)
-        resource_dict[resource_version.name] = resource_list
+        resource_dict[name] = resource_list
+
+        lookup.add(resource_version, resource_list)
 
         return resource_dict
 
@@ -322,7 +687,8 @@ class RepositoryIndex(BaseModel):
                 index (default: {False})
         """
         self.recipe = self._index_resource_version(
-            self.recipe, recipe_version, overwrite=overwrite
+            self.recipe, recipe_version, overwrite=overwrite,
+            lookup=self._lookup['recipe']
         )
         self.generated = datetime.utcnow()
 
@@ -338,11 +704,13 @@ class RepositoryIndex(BaseModel):
                 the index (default: {False})
         """
         self.plugin = self._index_resource_version(
-            self.plugin, plugin_version, overwrite=overwrite
+            self.plugin, plugin_version, overwrite=overwrite,
+            lookup=self._lookup['plugin']
         )
         self.generated = datetime.utcnow()
 
-    def merge_folder(self, folder_path, overwrite: bool = False, skip: bool = False):
+    def merge_folder(self, folder_path, overwrite: bool = False, skip: bool = False,
+                     use_index_manifest: bool = False, jobs: int = 1):
         """Merge the contents of a repository folder with the index
 
         Arguments:
@@ -351,36 +719,40 @@ class RepositoryIndex(BaseModel):
         Keyword Arguments:
             overwrite {bool} -- Overwrite any Resource Version (default: {False})
             skip {bool} -- Skip any errors if version already exist (default: {False})
+            use_index_manifest {bool} -- Read and update the sidecar manifest of the
+                folder so packages that did not change since the folder was last
+                indexed are skipped without being unpacked (default: {False})
+            jobs {int} -- Number of processes used to read the packages
+                (default: {1})
 
         Raises:
             ValueError: Resource version already exists or is invalid
         """
-        for package in os.listdir(os.path.join(folder_path, 'plugins')):
-            package_path = os.path.join(folder_path, 'plugins', package)
-            resource_version = PackageVersion.from_package(package_path)
-            resource_version.url = \
-                    os.path.join('plugins', package).replace('\\', '/')
-            try:
-                self.index_plugin_version(resource_version, overwrite)
-            except ValueError as error:
-                if 'already has a version ' in str(error):
-                    if skip:
-                        continue
-                raise error
+        manifest = IndexManifest.from_folder(folder_path) \
+            if use_index_manifest else None
+
+        for kind, resource_version, unchanged in self._read_folder(
+                folder_path, manifest, jobs):
+            if unchanged:
+                match = self._package_lookup(kind, resource_version.name).by_tag(
+                    resource_version.name, resource_version.tag)
+                if match is not None and match.digest == resource_version.digest:
+                    continue
 
-        for package in os.listdir(os.path.join(folder_path, 'recipes')):
-            package_path = os.path.join(folder_path, 'recipes', package)
-            resource_version = PackageVersion.from_package(package_path)
-            resource_version.url = \
-                    os.path.join('recipes', package).replace('\\', '/')
             try:
-                self.index_recipe_version(resource_version, overwrite)
+                if kind == 'plugin':
+                    self.index_plugin_version(resource_version, overwrite)
+                else:
+                    self.index_recipe_version(resource_version, overwrite)
             except ValueError as error:
                 if 'already has a version ' in str(error):
                     if skip:
                         continue
                 raise error
 
+        if manifest is not None:
+            manifest.to_folder(folder_path)
+
     def package_by_tag(
         self,
         kind: str,
@@ -413,10 +785,12 @@ class RepositoryIndex(BaseModel):
                 f' in this index'
             )
 
+        lookup = self._package_lookup(kind, package_name)
+
         if package_tag == 'latest':
-            return self.get_latest(package_versions=package_list)
+            return lookup.latest(package_name)
 
-        res = next(filter(lambda x: x.tag == package_tag, package_list), None)
+        res = lookup.by_tag(package_name, package_tag)
 
         if res is None:
             raise ValueError(
@@ -455,8 +829,8 @@ class RepositoryIndex(BaseModel):
                 f' in this index'
             )
 
-        res = next(filter(lambda x: x.digest ==
-                          package_digest, package_list), None)
+        res = self._package_lookup(kind, package_name).by_digest(
+            package_name, package_digest)
 
         if res is None:
             raise ValueError(
@@ -470,38 +844,50 @@ class RepositoryIndex(BaseModel):
         self,
         kind: str = None,
         search_string: str = None,
+        page: int = 1,
+        per_page: int = None,
     ) -> List[PackageVersion]:
         """Search for a package inside of a repository using a search string
 
+        The search string is split into terms and packages are matched using the
+        search index of the repository. A package matches if every term is a token or
+        the start of a token of its name, keywords, description or maintainers.
+        Matches are ranked with name matches first, then keyword, description and
+        maintainer matches.
+
         Args:
             kind (str, optional): The type of package to search for
                 (ie: plugin or recipe). Defaults to None.
             search_string (str, optional): The search string to use. Defaults to None.
+            page (int, optional): The page of results to return starting from 1.
+                Defaults to 1.
+            per_page (int, optional): The number of results per page. Defaults to
+                None which returns all the results.
+
+        Raises:
+            ValueError: page or per_page is smaller than 1
 
         Returns:
             List[PackageVersion]: A list of packages (the latest from each list)
         """
+        if page < 1:
+            raise ValueError(f'Search page must be 1 or more, not {page}')
+        if per_page is not None and per_page < 1:
+            raise ValueError(f'Search page size must be 1 or more, not {per_page}')
 
-        packages = []
-
-        if kind is None or kind == 'recipe':
-            for name, package_versions in self.recipe.items():
-                package = self.get_latest(package_versions=package_versions)
-
-                if package.search_match(search_string=search_string):
-                    packages.append(package)
+        results = self.search_index().search(search_string=search_string, kind=kind)
 
-        if kind is None or kind == 'plugin':
-            for name, package_versions in self.plugin.items():
-                package = self.get_latest(package_versions=package_versions)
+        if per_page is not None:
+            start = (page - 1) * per_page
+            results = results[start:start + per_page]
 
-                if package.search_match(search_string=search_string):
-                    packages.append(package)
+        return [
+            self._package_lookup(package_kind, name).latest(name)
+            for package_kind, name, _ in results
+        ]
 
-        return packages
-
-    def json(self, *args, **kwargs):
-        """Overwrite the BaseModel json method to exclude certain keys
+    def _exclude_keys(self) -> Dict:
+        """Keys of the package versions that are not serialized with the index
 
         The objective is to remove the readme, license and manifest keys which are not
         needed in a serialized index object.
@@ -529,4 +915,14 @@ class RepositoryIndex(BaseModel):
                 }
             }
 
-        return super(RepositoryIndex, self).json(exclude=exclude_keys, *args, **kwargs)
+        return exclude_keys
+
+    def json(self, *args, **kwargs):
+        """Overwrite the BaseModel json method to exclude certain keys"""
+        return super(RepositoryIndex, self).json(
+            exclude=self._exclude_keys(), *args, **kwargs)
+
+    def to_dict(self, *args, **kwargs):
+        """Overwrite the BaseModel to_dict method to exclude certain keys"""
+        return super(RepositoryIndex, self).to_dict(
+            exclude=self._exclude_keys(), *args, **kwargs)
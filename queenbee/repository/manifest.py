@@ -0,0 +1,104 @@
+"""Sidecar manifest of the packages read to build a repository index.
+
+The manifest is saved next to the ``index.json`` file of a repository folder and
+records the size, modification time and digest of every package file along with
+the package version read from it. Packages which have not changed since the last
+time the repository was indexed can then be indexed without being unpacked.
+"""
+import os
+import json
+from typing import Dict
+
+from .package import PackageVersion
+
+
+class IndexManifest:
+    """Sidecar manifest of the package files of a repository folder
+
+    Keyword Arguments:
+        packages {Dict[str, Dict]} -- Manifest entries keyed by the package path
+            relative to the repository folder (default: {None})
+    """
+
+    file_name = '.index-manifest.json'
+
+    def __init__(self, packages: Dict[str, Dict] = None):
+        self.packages = packages or {}
+        self._seen = set()
+
+    @classmethod
+    def from_folder(cls, folder_path: str) -> 'IndexManifest':
+        """Load the manifest of a repository folder
+
+        An empty manifest is returned if the folder does not have a manifest or if
+        it cannot be read.
+
+        Arguments:
+            folder_path {str} -- Path to a repository folder
+
+        Returns:
+            IndexManifest -- The manifest of the repository folder
+        """
+        manifest_path = os.path.join(folder_path, cls.file_name)
+
+        try:
+            with open(manifest_path, 'r') as f:
+                packages = json.load(f)['packages']
+        except (OSError, ValueError, KeyError):
+            packages = {}
+
+        return cls(packages=packages)
+
+    def to_folder(self, folder_path: str):
+        """Write the manifest to a repository folder
+
+        Only the packages that were looked up or added since the manifest was loaded
+        are written so packages removed from the folder are dropped.
+
+        Arguments:
+            folder_path {str} -- Path to a repository folder
+        """
+        packages = {
+            path: entry for path, entry in self.packages.items() if path in self._seen
+        }
+
+        with open(os.path.join(folder_path, self.file_name), 'w') as f:
+            json.dump({'packages': packages}, f)
+
+    def get(self, path: str, stat: os.stat_result) -> PackageVersion:
+        """Get the package version of an unchanged package file
+
+        Arguments:
+            path {str} -- The package path relative to the repository folder
+            stat {os.stat_result} -- The current stat of the package file
+
+        Returns:
+            PackageVersion -- The package version saved in the manifest (or None if
+                the package is not in the manifest or has changed)
+        """
+        entry = self.packages.get(path)
+
+        if entry is None or entry['size'] != stat.st_size or \
+                entry['mtime'] != stat.st_mtime_ns:
+            return None
+
+        self._seen.add(path)
+
+        return PackageVersion.from_trusted(entry['version'])
+
+    def set(self, path: str, stat: os.stat_result, version: PackageVersion):
+        """Add or update the entry of a package file
+
+        Arguments:
+            path {str} -- The package path relative to the repository folder
+            stat {os.stat_result} -- The stat of the package file
+            version {PackageVersion} -- The package version read from the file
+        """
+        self._seen.add(path)
+
+        self.packages[path] = {
+            'size': stat.st_size,
+            'mtime': stat.st_mtime_ns,
+            'digest': version.digest,
+            'version': version.to_dict(exclude={'readme', 'license', 'manifest'}),
+        }
@@ -1,18 +1,75 @@
 import os
 import re
+import json
+import asyncio
 import hashlib
+import tempfile
 from io import BytesIO
 from datetime import datetime
+from functools import partial
 from tarfile import TarInfo, TarFile
-from typing import Union, Tuple
+from typing import Union, Tuple, Dict, BinaryIO
+from urllib.parse import urlparse
+from urllib.request import url2pathname
 
-from pydantic import Field, constr
+from pydantic import Field, constr, validator
+from pydantic.datetime_parse import parse_datetime
 
 from ..plugin import Plugin
 from ..recipe import Recipe, BakedRecipe
 
 from ..base.request import make_request, urljoin
-from ..base.metadata import MetaData
+from ..base.metadata import MetaData, Maintainer, License
+
+from .cache import package_cache
+
+
+RESOURCE_TYPES = {
+    'Plugin': Plugin,
+    'Recipe': Recipe,
+}
+
+
+def load_resource(data: Union[str, bytes, Dict]) -> Union[Plugin, Recipe]:
+    """Load a Plugin or Recipe manifest using its type field
+
+    The model class is picked from the ``type`` field of the manifest so it is only
+    parsed and validated once. Manifests without a type field are read as a Plugin
+    and then as a Recipe.
+
+    Arguments:
+        data {Union[str, bytes, Dict]} -- A JSON string or a dictionary of a plugin
+            or recipe
+
+    Raises:
+        ValueError: The manifest is not a valid Plugin or Recipe
+
+    Returns:
+        Union[Plugin, Recipe] -- A plugin or recipe object
+    """
+    if not isinstance(data, dict):
+        data = json.loads(data)
+
+    resource_type = data.get('type')
+
+    if resource_type is None:
+        try:
+            return Plugin.parse_obj(data)
+        except ValueError:
+            try:
+                return Recipe.parse_obj(data)
+            except ValueError:
+                raise ValueError(
+                    'Package resource.json could not be read as a Recipe or a plugin')
+
+    resource_class = RESOURCE_TYPES.get(resource_type)
+
+    if resource_class is None:
+        raise ValueError(
+            f'resource type must be one of {list(RESOURCE_TYPES)}, not: {resource_type}'
+        )
+
+    return resource_class.parse_obj(data)
 
 
 def reset_tar(tarinfo: TarInfo) -> TarInfo:
@@ -33,6 +90,24 @@ def add_to_tar(tar: TarFile, data: bytes, filename: str):
     tar.addfile(tarinfo, BytesIO(data))
 
 
+class _TeeReader:
+    """A file object that copies everything read from a file to another file."""
+
+    def __init__(self, source: BinaryIO, sink: BinaryIO):
+        self.source = source
+        self.sink = sink
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.source.read(size)
+        self.sink.write(data)
+        return data
+
+    def drain(self, chunk_size: int = 65536):
+        """Copy the rest of the source file."""
+        while self.read(chunk_size):
+            pass
+
+
 class PackageVersion(MetaData):
     """Package Version
 
@@ -67,6 +142,12 @@ class PackageVersion(MetaData):
         description="The package Recipe or Plugin manifest"
     )
 
+    @validator('manifest', pre=True)
+    def load_manifest(cls, v):
+        if isinstance(v, dict):
+            return load_resource(v)
+        return v
+
     @classmethod
     def from_resource(
         cls,
@@ -96,7 +177,7 @@ class PackageVersion(MetaData):
 
         input_dict = resource.metadata.to_dict()
         input_dict['type'] = 'PackageVersion'
-        input_dict['digest'] = resource.__hash__
+        input_dict['digest'] = resource.hash_digest()
         input_dict['created'] = created
         input_dict['url'] = package_path
 
@@ -110,6 +191,38 @@ class PackageVersion(MetaData):
 
         return cls.parse_obj(input_dict)
 
+    @classmethod
+    def from_trusted(cls, data: Dict) -> 'PackageVersion':
+        """Create a package version from trusted data without validating it
+
+        This is much faster than ``parse_obj`` and should only be used for data that
+        was generated by Queenbee (ie: the entries of a repository ``index.json``).
+        Entries that include a manifest are fully validated.
+
+        Arguments:
+            data {Dict} -- A package version dictionary
+
+        Returns:
+            PackageVersion -- A package version object
+        """
+        if data.get('manifest') is not None:
+            return cls.parse_obj(data)
+
+        values = dict(data)
+        values['annotations'] = values.get('annotations') or {}
+        values['created'] = parse_datetime(values['created'])
+
+        if values.get('maintainers') is not None:
+            values['maintainers'] = [
+                Maintainer.construct(**maintainer)
+                for maintainer in values['maintainers']
+            ]
+
+        if values.get('license') is not None:
+            values['license'] = License.construct(**values['license'])
+
+        return cls.construct(**values)
+
     @classmethod
     def pack_tar(cls,
                  resource: Union[Plugin, Recipe],
@@ -180,34 +293,59 @@ class PackageVersion(MetaData):
     @classmethod
     def unpack_tar(
         cls,
-        tar_file: BytesIO,
+        tar_file: BinaryIO,
         verify_digest: bool = True,
         digest: str = None
     ) -> 'PackageVersion':
+        """Read a package version and its manifest from a package tar file
+
+        The tar file is read as a stream so it can be read directly from a download.
+        The digest of ``resource.json`` is computed chunk by chunk and checked as soon
+        as the file is read so a package that does not match its expected digest is
+        rejected before the rest of it is read.
+
+        Arguments:
+            tar_file {BinaryIO} -- A gzipped tar file object
 
-        tar = TarFile.open(fileobj=tar_file)
+        Keyword Arguments:
+            verify_digest {bool} -- Ensure the digest of ``resource.json`` matches
+                the expected digest (default: {True})
+            digest {str} -- The expected digest. The digest is not verified if it is
+                not provided (default: {None})
+
+        Raises:
+            ValueError: The package is invalid or does not match its digest
 
+        Returns:
+            PackageVersion -- A package version object with its manifest
+        """
         manifest_bytes = None
         version = None
         readme_string = None
         read_digest = None
 
-        for member in tar.getmembers():
-            if member.name == 'resource.json':
-                manifest_bytes = tar.extractfile(member).read()
-                read_digest = hashlib.sha256(manifest_bytes).hexdigest()
-
-                if verify_digest:
-                    read_digest == digest, \
-                        ValueError(
+        with TarFile.open(fileobj=tar_file, mode='r|gz') as tar:
+            for member in tar:
+                if member.name == 'resource.json':
+                    hasher = hashlib.sha256()
+                    chunks = []
+                    resource_file = tar.extractfile(member)
+                    for chunk in iter(lambda: resource_file.read(65536), b''):
+                        hasher.update(chunk)
+                        chunks.append(chunk)
+                    manifest_bytes = b''.join(chunks)
+                    read_digest = hasher.hexdigest()
+
+                    if verify_digest and digest is not None and read_digest != digest:
+                        raise ValueError(
                             f'Hash of resource.json file is different from the one'
                             f' expected from the index Expected {digest} but got'
                             f' {read_digest}'
                         )
-            elif member.name == 'version.json':
-                version = cls.parse_raw(tar.extractfile(member).read())
-            elif member.name == 'README.md':
-                readme_string = tar.extractfile(member).read().decode('utf-8')
+                elif member.name == 'version.json':
+                    version = cls.parse_raw(tar.extractfile(member).read())
+                elif member.name == 'README.md':
+                    readme_string = tar.extractfile(member).read().decode('utf-8')
 
         if manifest_bytes is None:
             raise ValueError(
@@ -215,16 +353,8 @@ class PackageVersion(MetaData):
                 ' decoded.'
             )
 
-        try:
-            manifest = Plugin.parse_raw(manifest_bytes)
-            version.kind = 'plugin'
-        except Exception as error:
-            try:
-                manifest = Recipe.parse_raw(manifest_bytes)
-                version.kind = 'recipe'
-            except Exception as error:
-                raise ValueError(
-                    'Package resource.json could not be read as a Recipe or a plugin')
+        manifest = load_resource(manifest_bytes)
+        version.kind = 'plugin' if isinstance(manifest, Plugin) else 'recipe'
 
         version.manifest = manifest
         version.readme = readme_string
@@ -233,46 +363,214 @@ class PackageVersion(MetaData):
         return version
 
     @classmethod
-    def from_package(cls, package_path: str):
+    def read_tar_metadata(cls, tar_file: BinaryIO) -> 'PackageVersion':
+        """Read the package version of a package without reading its manifest
+
+        The tar file is read as a stream. Only ``version.json`` is parsed and the
+        digest of ``resource.json`` is computed chunk by chunk without loading or
+        validating the resource. The returned package version has no manifest or
+        readme.
+
+        Arguments:
+            tar_file {BinaryIO} -- A gzipped tar file object
+
+        Returns:
+            PackageVersion -- A package version object
+        """
+        version = None
+        read_digest = None
+
+        with TarFile.open(fileobj=tar_file, mode='r|gz') as tar:
+            for member in tar:
+                if member.name == 'resource.json':
+                    hasher = hashlib.sha256()
+                    resource_file = tar.extractfile(member)
+                    for chunk in iter(lambda: resource_file.read(65536), b''):
+                        hasher.update(chunk)
+                    read_digest = hasher.hexdigest()
+                elif member.name == 'version.json':
+                    version = cls.parse_raw(tar.extractfile(member).read())
+
+        if read_digest is None:
+            raise ValueError(
+                'package tar file did not contain a resource.json file so could not be'
+                ' decoded.'
+            )
+
+        if version is None:
+            raise ValueError(
+                'package tar file did not contain a version.json file so could not be'
+                ' decoded.'
+            )
+
+        version.digest = read_digest
+
+        return version
+
+    @classmethod
+    def from_package(cls, package_path: str, metadata_only: bool = False):
         """Generate a package version from a packaged resource
 
         Arguments:
             package_path {str} -- Path to the package
 
+        Keyword Arguments:
+            metadata_only {bool} -- Only read the package metadata and skip reading
+                and validating the package manifest and readme (default: {False})
+
         Returns:
             PackageVersion -- A package version object
         """
         file_path = os.path.normpath(os.path.abspath(package_path)).replace('\\', '/')
 
+        if metadata_only:
+            with open(file_path, 'rb') as f:
+                return cls.read_tar_metadata(f)
+
         with open(file_path, 'rb') as f:
-            filebytes = BytesIO(f.read())
+            return cls.unpack_tar(tar_file=f, verify_digest=False)
 
-        version = cls.unpack_tar(tar_file=filebytes, verify_digest=False)
+    def fetch_package(self, source_url: str = None, verify_digest: bool = True,
+                      auth_header: Dict[str, str] = {},
+                      use_cache: bool = True) -> 'PackageVersion':
+        """Fetch the package from its source repository
 
-        return version
+        Packages are looked up by digest in the local package cache first and are
+        added to it once downloaded. Packages downloaded with an authorization header
+        are only looked up by callers sending the same header.
+
+        Keyword Arguments:
+            source_url {str} -- The url of the repository hosting the package
+                (default: {None})
+            verify_digest {bool} -- Ensure the downloaded package matches the digest
+                of this package version (default: {True})
+            auth_header {Dict[str, str]} -- An authorization header to use when
+                downloading the package
+            use_cache {bool} -- Use the local package cache (default: {True})
+
+        Returns:
+            PackageVersion -- A package version object with its manifest
+        """
+        # local packages are not downloaded with the authorization header
+        cache_header = None if source_url.startswith('file:') else auth_header
+
+        if use_cache and self.digest is not None:
+            version = package_cache.get_package(self.digest, auth_header=cache_header)
+            if version is not None:
+                return version
 
-    def fetch_package(self, source_url: str = None, verify_digest: bool = True,
-                      auth_header: Dict[str, str] = {}) -> 'PackageVersion':
         if source_url.startswith('file:'):
-            source_path = source_url.split('file:///')[1]
-            if os.path.isabs(source_path):
-                package_path = os.path.join(source_path, self.url)
-            else:
-                package_path = os.path.join(os.getcwd(), source_path, self.url)
+            source_path = url2pathname(urlparse(source_url).path)
+            package_path = os.path.join(os.path.abspath(source_path), self.url)
 
-            return self.from_package(package_path)
+            with open(package_path, 'rb') as f:
+                return self._load_package(f, verify_digest, use_cache)
 
         package_url = urljoin(source_url, self.url)
 
-        res = make_request(url=package_url, auth_header=auth_header)
+        with make_request(url=package_url, auth_header=auth_header, stream=True) as res:
+            return self._load_package(res, verify_digest, use_cache, auth_header)
 
-        filebytes = BytesIO(res.read())
+    async def afetch_package(self, source_url: str = None, verify_digest: bool = True,
+                             auth_header: Dict[str, str] = {},
+                             use_cache: bool = True) -> 'PackageVersion':
+        """Fetch the package from its source repository without blocking the event loop
 
-        return self.unpack_tar(
-            tar_file=filebytes,
-            verify_digest=verify_digest,
-            digest=self.digest
-        )
+        This is the asynchronous counterpart of ``fetch_package``. The package is
+        downloaded with the shared asynchronous http session and unpacked in the
+        default executor of the event loop. It requires aiohttp.
+
+        Keyword Arguments:
+            source_url {str} -- The url of the repository hosting the package
+                (default: {None})
+            verify_digest {bool} -- Ensure the downloaded package matches the digest
+                of this package version (default: {True})
+            auth_header {Dict[str, str]} -- An authorization header to use when
+                downloading the package
+            use_cache {bool} -- Use the local package cache (default: {True})
+
+        Returns:
+            PackageVersion -- A package version object with its manifest
+        """
+        from ..base.async_request import amake_request
+
+        loop = asyncio.get_running_loop()
+
+        if source_url.startswith('file:'):
+            return await loop.run_in_executor(None, partial(
+                self.fetch_package, source_url=source_url, verify_digest=verify_digest,
+                auth_header=auth_header, use_cache=use_cache
+            ))
+
+        if use_cache and self.digest is not None:
+            version = await loop.run_in_executor(
+                None, partial(package_cache.get_package, self.digest, auth_header)
+            )
+            if version is not None:
+                return version
+
+        # download to a temporary file and unpack it from there so the package is
+        # never held in memory
+        if use_cache:
+            f, temp_path = package_cache.temp_file()
+        else:
+            fd, temp_path = tempfile.mkstemp(suffix='.tmp')
+            f = os.fdopen(fd, 'wb')
+
+        try:
+            with f:
+                await amake_request(
+                    url=urljoin(source_url, self.url), auth_header=auth_header, sink=f
+                )
+            return await loop.run_in_executor(
+                None, self._load_package_file, temp_path, verify_digest, use_cache,
+                auth_header
+            )
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def _load_package(self, tar_file: BinaryIO, verify_digest: bool,
+                      use_cache: bool, auth_header: Dict[str, str] = None) \
+            -> 'PackageVersion':
+        """Unpack a package as it is read and add it to the package cache
+
+        The package file is copied to a temporary file of the package cache while it
+        is read and only added to the cache once it is unpacked and verified.
+        """
+        if not use_cache:
+            return self.unpack_tar(
+                tar_file=tar_file, verify_digest=verify_digest, digest=self.digest
+            )
+
+        f, temp_path = package_cache.temp_file()
+        try:
+            with f:
+                reader = _TeeReader(tar_file, f)
+                version = self.unpack_tar(
+                    tar_file=reader, verify_digest=verify_digest, digest=self.digest
+                )
+                reader.drain()
+            package_cache.add_package_file(temp_path, version, auth_header)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+        return version
+
+    def _load_package_file(self, file_path: str, verify_digest: bool,
+                           use_cache: bool, auth_header: Dict[str, str] = None) \
+            -> 'PackageVersion':
+        """Unpack a downloaded package file and move it to the package cache"""
+        with open(file_path, 'rb') as f:
+            version = self.unpack_tar(
+                tar_file=f, verify_digest=verify_digest, digest=self.digest
+            )
+
+        if use_cache:
+            package_cache.add_package_file(file_path, version, auth_header)
+
+        return version
 
     @staticmethod
     def read_readme(folder_path: str) -> str:
@@ -0,0 +1,286 @@
+"""Inverted index for full text search over the packages of a repository index.
+
+The search index maps every token found in the name, keywords, description and
+maintainers of the latest version of each package to the packages it was found in.
+It is saved as ``search-index.json`` next to the ``index.json`` file of a repository
+folder so it does not have to be rebuilt every time the repository is searched.
+"""
+import os
+import re
+import json
+from bisect import bisect_left
+from typing import Dict, List, Tuple, Union
+
+from ..base.request import make_request
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+# weight of a token found in each field of a package
+FIELD_WEIGHTS = {
+    'name': 4.0,
+    'keywords': 3.0,
+    'description': 1.0,
+    'maintainers': 1.0,
+}
+
+# factor applied to the weight of a token that only starts with a search term
+PREFIX_FACTOR = 0.5
+
+
+def tokenize(text: str) -> List[str]:
+    """Split a text into lowercase alphanumeric tokens
+
+    Arguments:
+        text {str} -- A text
+
+    Returns:
+        List[str] -- The tokens of the text
+    """
+    if not text:
+        return []
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class SearchIndex:
+    """An inverted index of the packages of a repository index
+
+    Keyword Arguments:
+        documents {List[Tuple[str, str]]} -- The kind and name of each indexed
+            package (default: {None})
+        postings {Dict[str, Dict[int, float]]} -- The weight of each token in the
+            packages it was found in, keyed by position in ``documents``
+            (default: {None})
+        generated {str} -- The generation time of the repository index the search
+            index was built from (default: {None})
+    """
+
+    file_name = 'search-index.json'
+
+    def __init__(self, documents: List[Tuple[str, str]] = None,
+                 postings: Dict[str, Dict[int, float]] = None, generated: str = None):
+        self.documents = documents or []
+        self.postings = postings or {}
+        self.generated = generated
+        self._terms = sorted(self.postings)
+
+    def __deepcopy__(self, memo):
+        # a search index is never modified once built so copies of a repository
+        # index can share it
+        return self
+
+    @staticmethod
+    def _generated(index: 'RepositoryIndex') -> str:
+        return index.generated.isoformat() if index.generated is not None else None
+
+    @classmethod
+    def from_index(cls, index: 'RepositoryIndex') -> 'SearchIndex':
+        """Build the search index of the latest version of each package of an index
+
+        Arguments:
+            index {RepositoryIndex} -- A repository index
+
+        Returns:
+            SearchIndex -- The search index of the repository index
+        """
+        documents = []
+        postings = {}
+
+        for kind in ('recipe', 'plugin'):
+            for name in getattr(index, kind):
+                package = index._package_lookup(kind, name).latest(name)
+                if package is None:
+                    continue
+
+                doc_id = len(documents)
+                documents.append((kind, name))
+
+                fields = {
+                    'name': tokenize(package.name),
+                    'keywords': [
+                        token for keyword in package.keywords or []
+                        for token in tokenize(keyword)
+                    ],
+                    'description': tokenize(package.description),
+                    'maintainers': [
+                        token for maintainer in package.maintainers or []
+                        for token in tokenize(f'{maintainer.name} {maintainer.email}')
+                    ],
+                }
+
+                for field, tokens in fields.items():
+                    weight = FIELD_WEIGHTS[field]
+                    for token in tokens:
+                        doc_weights = postings.setdefault(token, {})
+                        if weight > doc_weights.get(doc_id, 0):
+                            doc_weights[doc_id] = weight
+
+        return cls(documents=documents, postings=postings, generated=cls._generated(index))
+
+    @classmethod
+    def from_json(cls, data: Union[str, bytes],
+                  index: 'RepositoryIndex' = None) -> 'SearchIndex':
+        """Load a saved search index from the content of its file
+
+        Arguments:
+            data {Union[str, bytes]} -- The content of a ``search-index.json`` file
+
+        Keyword Arguments:
+            index {RepositoryIndex} -- The repository index of the search index. The
+                search index is only returned if it was built from an index generated
+                at the same time (default: {None})
+
+        Returns:
+            SearchIndex -- The saved search index (or None if it cannot be read or if
+                it is outdated)
+        """
+        try:
+            data = json.loads(data)
+            documents = [tuple(document) for document in data['documents']]
+            postings = {
+                term: {doc_id: weight for doc_id, weight in doc_weights}
+                for term, doc_weights in data['postings'].items()
+            }
+            generated = data['generated']
+        except (ValueError, KeyError, TypeError):
+            return None
+
+        if index is not None and (
+            generated is None or generated != cls._generated(index)
+        ):
+            return None
+
+        return cls(documents=documents, postings=postings, generated=generated)
+
+    @classmethod
+    def from_folder(cls, folder_path: str,
+                    index: 'RepositoryIndex' = None) -> 'SearchIndex':
+        """Load the search index saved in a repository folder
+
+        Arguments:
+            folder_path {str} -- Path to a repository folder
+
+        Keyword Arguments:
+            index {RepositoryIndex} -- The repository index of the folder. The saved
+                search index is only returned if it was built from an index generated
+                at the same time (default: {None})
+
+        Returns:
+            SearchIndex -- The saved search index (or None if the folder does not
+                have a search index, if it cannot be read or if it is outdated)
+        """
+        try:
+            with open(os.path.join(folder_path, cls.file_name), 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+
+        return cls.from_json(data, index=index)
+
+    @classmethod
+    def from_url(cls, url: str, index: 'RepositoryIndex' = None,
+                 auth_header: Dict[str, str] = {}) -> 'SearchIndex':
+        """Download the search index saved in a remote repository
+
+        Arguments:
+            url {str} -- The url of a ``search-index.json`` file
+
+        Keyword Arguments:
+            index {RepositoryIndex} -- The repository index of the search index. The
+                search index is only returned if it was built from an index generated
+                at the same time (default: {None})
+            auth_header {Dict[str, str]} -- An authorization header to use when
+                downloading the search index (default: {{}})
+
+        Returns:
+            SearchIndex -- The saved search index (or None if the repository does not
+                have a search index, if it cannot be read or if it is outdated)
+        """
+        try:
+            res = make_request(url=url, auth_header=auth_header)
+            data = res.read()
+        except OSError:
+            return None
+
+        return cls.from_json(data, index=index)
+
+    def to_folder(self, folder_path: str):
+        """Save the search index to a repository folder
+
+        Arguments:
+            folder_path {str} -- Path to a repository folder
+        """
+        data = {
+            'generated': self.generated,
+            'documents': self.documents,
+            'postings': {
+                term: sorted(doc_weights.items())
+                for term, doc_weights in self.postings.items()
+            },
+        }
+
+        with open(os.path.join(folder_path, self.file_name), 'w') as f:
+            json.dump(data, f)
+
+    def _match(self, term: str) -> Dict[int, float]:
+        """Score the packages with a token equal to or starting with a search term"""
+        scores = {}
+        terms = self._terms
+
+        i = bisect_left(terms, term)
+        while i < len(terms) and terms[i].startswith(term):
+            factor = 1.0 if terms[i] == term else PREFIX_FACTOR
+            for doc_id, weight in self.postings[terms[i]].items():
+                score = weight * factor
+                if score > scores.get(doc_id, 0):
+                    scores[doc_id] = score
+            i += 1
+
+        return scores
+
+    def search(self, search_string: str = None,
+               kind: str = None) -> List[Tuple[str, str, float]]:
+        """Search for packages matching every term of a search string
+
+        A term matches a package if one of the package tokens is equal to the term or
+        starts with it. Packages are ranked by the sum of the weights of their best
+        matching token for each term.
+
+        Keyword Arguments:
+            search_string {str} -- The search string. All the packages are returned if
+                it has no terms (default: {None})
+            kind {str} -- The type of package to search for (ie: plugin or recipe)
+                (default: {None})
+
+        Returns:
+            List[Tuple[str, str, float]] -- The kind, name and score of the matching
+                packages from the best to the worst match
+        """
+        terms = tokenize(search_string)
+
+        if not terms:
+            return [
+                (doc_kind, name, 0.0) for doc_kind, name in self.documents
+                if kind is None or doc_kind == kind
+            ]
+
+        scores = None
+
+        for term in dict.fromkeys(terms):
+            matches = self._match(term)
+            if scores is None:
+                scores = matches
+            else:
+                scores = {
+                    doc_id: score + matches[doc_id]
+                    for doc_id, score in scores.items() if doc_id in matches
+                }
+            if not scores:
+                return []
+
+        results = [
+            (*self.documents[doc_id], score) for doc_id, score in scores.items()
+            if kind is None or self.documents[doc_id][0] == kind
+        ]
+        results.sort(key=lambda x: (-x[2], x[1], x[0]))
+
+        return results
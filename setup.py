@@ -20,7 +20,8 @@ setuptools.setup(
     packages=setuptools.find_packages(exclude=["tests", "docs"]),
     install_requires=requirements,
     extras_require={
-        'cli': ['click>=7.0', 'click_plugins==1.1.1']
+        'cli': ['click>=7.0', 'click_plugins==1.1.1'],
+        'async': ['aiohttp>=3.6']
     },
     entry_points={
         "console_scripts": ["queenbee = queenbee.cli:main"]
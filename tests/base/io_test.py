@@ -75,3 +75,9 @@ class BaseIOTest(BaseTestClass):
         assert obj == valid_instance.to_dict()
         assert self.klass.from_file(
             loc_file).__hash__ == valid_instance.__hash__
+
+    def test_to_dict_exclude_unset(self, valid_dict):
+        valid_instance = self.klass.parse_obj(valid_dict)
+
+        assert valid_instance.to_dict(exclude_unset=True) == json.loads(
+            valid_instance.json(by_alias=True, exclude_unset=True))
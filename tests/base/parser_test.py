@@ -0,0 +1,21 @@
+from queenbee.base.parser import parse_double_quotes_vars, \
+    replace_double_quote_vars, render_double_quote_vars
+
+
+def test_parse_double_quotes_vars():
+    command = 'honeybee-radiance {{inputs.model}} --out {{ inputs.out-folder }}/{{item}}'
+
+    assert parse_double_quotes_vars(command) == \
+        ['inputs.model', 'inputs.out-folder', 'item']
+    assert parse_double_quotes_vars('no variables') == []
+
+
+def test_render_double_quote_vars():
+    command = 'rtrace {{inputs.options}} {{ inputs.octree }} < {{inputs.grid}}'
+
+    assert render_double_quote_vars(
+        command, {'inputs.octree': 'scene.oct', 'inputs.grid': r'C:\grids\room.pts'}
+    ) == r'rtrace {{inputs.options}} scene.oct < C:\grids\room.pts'
+
+    assert replace_double_quote_vars(command, 'inputs.options', '-ab 2') == \
+        'rtrace -ab 2 {{ inputs.octree }} < {{inputs.grid}}'
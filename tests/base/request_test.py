@@ -0,0 +1,137 @@
+import os
+import gzip
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib import request
+from urllib.error import HTTPError, URLError
+
+import pytest
+
+from queenbee.base.request import HTTPSession
+
+# keep the real implementation. conftest serves the session from the test assets.
+SESSION_OPEN = HTTPSession.open
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    connections = set()
+    requests = []
+    failures = 0
+
+    def log_message(self, *args):
+        pass
+
+    def do_CONNECT(self):
+        Handler.requests.append(
+            (self.command, self.path, self.headers.get('Proxy-Authorization'))
+        )
+        self._reply(407, b'')
+
+    def do_GET(self):
+        Handler.connections.add(self.client_address)
+        Handler.requests.append(
+            (self.command, self.path, self.headers.get('Proxy-Authorization'))
+        )
+        if self.path == '/flaky' and Handler.failures < 1:
+            Handler.failures += 1
+            return self._reply(503, b'')
+        if self.path == '/moved':
+            self.send_response(302)
+            self.send_header('Location', '/index.json')
+            self.send_header('Content-Length', '0')
+            return self.end_headers()
+        if self.path == '/missing':
+            return self._reply(404, b'not found')
+        body = b'{"name": "test-repo"}'
+        if self.path == '/package.tgz':
+            return self._reply(200, gzip.compress(body + os.urandom(1024 ** 2)), gzip=True)
+        if 'gzip' in self.headers.get('Accept-Encoding', ''):
+            return self._reply(200, gzip.compress(body), gzip=True)
+        self._reply(200, body)
+
+    def _reply(self, status, body, gzip=False):
+        self.send_response(status)
+        if gzip:
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server_url(monkeypatch):
+    monkeypatch.setattr(HTTPSession, 'open', SESSION_OPEN)
+    Handler.connections = set()
+    Handler.requests = []
+    Handler.failures = 0
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_port}'
+    server.shutdown()
+    server.server_close()
+
+
+def test_session_reuses_connections(server_url):
+    session = HTTPSession(backoff=0)
+
+    for path in ('/index.json', '/flaky', '/moved'):
+        res = session.open(request.Request(f'{server_url}{path}'))
+        assert res.read() == b'{"name": "test-repo"}'
+        assert res.headers.get('Content-Encoding') is None
+
+    assert res.geturl() == f'{server_url}/index.json'
+
+    # streamed responses release their connection once read
+    with session.open(request.Request(f'{server_url}/index.json'), stream=True) as res:
+        assert res.read(9) + res.read() == b'{"name": "test-repo"}'
+    session.open(request.Request(f'{server_url}/index.json')).read()
+
+    assert len(Handler.connections) == 1
+
+    # gzip encoded streams close their connection when closed before the end
+    res = session.open(request.Request(f'{server_url}/package.tgz'), stream=True)
+    body = res.fp.fileobj
+    assert res.read(9) == b'{"name": '
+    res.close()
+    assert body.closed
+    assert session.open(request.Request(f'{server_url}/index.json')).read() == \
+        b'{"name": "test-repo"}'
+    assert len(Handler.connections) == 2
+
+    with pytest.raises(HTTPError) as error:
+        session.open(request.Request(f'{server_url}/missing'))
+    assert error.value.code == 404
+
+    session.close()
+
+
+def test_session_uses_proxies(server_url, monkeypatch):
+    for name in ('http_proxy', 'https_proxy', 'no_proxy'):
+        monkeypatch.delenv(name.upper(), raising=False)
+    proxy = server_url.replace('http://', 'http://user:secret@')
+    monkeypatch.setenv('http_proxy', proxy)
+    monkeypatch.setenv('https_proxy', proxy)
+    monkeypatch.setenv('no_proxy', 'bypassed.invalid')
+
+    session = HTTPSession(retries=0, backoff=0)
+    credentials = 'Basic dXNlcjpzZWNyZXQ='
+
+    res = session.open(request.Request('http://repo.invalid/index.json?page=2'))
+    assert res.read() == b'{"name": "test-repo"}'
+    assert Handler.requests == [
+        ('GET', 'http://repo.invalid/index.json?page=2', credentials)
+    ]
+
+    # https requests are tunneled through the proxy
+    with pytest.raises(URLError):
+        session.open(request.Request('https://repo.invalid/index.json'))
+    assert Handler.requests[-1] == ('CONNECT', 'repo.invalid:443', credentials)
+
+    # hosts in no_proxy are reached directly
+    with pytest.raises(URLError):
+        session.open(request.Request('http://bypassed.invalid/index.json'))
+    assert len(Handler.requests) == 2
+
+    session.close()
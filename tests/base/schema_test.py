@@ -0,0 +1,57 @@
+import pytest
+from jsonschema.exceptions import ValidationError
+
+from queenbee.base import schema
+from queenbee.base.schema import spec_validator, validate_values
+from queenbee.io.inputs.alias import DAGStringInputAlias
+from queenbee.io.inputs.dag import DAGFolderInput, DAGIntegerInput
+
+
+def test_spec_validator_is_cached():
+    spec = {'type': 'integer', 'minimum': 0}
+
+    assert spec_validator(spec) is spec_validator({'minimum': 0, 'type': 'integer'})
+    assert validate_values([0, 1, 2], spec) == [0, 1, 2]
+
+    with pytest.raises(ValidationError):
+        validate_values([0, -1], spec)
+
+
+def test_validate_many():
+    input_ = DAGIntegerInput(name='count', default=1, spec={'maximum': 10})
+
+    assert input_.validate_spec(5) == 5
+    assert input_.validate_many([1, 2, 10]) == [1, 2, 10]
+
+    with pytest.raises(ValidationError):
+        input_.validate_many([1, 11])
+
+    with pytest.raises(ValidationError):
+        input_.validate_spec('5')
+
+
+def test_validate_many_resolves_the_spec_once(monkeypatch):
+    calls = []
+
+    def spy(spec):
+        calls.append(spec)
+        return spec_validator(spec)
+
+    monkeypatch.setattr(schema, 'spec_validator', spy)
+
+    alias = DAGStringInputAlias(
+        name='name', default='a', platform=['grasshopper'], handler=[],
+        spec={'maxLength': 3}
+    )
+    calls.clear()
+    assert alias.validate_many(['a', 'bb', 'ccc']) == ['a', 'bb', 'ccc']
+    assert calls == [{'maxLength': 3, 'type': 'string'}]
+
+    with pytest.raises(ValidationError):
+        alias.validate_many(['a', 'dddd'])
+
+    # values are checked before they are validated against the spec
+    folder = DAGFolderInput(name='folder', required=True, spec={'maxLength': 100})
+    assert folder.validate_many(['tests', 'queenbee']) == ['tests', 'queenbee']
+    with pytest.raises(AssertionError):
+        folder.validate_many(['tests', 'missing-folder'])
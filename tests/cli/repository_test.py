@@ -0,0 +1,74 @@
+import json
+import os
+from urllib import request
+
+import pytest
+from click.testing import CliRunner
+
+from queenbee.cli import main
+from queenbee.cli.context import Context
+from queenbee.config import Config
+from queenbee.config.repositories import RepositoryReference
+from queenbee.repository.cache import index_cache
+
+REPO_PATH = os.path.abspath('tests/assets/repository/test-repo')
+MISSING_PATH = os.path.abspath('tests/assets/missing')
+
+
+@pytest.fixture
+def runner(monkeypatch):
+    monkeypatch.setattr(request, 'urlopen', lambda req: open(
+        request.url2pathname(req.get_full_url()[len('file:'):]), 'rb'))
+    index_cache.clear()
+    try:
+        return CliRunner(mix_stderr=False)
+    except TypeError:
+        # stderr is always kept apart from click 8.2
+        return CliRunner()
+
+
+def invoke(runner, args, paths):
+    config = Config(repositories=[
+        RepositoryReference(name=name, path=path) for name, path in paths.items()
+    ])
+    context = Context(
+        config_directory='tests/assets/temp', config_path='tests/assets/temp/config.yml',
+        config=config
+    )
+    return runner.invoke(main, ['repo'] + args, obj=context)
+
+
+def test_list_repositories(runner):
+    result = invoke(
+        runner, ['list'], {'test-repo': REPO_PATH, 'missing': MISSING_PATH}
+    )
+
+    assert result.exit_code == 0
+    assert [repo['name'] for repo in json.loads(result.stdout)] == ['test-repo']
+    assert 'Failed to fetch repository missing' in result.stderr
+
+
+def test_list_repositories_all_failed(runner):
+    result = invoke(runner, ['list'], {'missing': MISSING_PATH})
+
+    assert result.exit_code == 1
+    assert 'Failed to fetch any repository' in result.stderr
+
+
+def test_search_repositories(runner):
+    result = invoke(
+        runner, ['search', '-s', 'daylight'],
+        {'test-repo': REPO_PATH, 'missing': MISSING_PATH}
+    )
+
+    assert result.exit_code == 0
+    packages = json.loads(result.stdout)
+    assert [(p['name'], p['slug']) for p in packages] == \
+        [('daylight-factor', 'test-repo/daylight-factor')]
+    assert 'readme' not in packages[0]
+    assert 'Failed to fetch repository missing' in result.stderr
+
+    result = invoke(runner, ['search', '-s', 'nothing-matches'], {'test-repo': REPO_PATH})
+
+    assert result.exit_code == 0
+    assert json.loads(result.stdout) == []
@@ -0,0 +1,68 @@
+import os
+import threading
+from urllib import request
+
+import pytest
+
+from queenbee.config import Config
+from queenbee.config.repositories import RepositoryReference
+from queenbee.repository.cache import index_cache
+
+REPO_PATH = os.path.abspath('tests/assets/repository/test-repo')
+
+
+@pytest.fixture
+def local_urlopen(monkeypatch):
+    monkeypatch.setattr(request, 'urlopen', lambda req: open(
+        request.url2pathname(req.get_full_url()[len('file:'):]), 'rb'))
+    index_cache.clear()
+
+
+def test_fetch_repositories(local_urlopen):
+    config = Config(repositories=[
+        RepositoryReference(name='test-repo', path=REPO_PATH),
+        RepositoryReference(name='missing', path=os.path.abspath('tests/assets/missing')),
+    ])
+
+    results = {repo.name: (index, error) for repo, index, error in
+               config.fetch_repositories(validate=False)}
+
+    index, error = results['test-repo']
+    assert error is None
+    assert index.metadata.name == 'test-repo'
+
+    index, error = results['missing']
+    assert index is None
+    assert isinstance(error, OSError)
+
+    # only the named repositories are fetched
+    assert [repo.name for repo, _, _ in config.fetch_repositories(names=['missing'])] \
+        == ['missing']
+
+
+def test_fetch_repositories_timeout(local_urlopen, monkeypatch):
+    release = threading.Event()
+    fetch = RepositoryReference.fetch
+
+    def slow_fetch(self, *args, **kwargs):
+        if self.name == 'slow':
+            release.wait(5)
+        return fetch(self, *args, **kwargs)
+
+    monkeypatch.setattr(RepositoryReference, 'fetch', slow_fetch)
+
+    config = Config(repositories=[
+        RepositoryReference(name='slow', path=REPO_PATH),
+        RepositoryReference(name='test-repo', path=REPO_PATH),
+    ])
+
+    try:
+        results = list(config.fetch_repositories(timeout=0.5))
+    finally:
+        release.set()
+
+    # repositories are yielded as they are fetched
+    assert [repo.name for repo, _, _ in results] == ['test-repo', 'slow']
+    assert results[0][1].metadata.name == 'test-repo'
+    assert results[1][1] is None
+    assert isinstance(results[1][2], TimeoutError)
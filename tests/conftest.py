@@ -1,7 +1,14 @@
 import pytest
 import os
 import shutil
+from email.message import Message
 from urllib import request, parse
+from urllib.response import addinfourl
+
+from queenbee.base.request import HTTPSession
+
+# keep packages fetched during the tests out of the user cache folder
+os.environ['QUEENBEE_CACHE_FOLDER'] = 'tests/assets/temp/cache'
 
 
 @pytest.fixture(autouse=True)
@@ -20,6 +27,10 @@ def mock_repository_url(monkeypatch):
         url = req.get_full_url()
         parsed = parse.urlparse(url)
         file_path = f'{repo_base_bath}{parsed.path}'
-        return open(file_path, 'rb')
+        return addinfourl(open(file_path, 'rb'), Message(), url, 200)
 
     monkeypatch.setattr(request, 'urlopen', urlopen_mock)
+    # serve the requests of the http session with the (possibly patched) urlopen
+    monkeypatch.setattr(
+        HTTPSession, 'open', lambda self, req, stream=False: request.urlopen(req)
+    )
@@ -1,8 +1,10 @@
 import yaml
+import pytest
 from tests.base.io_test import BaseIOTest
 from tests.base.value_error import BaseValueErrorTest
 
-from queenbee.plugin.function import Function
+from queenbee.base.parser import render_double_quote_vars
+from queenbee.plugin.function import Function, CompiledCommand
 
 ASSET_FOLDER = 'tests/assets/functions'
 
@@ -19,3 +21,21 @@ class TestValueError(BaseValueErrorTest):
     klass = Function
 
     asset_folder = ASSET_FOLDER
+
+
+def test_compiled_command():
+    function = Function.from_file(f'{ASSET_FOLDER}/valid/function.yaml')
+    compiled = function.compile_command()
+
+    values = {name: f'value-{i}' for i, name in enumerate(compiled.variables)}
+    expected = render_double_quote_vars(function.command, values)
+
+    assert compiled.render(values) == expected
+
+    command = CompiledCommand('awk \'{print $1}\' {{inputs.file}} > {{ inputs.file }}.out')
+    assert command.variables == ('inputs.file', 'inputs.file')
+    assert command.render({'inputs.file': 'grid.pts'}) == \
+        'awk \'{print $1}\' grid.pts > grid.pts.out'
+
+    with pytest.raises(ValueError):
+        command.render({})
@@ -3,6 +3,7 @@ from tests.base.io_test import BaseIOTest
 from tests.base.value_error import BaseValueErrorTest
 from tests.base.folder_test import BaseFolderTest
 
+from queenbee.base.basemodel import digest_scope
 from queenbee.plugin import Plugin
 
 ASSET_FOLDER = 'tests/assets/plugins'
@@ -27,3 +28,44 @@ class TestFolder(BaseFolderTest):
     klass = Plugin
 
     asset_folder = ASSET_FOLDER
+
+
+def test_hash_digest_follows_changes():
+    plugin = Plugin.from_file(f'{ASSET_FOLDER}/valid/honeybee-radiance.yaml')
+    digest = plugin.hash_digest()
+
+    assert plugin.__hash__ == digest
+
+    plugin.functions[0].name = 'renamed-function'
+    assert plugin.hash_digest() != digest
+
+    digest = plugin.hash_digest()
+    plugin.metadata.keywords.append('new-keyword')
+    assert plugin.hash_digest() != digest
+
+    digest = plugin.hash_digest()
+    plugin.functions.pop()
+    assert plugin.hash_digest() != digest
+
+    copied = plugin.copy(update={'config': plugin.config.copy(deep=True)})
+    assert copied.hash_digest() == plugin.hash_digest()
+
+    renamed = plugin.copy(deep=True)
+    renamed.metadata.name = 'renamed-plugin'
+    assert renamed.hash_digest() != plugin.hash_digest()
+
+
+def test_hash_digest_scope():
+    plugin = Plugin.from_file(f'{ASSET_FOLDER}/valid/honeybee-radiance.yaml')
+
+    with digest_scope():
+        digest = plugin.hash_digest()
+        excluded = plugin.copy(exclude={'functions'})
+        assert excluded.hash_digest() != digest
+
+        # the digest is computed once in the scope
+        with digest_scope():
+            plugin.metadata.keywords.append('new-keyword')
+            assert plugin.hash_digest() == digest
+
+    assert plugin.hash_digest() != digest
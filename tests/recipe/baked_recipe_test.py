@@ -2,7 +2,10 @@ import os
 import pytest
 from tests.base._base import BaseTestClass
 
+from queenbee.base.basemodel import digest_scope
 from queenbee.recipe import BakedRecipe, Recipe
+from queenbee.recipe.cache import bake_cache
+from queenbee.recipe.dependency import Dependency
 
 ASSET_FOLDER = 'tests/assets/recipes'
 
@@ -58,6 +61,43 @@ class TestFolder(BaseTestClass):
     def test_from_recipe_instance(self, recipe):
         parsed_instance = BakedRecipe.from_recipe(recipe)
 
+    def test_from_recipe_deterministic(self, recipe):
+        sequential = BakedRecipe.from_recipe(recipe, max_workers=1)
+        concurrent = BakedRecipe.from_recipe(recipe, max_workers=8)
+
+        assert sequential == concurrent
+
+    def test_from_recipe_matches_validated(self, recipe):
+        baked_recipe = BakedRecipe.from_recipe(recipe)
+        validated = BakedRecipe.parse_obj(baked_recipe.to_dict())
+
+        assert baked_recipe == validated
+        assert baked_recipe.hash_digest() == validated.hash_digest()
+        # fields are in the same order as in validated models
+        assert baked_recipe.json() == validated.json()
+        for template, validated_template in zip(
+            baked_recipe.templates, validated.templates
+        ):
+            assert list(template.__dict__) == list(validated_template.__dict__)
+
+    def test_get_template(self, recipe):
+        baked_recipe = BakedRecipe.from_recipe(recipe)
+
+        for template in baked_recipe.templates + baked_recipe.flow:
+            assert baked_recipe.get_template(template.name) is template
+
+        assert baked_recipe.get_template(f'{baked_recipe.digest}/main') is \
+            baked_recipe.root_dag
+
+        with pytest.raises(ValueError):
+            baked_recipe.get_template('missing-template')
+
+        removed = baked_recipe.templates[-1]
+        baked_recipe.templates = baked_recipe.templates[:-1]
+        if removed.name not in [t.name for t in baked_recipe.templates]:
+            with pytest.raises(ValueError):
+                baked_recipe.get_template(removed.name)
+
     @pytest.fixture(scope='function')
     def error_message(self, request):
         file_path, _ = os.path.splitext(request.param)
@@ -78,3 +118,84 @@ class TestFolder(BaseTestClass):
         invalid_recipe = Recipe.from_file(invalid_recipe)
         with pytest.raises(ValueError, match=error_message):
             BakedRecipe.from_recipe(invalid_recipe)
+
+
+def test_from_recipe_bake_cache(monkeypatch):
+    recipe = Recipe.from_file(os.path.join(ASSET_FOLDER, 'valid', 'daylight-factor.yaml'))
+    assert all(dependency.is_locked for dependency in recipe.dependencies)
+
+    baked_recipe = BakedRecipe.from_recipe(recipe)
+
+    def fetch(*args, **kwargs):
+        raise AssertionError('The dependencies should not be fetched')
+
+    monkeypatch.setattr(Dependency, 'fetch', fetch)
+
+    assert BakedRecipe.from_recipe(recipe) == baked_recipe
+
+    with pytest.raises(AssertionError):
+        BakedRecipe.from_recipe(recipe, use_cache=False)
+
+
+def test_bake_cache_loads_trusted_recipes():
+    recipe_path = os.path.join(ASSET_FOLDER, 'valid', 'daylight-factor.yaml')
+    recipe = Recipe.from_file(recipe_path)
+    validated = BakedRecipe.from_recipe(recipe, use_cache=False)
+
+    digest = recipe.hash_digest()
+    key = bake_cache.key('recipe', digest, recipe.dependencies)
+    bake_cache.add_recipe(key, validated)
+
+    cached = bake_cache.get_recipe(key, digest)
+    assert cached.json() == validated.json()
+    assert [type(template) for template in cached.templates] == \
+        [type(template) for template in validated.templates]
+    assert cached.dependencies[0].kind == validated.dependencies[0].kind
+
+    # entries of another recipe are removed
+    assert bake_cache.get_recipe(key, 'another-digest') is None
+    assert bake_cache.get(key) is None
+
+
+def test_from_recipe_bake_cache_follows_changes():
+    recipe_path = os.path.join(ASSET_FOLDER, 'valid', 'daylight-factor.yaml')
+    recipe = Recipe.from_file(recipe_path)
+
+    with digest_scope():
+        recipe.hash_digest()
+        recipe.metadata.keywords.append('new-keyword')
+        baked_recipe = BakedRecipe.from_recipe(recipe)
+
+    assert 'new-keyword' in baked_recipe.metadata.keywords
+
+    baked_recipe = BakedRecipe.from_recipe(Recipe.from_file(recipe_path))
+    assert 'new-keyword' not in baked_recipe.metadata.keywords
+
+
+def test_from_recipe_shared_dependencies(monkeypatch):
+    recipe = Recipe.from_folder(
+        os.path.join(ASSET_FOLDER, 'folders', 'parametric-daylight-factor'))
+    sub_recipe = recipe.dependencies[0]
+    sub_recipe.digest = None
+
+    # the same plugin version the daylight-factor recipe package is locked to
+    plugin = Dependency(
+        kind='plugin', name='honeybee-radiance', tag='1.2.3', source=sub_recipe.source,
+        hash='69b43aedf58787f103d597b39f5e9a44c0a6ff3017208ad8f3a973a2143d7d03'
+    )
+    recipe.dependencies.append(plugin)
+
+    fetched = []
+    fetch = Dependency.fetch
+
+    def fetch_spy(self, *args, **kwargs):
+        fetched.append(self.name)
+        return fetch(self, *args, **kwargs)
+
+    monkeypatch.setattr(Dependency, 'fetch', fetch_spy)
+
+    baked_recipe = BakedRecipe.from_recipe(recipe, use_cache=False)
+
+    assert sorted(fetched) == ['daylight-factor', 'honeybee-radiance']
+    assert len(baked_recipe.templates) == \
+        len(set(template.name for template in baked_recipe.templates))
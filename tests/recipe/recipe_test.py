@@ -1,8 +1,16 @@
+import os
+import json
+import shutil
+import pytest
+import yaml
+
 from tests.base.io_test import BaseIOTest
 from tests.base.value_error import BaseValueErrorTest
 from tests.base.folder_test import BaseFolderTest
 
-from queenbee.recipe import Recipe
+from queenbee.io.inputs.job import JobArgument, JobPathArgument
+from queenbee.recipe import Recipe, RecipeInterface
+from queenbee.recipe.dependency import Dependency
 
 ASSET_FOLDER = 'tests/assets/recipes'
 
@@ -26,3 +34,94 @@ class TestFolder(BaseFolderTest):
     klass = Recipe
 
     asset_folder = ASSET_FOLDER
+
+
+def test_write_dependency_file():
+    folder = os.path.join('tests', 'assets', 'temp', 'recipe')
+    os.makedirs(folder)
+    recipe = Recipe.from_folder(os.path.join(ASSET_FOLDER, 'folders', 'daylight-factor'))
+
+    recipe.write_dependency_file(folder)
+
+    with open(os.path.join(folder, 'dependencies.yaml')) as f:
+        dependencies = yaml.safe_load(f)
+
+    assert dependencies == {
+        'dependencies': json.loads(
+            recipe.json(by_alias=True, exclude_unset=True))['dependencies']
+    }
+
+
+def test_write_dependencies_incremental(monkeypatch):
+    folder = os.path.join('tests', 'assets', 'temp', 'recipe')
+    recipe = Recipe.from_folder(os.path.join(ASSET_FOLDER, 'folders', 'daylight-factor'))
+    for dependency in recipe.dependencies:
+        dependency.digest = None
+    recipe.lock_dependencies()
+
+    recipe.write_dependencies(folder)
+
+    plugin_path = os.path.join(folder, '.dependencies', 'plugin', 'honeybee-radiance')
+    stale_path = os.path.join(folder, '.dependencies', 'recipe', 'stale-recipe')
+    assert os.path.isfile(os.path.join(plugin_path, 'package.yaml'))
+    os.makedirs(stale_path)
+
+    def fetch(*args, **kwargs):
+        raise AssertionError('Synced dependencies should not be fetched')
+
+    with monkeypatch.context() as m:
+        m.setattr(Dependency, 'fetch', fetch)
+        recipe.write_dependencies(folder)
+
+    assert os.path.isfile(os.path.join(plugin_path, 'package.yaml'))
+    assert not os.path.exists(stale_path)
+
+    # a dependency replaced by a link is written again
+    shutil.rmtree(plugin_path)
+    try:
+        os.symlink(os.path.abspath(stale_path), plugin_path)
+    except (OSError, NotImplementedError):
+        # creating links requires extra privileges on windows
+        pytest.skip('symbolic links are not supported')
+    recipe.write_dependencies(folder)
+
+    assert not os.path.islink(plugin_path)
+    assert os.path.isfile(os.path.join(plugin_path, 'package.yaml'))
+
+
+def test_validate_job_arguments():
+    recipe = Recipe.from_file(os.path.join(ASSET_FOLDER, 'valid', 'daylight-factor.yaml'))
+    interface = RecipeInterface.from_recipe(recipe)
+    interface.inputs[-1].spec = {'minimum': 1}
+    grid = {
+        'type': 'JobPathArgument', 'name': 'input-grid',
+        'source': {'type': 'ProjectFolder', 'path': 'grid.pts'}
+    }
+    model = JobPathArgument.parse_obj(dict(grid, name='model_hbjson'))
+
+    errors = interface.validate_job_arguments([
+        [grid, model, JobArgument(name='sensor-grid-count', value='200')],
+        [grid, model, {'type': 'JobArgument', 'name': 'sensor-grid-count', 'value': 0}],
+        [grid, {'type': 'JobArgument', 'name': 'model_hbjson', 'value': 'model.hbjson'},
+         {'type': 'JobArgument', 'name': 'sensor-grid-count', 'value': 'ten'}],
+        [dict(grid, name='radiance-parameters'),
+         {'type': 'JobArgument', 'name': 'grid-count', 'value': '10'}],
+        [grid, model, {'type': 'JobArgument', 'name': 'sensor-grid-count', 'value': 1.5}],
+        [grid, model, {'type': 'JobArgument', 'name': 'sensor-grid-count', 'value': 2.0}],
+    ])
+
+    assert errors[0] == []
+    assert len(errors[1]) == 1 and 'sensor-grid-count' in errors[1][0]
+    assert len(errors[2]) == 2
+    assert 'must be set using a JobPathArgument' in errors[2][0]
+    assert 'Invalid value for sensor-grid-count' in errors[2][1]
+    assert errors[3] == [
+        'radiance-parameters is not a file, folder or path input.',
+        'grid-count is not an input of this recipe.',
+        'Missing required argument: input-grid',
+        'Missing required argument: model_hbjson',
+        'Missing required argument: sensor-grid-count',
+    ]
+    # floats are only accepted for integer inputs if they are whole numbers
+    assert errors[4] == ['Invalid value for sensor-grid-count: 1.5 is not an integer']
+    assert errors[5] == []
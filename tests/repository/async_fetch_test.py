@@ -0,0 +1,165 @@
+import asyncio
+import gzip
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from urllib.error import HTTPError
+
+import pytest
+
+pytest.importorskip('aiohttp')
+
+from queenbee.base import async_request  # noqa: E402
+from queenbee.base.async_request import AsyncHTTPSession  # noqa: E402
+from queenbee.recipe.dependency import Dependency  # noqa: E402
+from queenbee.repository.cache import index_cache, package_cache  # noqa: E402
+
+PLUGIN_DIGEST = '38e9b4ebb5e7f13b92f162975af3fc3dc1b0cd023c9b0c3a87d3a18f3ad906df'
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    connections = set()
+    requests = []
+    failures = 0
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        Handler.connections.add(self.client_address)
+        Handler.requests.append(self.path)
+        if self.path == '/flaky' and Handler.failures < 1:
+            Handler.failures += 1
+            return self._reply(503, b'')
+        if self.path == '/flaky':
+            return self._reply(200, b'{"name": "test-repo"}')
+        try:
+            with open(f'tests/assets/repository{self.path}', 'rb') as f:
+                body = f.read()
+        except OSError:
+            return self._reply(404, b'not found')
+        if 'gzip' in self.headers.get('Accept-Encoding', ''):
+            return self._reply(200, gzip.compress(body), gzip=True)
+        self._reply(200, body)
+
+    def _reply(self, status, body, gzip=False):
+        self.send_response(status)
+        if gzip:
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server_url():
+    Handler.connections = set()
+    Handler.requests = []
+    Handler.failures = 0
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_port}'
+    server.shutdown()
+    server.server_close()
+
+
+def test_async_session(server_url):
+    session = AsyncHTTPSession(backoff=0)
+    index_url = f'{server_url}/test-repo/index.json'
+
+    with open('tests/assets/repository/test-repo/index.json', 'rb') as f:
+        index = f.read()
+
+    async def fetch():
+        try:
+            res = await session.open(index_url, {})
+            assert res.read() == index
+            assert res.headers.get('Content-Encoding') is None
+
+            # failed requests are retried
+            res = await session.open(f'{server_url}/flaky', {})
+            assert res.read() == b'{"name": "test-repo"}'
+
+            # the body is written to the sink as it is received
+            sink = BytesIO()
+            res = await session.open(index_url, {}, sink=sink)
+            assert res.read() == b''
+            assert sink.getvalue() == index
+
+            with pytest.raises(HTTPError) as error:
+                await session.open(f'{server_url}/missing', {})
+            assert error.value.code == 404
+        finally:
+            await session.close()
+
+    asyncio.run(fetch())
+
+    assert Handler.requests.count('/flaky') == 2
+    assert len(Handler.connections) == 1
+
+
+def test_async_session_per_event_loop(server_url):
+    session = AsyncHTTPSession(backoff=0)
+    index_url = f'{server_url}/test-repo/index.json'
+
+    async def fetch():
+        await session.open(index_url, {})
+        return await session._get_session()
+
+    # event loops that end without closing the session close their own session
+    ended = asyncio.run(fetch())
+    assert ended.closed
+
+    # an event loop running in another thread
+    thread_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=thread_loop.run_forever, daemon=True)
+    thread.start()
+    running = asyncio.run_coroutine_threadsafe(fetch(), thread_loop).result()
+
+    async def fetch_and_close():
+        current = await fetch()
+        assert not running.closed
+        await session.close()
+        return current
+
+    try:
+        current = asyncio.run(fetch_and_close())
+    finally:
+        thread_loop.call_soon_threadsafe(thread_loop.stop)
+        thread.join()
+        thread_loop.close()
+
+    assert ended is not running and running is not current
+    assert running.closed and current.closed
+
+
+def test_dependency_afetch(server_url):
+    index_cache.clear()
+    package_cache.clear()
+
+    dependency = Dependency(
+        kind='plugin',
+        name='honeybee-radiance',
+        tag='1.2.3',
+        source=f'{server_url}/test-repo',
+    )
+
+    async def fetch():
+        try:
+            return await dependency.afetch()
+        finally:
+            await async_request.session.close()
+
+    version = asyncio.run(fetch())
+
+    assert version.digest == PLUGIN_DIGEST
+    assert dependency.digest == PLUGIN_DIGEST
+    assert Handler.requests == [
+        '/test-repo/index.json', '/test-repo/plugins/honeybee-radiance-1.2.3.tgz'
+    ]
+
+    # locked dependencies are served from the package cache
+    assert asyncio.run(fetch()) == version
+    assert len(Handler.requests) == 2
@@ -0,0 +1,169 @@
+import os
+import shutil
+from email.message import Message
+from urllib import request
+from urllib.error import HTTPError
+from urllib.response import addinfourl
+
+from queenbee.repository import RepositoryIndex
+from queenbee.repository.cache import IndexCache
+from queenbee.repository.search import SearchIndex
+
+INDEX_PATH = 'tests/assets/repository/test-repo/index.json'
+INDEX_URL = 'https://example.com/test-repo/index.json'
+
+
+def test_remote_index_is_memoized(monkeypatch):
+    requests = []
+
+    def urlopen_mock(req):
+        requests.append(req)
+        if req.get_header('If-none-match') == '"v1"':
+            raise HTTPError(req.get_full_url(), 304, 'Not Modified', Message(), None)
+        headers = Message()
+        headers['ETag'] = '"v1"'
+        return addinfourl(open(INDEX_PATH, 'rb'), headers, req.get_full_url(), 200)
+
+    monkeypatch.setattr(request, 'urlopen', urlopen_mock)
+
+    cache = IndexCache(ttl=60)
+
+    first = cache.fetch(INDEX_URL)
+    second = cache.fetch(INDEX_URL)
+
+    assert len(requests) == 1
+    # cached indexes are shared rather than copied
+    assert first is second
+
+    # an expired index is revalidated instead of downloaded again
+    cache.ttl = 0
+    third = cache.fetch(INDEX_URL)
+
+    assert len(requests) == 2
+    assert requests[1].get_header('If-none-match') == '"v1"'
+    assert third == first
+
+
+def test_remote_index_is_cached_per_credentials(monkeypatch):
+    requests = []
+
+    def urlopen_mock(req):
+        requests.append(req)
+        return addinfourl(open(INDEX_PATH, 'rb'), Message(), req.get_full_url(), 200)
+
+    monkeypatch.setattr(request, 'urlopen', urlopen_mock)
+
+    cache = IndexCache(ttl=60)
+
+    user_a = cache.fetch(INDEX_URL, auth_header={'Authorization': 'Bearer a'})
+    user_b = cache.fetch(INDEX_URL, auth_header={'Authorization': 'Bearer b'})
+    anonymous = cache.fetch(INDEX_URL)
+
+    assert len(requests) == 3
+    assert [req.get_header('Authorization') for req in requests] == \
+        ['Bearer a', 'Bearer b', None]
+    assert user_a is not user_b and user_a is not anonymous
+
+    assert cache.fetch(INDEX_URL, auth_header={'Authorization': 'Bearer a'}) is user_a
+    assert len(requests) == 3
+
+
+def test_remote_search_index_is_downloaded(monkeypatch):
+    folder = 'tests/assets/temp/search-repo'
+    os.makedirs(folder)
+    index = RepositoryIndex.from_file(INDEX_PATH)
+    index.to_folder(folder)
+
+    requests = []
+
+    def urlopen_mock(req):
+        url = req.get_full_url()
+        requests.append((url, req.get_header('Authorization')))
+        path = os.path.join(folder, url.rsplit('/', 1)[1])
+        return addinfourl(open(path, 'rb'), Message(), url, 200)
+
+    monkeypatch.setattr(request, 'urlopen', urlopen_mock)
+
+    def from_index(index):
+        raise AssertionError('The search index should be downloaded')
+
+    build = SearchIndex.from_index
+    monkeypatch.setattr(SearchIndex, 'from_index', from_index)
+
+    cache = IndexCache()
+    auth_header = {'Authorization': 'Bearer a'}
+    fetched = cache.fetch(INDEX_URL, auth_header=auth_header)
+
+    # the search index is only downloaded once the index is searched
+    assert requests == [(INDEX_URL, 'Bearer a')]
+    assert [p.name for p in fetched.search(search_string='rad')] == \
+        ['honeybee-radiance', 'daylight-factor']
+    assert fetched.search(search_string='daylight') == \
+        index.search(search_string='daylight')
+    assert requests[1:] == [
+        ('https://example.com/test-repo/search-index.json', 'Bearer a')
+    ]
+
+    # the search index is built from the index if the repository does not have one
+    monkeypatch.setattr(SearchIndex, 'from_index', build)
+    os.remove(os.path.join(folder, SearchIndex.file_name))
+    cache.clear()
+    fetched = cache.fetch(INDEX_URL)
+
+    assert [p.name for p in fetched.search(search_string='rad')] == \
+        ['honeybee-radiance', 'daylight-factor']
+    assert len(requests) == 4
+
+
+def test_local_index_is_parsed_when_modified(monkeypatch):
+    folder = os.path.abspath('tests/assets/temp/local-repo')
+    os.makedirs(folder)
+    index_path = os.path.join(folder, 'index.json')
+    shutil.copy(INDEX_PATH, index_path)
+
+    monkeypatch.setattr(request, 'urlopen', lambda req: open(
+        request.url2pathname(req.get_full_url()[len('file:'):]), 'rb'))
+
+    cache = IndexCache()
+    url = f'file:{index_path}'
+
+    first = cache.fetch(url)
+
+    assert cache.fetch(url) is first
+    assert first.metadata.name == 'test-repo'
+
+    with open(index_path) as f:
+        content = f.read()
+    with open(index_path, 'w') as f:
+        f.write(content.replace('"name": "test-repo"', '"name": "local-repo"'))
+    os.utime(index_path, ns=(0, 0))
+
+    assert cache.fetch(url).metadata.name == 'local-repo'
+
+
+def test_repository_reference_labels_a_copy(monkeypatch):
+    from queenbee.config.repositories import RepositoryReference
+    from queenbee.repository.cache import index_cache
+
+    monkeypatch.setattr(request, 'urlopen', lambda req: open(
+        request.url2pathname(req.get_full_url()[len('file:'):]), 'rb'))
+    index_cache.clear()
+
+    path = os.path.abspath('tests/assets/repository/test-repo')
+    first = RepositoryReference(name='first', path=path)
+    second = RepositoryReference(name='second', path=path)
+
+    first_index = first.fetch(validate=False)
+    second_index = second.fetch(validate=False)
+    shared = index_cache.fetch(first._index_url(), validate=False)
+
+    assert first_index.metadata.name == 'first'
+    assert second_index.metadata.name == 'second'
+    assert first_index.package_by_tag('recipe', 'daylight-factor', 'latest').slug == \
+        'first/daylight-factor'
+    assert second_index.package_by_tag('recipe', 'daylight-factor', 'latest').slug == \
+        'second/daylight-factor'
+    assert shared.metadata.name == 'test-repo'
+
+    # the labelled copy is reused while the cached index is unchanged
+    assert first.fetch(validate=False) is first_index
@@ -0,0 +1,151 @@
+import os
+import json
+import shutil
+
+import pytest
+
+from queenbee.repository import RepositoryIndex
+from queenbee.repository.package import PackageVersion
+from queenbee.repository.manifest import IndexManifest
+
+INDEX_PATH = 'tests/assets/repository/test-repo/index.json'
+
+
+def read_index():
+    with open(INDEX_PATH) as f:
+        return f.read()
+
+
+def test_from_trusted():
+    raw = read_index()
+
+    validated = RepositoryIndex.parse_raw(raw)
+    trusted = RepositoryIndex.from_trusted(raw)
+
+    assert trusted == validated
+    assert trusted.json() == validated.json()
+
+    assert trusted.metadata.plugin_count == 1
+    assert trusted.metadata.recipe_count == 1
+
+    package = trusted.package_by_tag('plugin', 'honeybee-radiance', '1.2.3')
+    assert package.slug == 'test-repo/honeybee-radiance'
+    assert package.kind == 'plugin'
+    assert trusted.package_by_digest('plugin', 'honeybee-radiance', package.digest) \
+        == package
+
+    assert [p.name for p in trusted.search(search_string='honeybee-rad')] == \
+        ['honeybee-radiance']
+
+
+def test_lookup_follows_indexed_versions():
+    index = RepositoryIndex.parse_raw(read_index())
+    package = index.package_by_tag('plugin', 'honeybee-radiance', '1.2.3')
+
+    new_version = package.copy(update={
+        'tag': '1.2.4', 'digest': 'new-digest',
+        'created': package.created.replace(year=package.created.year + 1),
+    })
+    index.index_plugin_version(new_version)
+
+    assert index.package_by_tag('plugin', 'honeybee-radiance', '1.2.4') is new_version
+    assert index.package_by_digest('plugin', 'honeybee-radiance', 'new-digest') \
+        is new_version
+    assert index.package_by_tag('plugin', 'honeybee-radiance', 'latest') is new_version
+
+    replaced = new_version.copy(update={'digest': 'replaced-digest'})
+    index.index_plugin_version(replaced, overwrite=True)
+
+    assert index.package_by_tag('plugin', 'honeybee-radiance', '1.2.4') is replaced
+    assert index.package_by_tag('plugin', 'honeybee-radiance', 'latest') is replaced
+    with pytest.raises(ValueError):
+        index.package_by_digest('plugin', 'honeybee-radiance', 'new-digest')
+
+
+def test_get_latest_does_not_mutate():
+    index = RepositoryIndex.parse_raw(read_index())
+    package = index.package_by_tag('plugin', 'honeybee-radiance', '1.2.3')
+    newer = package.copy(update={
+        'tag': '2.0.0', 'created': package.created.replace(year=package.created.year + 1)
+    })
+
+    versions = [newer, package]
+
+    assert RepositoryIndex.get_latest(versions) is newer
+    assert versions == [newer, package]
+
+
+def test_index_manifest(monkeypatch):
+    folder = os.path.join('tests', 'assets', 'temp', 'test-repo')
+    shutil.copytree(os.path.dirname(INDEX_PATH), folder)
+
+    index = RepositoryIndex.from_folder(folder, use_index_manifest=True)
+    assert os.path.isfile(os.path.join(folder, IndexManifest.file_name))
+
+    read_packages = []
+    from_package = PackageVersion.from_package
+
+    def spy(package_path, **kwargs):
+        read_packages.append(package_path)
+        return from_package(package_path, **kwargs)
+
+    monkeypatch.setattr(PackageVersion, 'from_package', spy)
+
+    cached = RepositoryIndex.from_folder(folder, use_index_manifest=True)
+    assert read_packages == []
+    cached.generated = index.generated
+    assert json.loads(cached.json()) == json.loads(index.json())
+
+    index.merge_folder(folder, use_index_manifest=True)
+    assert read_packages == []
+
+    # a changed package is read again
+    package_path = os.path.join(folder, 'plugins', 'honeybee-radiance-1.2.3.tgz')
+    stat = os.stat(package_path)
+    os.utime(package_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+    index.merge_folder(folder, use_index_manifest=True)
+    assert read_packages == [package_path]
+
+
+def test_from_folder_jobs():
+    folder = os.path.dirname(INDEX_PATH)
+
+    index = RepositoryIndex.from_folder(folder)
+    parallel = RepositoryIndex.from_folder(folder, jobs=2)
+    parallel.generated = index.generated
+
+    assert parallel.json() == index.json()
+
+
+def test_search_index():
+    folder = 'tests/assets/temp/search-repo'
+    os.makedirs(folder)
+    index = RepositoryIndex.from_file(INDEX_PATH)
+
+    assert [p.name for p in index.search(search_string='rad')] == \
+        ['honeybee-radiance', 'daylight-factor']
+    assert [p.name for p in index.search(search_string='daylight radiance')] == \
+        ['daylight-factor']
+    assert [p.name for p in index.search(search_string='Mostapha', kind='plugin')] == \
+        ['honeybee-radiance']
+    assert [p.name for p in index.search(search_string='rad', page=2, per_page=1)] == \
+        ['daylight-factor']
+    assert index.search(search_string='energyplus') == []
+    # parts of words do not match
+    assert index.search(search_string='ance') == []
+
+    for page, per_page in ((0, 1), (-1, 1), (1, 0)):
+        with pytest.raises(ValueError):
+            index.search(search_string='rad', page=page, per_page=per_page)
+
+    index.to_folder(folder)
+    loaded = RepositoryIndex.from_file(os.path.join(folder, 'index.json'))
+
+    assert loaded.load_search_index(folder)
+    assert loaded.search_index().postings == index.search_index().postings
+    assert loaded.search(search_string='rad') == index.search(search_string='rad')
+
+    # a search index saved for another version of the index is not used
+    loaded.generated = None
+    assert not loaded.load_search_index(folder)
@@ -0,0 +1,88 @@
+import os
+import pytest
+
+from queenbee.recipe.dependency import Dependency
+from queenbee.repository.cache import PackageCache, package_cache
+
+PLUGIN_DIGEST = '38e9b4ebb5e7f13b92f162975af3fc3dc1b0cd023c9b0c3a87d3a18f3ad906df'
+PLUGIN_PATH = 'tests/assets/repository/test-repo/plugins/honeybee-radiance-1.2.3.tgz'
+
+
+def test_locked_dependency_uses_cache(monkeypatch):
+    package_cache.clear()
+
+    dependency = Dependency(
+        kind='plugin',
+        name='honeybee-radiance',
+        tag='1.2.3',
+        source='https://example.com/test-repo',
+    )
+
+    package_version = dependency.fetch()
+
+    assert dependency.digest == PLUGIN_DIGEST
+    assert package_version.digest == PLUGIN_DIGEST
+    assert os.path.isfile(package_cache.path(PLUGIN_DIGEST))
+
+    def fail_fetch_index(*args, **kwargs):
+        raise AssertionError('locked dependency should not fetch the index')
+
+    monkeypatch.setattr(Dependency, '_fetch_index', fail_fetch_index)
+
+    cached_version = dependency.fetch()
+
+    assert cached_version == package_version
+    assert cached_version is not package_version
+
+
+def test_cache_evicts_corrupted_package():
+    cache = PackageCache(folder='tests/assets/temp/cache/corrupted')
+
+    cache.set(PLUGIN_DIGEST, b'not a tar file')
+
+    assert cache.get_package(PLUGIN_DIGEST) is None
+    assert not os.path.exists(cache.path(PLUGIN_DIGEST))
+
+
+def test_cache_lru_eviction():
+    cache = PackageCache(folder='tests/assets/temp/cache/lru', max_size=10)
+
+    cache.set('old', b'12345')
+    os.utime(cache.path('old'), (0, 0))
+    cache.set('new', b'67890')
+    cache.set('newer', b'abc')
+
+    assert cache.get('old') is None
+    assert cache.get('new') == b'67890'
+    assert cache.get('newer') == b'abc'
+
+
+def test_cached_package_is_scoped_by_credentials(monkeypatch):
+    package_cache.clear()
+
+    dependency = Dependency(
+        kind='plugin',
+        name='honeybee-radiance',
+        tag='1.2.3',
+        source='https://example.com/test-repo',
+    )
+
+    user_a = {'Authorization': 'Bearer a'}
+    package_version = dependency.fetch(auth_header=user_a)
+
+    assert os.path.isfile(package_cache.path(package_cache.key(PLUGIN_DIGEST, user_a)))
+    assert not os.path.isfile(package_cache.path(PLUGIN_DIGEST))
+    assert package_cache.get_package(PLUGIN_DIGEST, auth_header=user_a) == package_version
+    assert package_cache.get_package(PLUGIN_DIGEST) is None
+    assert package_cache.get_package(
+        PLUGIN_DIGEST, auth_header={'Authorization': 'Bearer b'}) is None
+
+    def fail_fetch_index(*args, **kwargs):
+        raise AssertionError('index fetched')
+
+    monkeypatch.setattr(Dependency, '_fetch_index', fail_fetch_index)
+
+    # another caller goes to the repository with its own credentials
+    with pytest.raises(AssertionError, match='index fetched'):
+        dependency.fetch(auth_header={'Authorization': 'Bearer b'})
+    assert dependency.fetch(auth_header=user_a) == package_version
@@ -0,0 +1,67 @@
+import os
+
+import pytest
+
+from queenbee.recipe import Recipe
+from queenbee.repository.cache import package_cache
+from queenbee.repository.package import PackageVersion, load_resource
+
+PACKAGE_PATH = 'tests/assets/repository/test-repo/recipes/daylight-factor-0.0.1.tgz'
+
+
+def test_from_package_metadata_only():
+    version = PackageVersion.from_package(PACKAGE_PATH)
+    metadata = PackageVersion.from_package(PACKAGE_PATH, metadata_only=True)
+
+    assert metadata.manifest is None
+    assert metadata.readme is None
+    assert metadata.digest == version.digest
+    assert metadata.dict(exclude={'manifest', 'readme', 'kind'}) == \
+        version.dict(exclude={'manifest', 'readme', 'kind'})
+
+
+def test_load_resource():
+    version = PackageVersion.from_package(PACKAGE_PATH)
+    data = version.manifest.to_dict()
+
+    assert isinstance(load_resource(data), Recipe)
+    version_data = version.to_dict(exclude={'manifest'})
+    version_data['manifest'] = data
+    assert isinstance(PackageVersion.parse_obj(version_data).manifest, Recipe)
+
+    data['type'] = 'Unknown'
+    with pytest.raises(ValueError):
+        load_resource(data)
+
+
+def test_fetch_package_verifies_digest():
+    package_cache.clear()
+    version = PackageVersion.from_package(PACKAGE_PATH, metadata_only=True)
+    version.url = 'recipes/daylight-factor-0.0.1.tgz'
+    digest = version.digest
+
+    version.digest = '0' * 64
+    with pytest.raises(ValueError):
+        version.fetch_package(source_url='https://example.com/test-repo')
+    assert package_cache.entries() == []
+    assert os.listdir(package_cache.folder) == []
+
+    version.digest = digest
+    fetched = version.fetch_package(source_url='https://example.com/test-repo')
+    assert fetched.digest == digest
+    assert os.path.isfile(package_cache.path(digest))
+
+
+def test_fetch_local_package_verifies_digest():
+    version = PackageVersion.from_package(PACKAGE_PATH, metadata_only=True)
+    version.url = 'recipes/daylight-factor-0.0.1.tgz'
+    digest = version.digest
+    source_url = 'file:///' + os.path.abspath('tests/assets/repository/test-repo') \
+        .replace('\\', '/').lstrip('/')
+
+    version.digest = '0' * 64
+    with pytest.raises(ValueError):
+        version.fetch_package(source_url=source_url, use_cache=False)
+
+    version.digest = digest
+    assert version.fetch_package(source_url=source_url, use_cache=False).digest == digest